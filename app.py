@@ -4,19 +4,40 @@ TECO SSP 加班時數計算器 v1.0.0
 GUI 應用程式入口
 """
 
-from src.utils import setup_logging
-from ui import MainWindow
+import logging
+import time
+
+from src.utils import ImportProfiler, setup_logging
+
+_STARTED = time.perf_counter()
 
 
 def main():
     """主程式入口"""
+    # 診斷: SSP_IMPORT_PROFILE=1 時記錄各模組匯入耗時
+    profiler = ImportProfiler.from_environment()
+
     # 設定日誌
     setup_logging()
 
-    # 啟動 GUI
+    # 啟動 GUI (UI 模組在此才匯入,匯入耗時可被記錄)
+    from ui import MainWindow
+
     app = MainWindow()
+    if profiler:
+        app.after_idle(_report_startup, profiler)
     app.mainloop()
 
 
+def _report_startup(profiler: ImportProfiler):
+    """首個畫面出現後輸出啟動耗時與最慢的匯入"""
+    profiler.uninstall()
+    logging.getLogger(__name__).info(
+        "啟動至首個畫面: %.3f 秒\n%s",
+        time.perf_counter() - _STARTED,
+        profiler.format_report(top=20),
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1 @@
+"""離線效能測試套件 (合成 SSP 頁面)"""
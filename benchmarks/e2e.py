@@ -0,0 +1,216 @@
+"""端到端流程效能測試 (本機 SSP 模擬伺服器)
+
+對 MockSSPServer 執行完整流程並記錄每個步驟的耗時與 HTTP 請求統計:
+登入 → 全量同步 → 快取讀取 → 舊版翻頁抓取 → 預覽填寫 → 送出
+
+使用方式:
+    python -m benchmarks.e2e                                  # 無延遲
+    python -m benchmarks.e2e --latency 0.1 --jitter 0.05      # 模擬網路延遲
+    python -m benchmarks.e2e --rows 500 --page-size 50 --records 10
+    python -m benchmarks.e2e --failure-rate 0.1               # 隨機 503
+    python -m benchmarks.e2e --viewstate-bytes 300000         # 大型 ViewState
+"""
+
+import argparse
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.config import Settings
+from src.models import OvertimeSubmissionRecord
+from src.services.auth_service import AuthService
+from src.services.data_service import DataService
+from src.services.data_sync_service import DataSyncService
+from src.services.overtime_report_service import OvertimeReportService
+
+from .mock_ssp_server import MockSSPConfig, MockSSPServer
+
+
+@dataclass
+class FlowStep:
+    """單一步驟結果"""
+
+    name: str
+    seconds: float
+    requests: int  # 伺服器收到的請求數
+    ok: bool
+    detail: str = ""
+
+
+def _submission_records(count: int) -> List[OvertimeSubmissionRecord]:
+    return [
+        OvertimeSubmissionRecord(
+            date=f"2026/01/{index % 28 + 1:02d}",
+            description="專案開發",
+            overtime_hours=1.5,
+            is_overtime=index % 2 == 0,
+        )
+        for index in range(count)
+    ]
+
+
+def run_flow(
+    config: Optional[MockSSPConfig] = None, submission_records: int = 5
+) -> Dict[str, Any]:
+    """
+    執行完整流程
+
+    Args:
+        config: 模擬伺服器設定
+        submission_records: 預覽 / 送出的記錄數
+
+    Returns:
+        Dict: {"steps": [FlowStep], "http": RequestMetrics.summary()}
+    """
+    config = config or MockSSPConfig()
+    steps: List[FlowStep] = []
+
+    with MockSSPServer(config) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url, MAX_PAGES=1000)
+        auth = AuthService(settings)
+        records = _submission_records(submission_records)
+        report_service = OvertimeReportService(settings)
+        sync_service = DataSyncService(auth.get_session(), settings)
+
+        def measure(name: str, func: Callable[[], Any], check: Callable[[Any], str]):
+            before = server.request_count()
+            started = time.perf_counter()
+            try:
+                result = func()
+                detail = check(result)
+                ok = True
+            except Exception as e:  # 流程繼續,記錄失敗原因
+                detail = str(e)
+                ok = False
+            steps.append(
+                FlowStep(
+                    name=name,
+                    seconds=time.perf_counter() - started,
+                    requests=server.request_count() - before,
+                    ok=ok,
+                    detail=detail,
+                )
+            )
+
+        def expect(condition: bool, detail: str) -> str:
+            if not condition:
+                raise RuntimeError(detail)
+            return detail
+
+        measure(
+            "login",
+            lambda: auth.login(config.username, config.password),
+            lambda ok: expect(ok, "登入成功" if ok else "登入失敗"),
+        )
+        measure(
+            "sync_all",
+            lambda: sync_service.sync_all(force_refresh=True),
+            lambda s: f"{s.record_count} 筆記錄",
+        )
+        measure(
+            "sync_all (快取)",
+            sync_service.sync_all,
+            lambda s: f"{s.record_count} 筆記錄",
+        )
+        measure(
+            "legacy_paging",
+            lambda: DataService(auth.get_session(), settings).get_attendance_data(),
+            lambda rows: expect(
+                len(rows) == config.attendance_rows, f"{len(rows)} 筆記錄"
+            ),
+        )
+        preview: Dict[str, Any] = {}
+
+        def run_preview():
+            preview.update(report_service.preview_form(auth.get_session(), records))
+            return preview
+
+        measure(
+            "preview_form",
+            run_preview,
+            lambda result: expect(
+                result["success"], result.get("error") or f"{len(records)} 筆"
+            ),
+        )
+        measure(
+            "submit_form",
+            lambda: report_service.submit_form(
+                auth.get_session(), records, prepared=preview.get("prepared")
+            ),
+            lambda result: expect(
+                result["success"], result.get("error") or f"{len(records)} 筆"
+            ),
+        )
+
+        return {"steps": steps, "http": auth.metrics.summary()}
+
+
+def format_flow(result: Dict[str, Any]) -> str:
+    """格式化為表格文字"""
+    lines = [f"{'步驟':<20}{'時間 (秒)':>12}{'請求數':>8}  結果"]
+    for step in result["steps"]:
+        status = "✓" if step.ok else "✗"
+        lines.append(
+            f"{step.name:<22}{step.seconds:>12.3f}{step.requests:>10}  {status} {step.detail}"
+        )
+
+    lines.append("")
+    lines.append(f"{'HTTP 請求':<32}{'次數':>6}{'平均 TTFB':>12}{'新連線':>8}{'重試':>6}")
+    for key, stats in sorted(result["http"].items()):
+        lines.append(
+            f"{key:<34}{stats['count']:>6}{stats['avg_ttfb_seconds']:>14.3f}"
+            f"{stats['new_connections']:>9}{stats['retries']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """命令列進入點 (任一步驟失敗時返回 1)"""
+    parser = argparse.ArgumentParser(description="SSP 加班助手端到端流程效能測試")
+    parser.add_argument("--latency", type=float, default=0.0, help="每個請求的延遲 (秒)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="額外隨機延遲上限 (秒)")
+    parser.add_argument("--rows", type=int, default=60, help="出勤 / 異常列數")
+    parser.add_argument("--personal-rows", type=int, default=40)
+    parser.add_argument("--page-size", type=int, default=20, help="gvWeb012 每頁列數")
+    parser.add_argument("--records", type=int, default=5, help="預覽 / 送出的記錄數")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--viewstate-bytes", type=int, default=2048, help="__VIEWSTATE 大小"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="以 JSON 輸出結果")
+    args = parser.parse_args(argv)
+
+    config = MockSSPConfig(
+        attendance_rows=args.rows,
+        personal_rows=args.personal_rows,
+        anomaly_page_size=args.page_size,
+        latency_seconds=args.latency,
+        latency_jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        viewstate_bytes=args.viewstate_bytes,
+        seed=args.seed,
+    )
+
+    # 受測程式的 info 日誌不影響結果,但會淹沒輸出
+    logging.disable(logging.INFO)
+    result = run_flow(config, args.records)
+
+    if args.json:
+        print(
+            json.dumps(
+                {"steps": [asdict(s) for s in result["steps"]], "http": result["http"]},
+                ensure_ascii=False,
+                indent=2,
+            )
+        )
+    else:
+        print(format_flow(result))
+
+    return 0 if all(step.ok for step in result["steps"]) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,556 @@
+"""本機 SSP 模擬伺服器
+
+在本機模擬 ssp.teco.com.tw 的四個頁面,讓 登入 → 同步 → 翻頁 → 預覽 → 送出
+整個流程可以離線、可重複地量測:
+
+- /index.aspx: 登入 (帳號密碼錯誤時回到登入頁,成功後 302 轉向 FW99001Z.aspx)
+- /FW99001Z.aspx: 出勤頁面,gvWeb012 可設定每頁列數並以 Page$N PostBack 翻頁
+- /FW21003Z.aspx: 個人記錄,帶 ddlPage=9999 時一次回傳全部記錄
+- /FW21001Z.aspx: 加班補報表單,lbgvAddRowi PostBack 增加列,btnCommit 送出
+
+每次回應都會核發新的 __VIEWSTATE / __EVENTVALIDATION (綁定在 session 上),
+PostBack 時驗證兩者是否相符,行為與 ASP.NET WebForms 相同。
+另可設定回應延遲、gzip 壓縮與錯誤注入 (隨機或指定路徑的 5xx)。
+
+使用方式:
+    ```python
+    with MockSSPServer(MockSSPConfig(latency_seconds=0.05)) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url)
+        auth = AuthService(settings)
+        auth.login(server.config.username, server.config.password)
+    ```
+
+    python -m benchmarks.mock_ssp_server --port 8765 --latency 0.2
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import logging
+import random
+import re
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .synthetic_pages import (
+    generate_attendance_data,
+    generate_personal_record_rows,
+    pager_targets,
+    render_attendance_page,
+    render_hidden_fields,
+    render_personal_record_page,
+)
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "ASP.NET_SessionId"
+
+_REPORT_ROW_FIELD = re.compile(
+    r"^ctl00\$ContentPlaceHolder1\$gvFlow211i\$ctl(\d+)\$(txtOT_Datei|txtOT_Describei"
+    r"|txtOT_Minutei|txtChange_Minutei)$"
+)
+_PAGE_ARGUMENT = re.compile(r"^Page\$(\d+)$")
+
+
+@dataclass
+class MockSSPConfig:
+    """模擬伺服器設定"""
+
+    username: str = "tester"
+    password: str = "secret"
+    attendance_rows: int = 60  # gvNotes005 / gvWeb012 列數
+    personal_rows: int = 40  # gvFlow211 列數
+    anomaly_page_size: int = 0  # gvWeb012 每頁列數 (0 表示不分頁)
+    personal_page_size: int = 0  # FW21003Z 未帶 ddlPage=9999 時的每頁列數
+    latency_seconds: float = 0.0  # 每個請求的固定延遲
+    latency_jitter: float = 0.0  # 額外隨機延遲上限
+    failure_rate: float = 0.0  # 隨機回應 failure_status 的機率
+    failure_status: int = 503
+    viewstate_bytes: int = 2048  # __VIEWSTATE 大小 (模擬真實頁面的負擔)
+    gzip: bool = True  # 用戶端接受時以 gzip 壓縮回應
+    seed: int = 0
+
+
+@dataclass
+class _Session:
+    authenticated: bool = False
+    viewstates: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # token → 頁面狀態
+
+
+class MockSSPServer:
+    """
+    本機 SSP 模擬伺服器 (ThreadingHTTPServer,於背景執行緒執行)
+
+    Attributes:
+        config: 伺服器設定
+        submissions: 已送出的加班補報表單資料 (依送出順序)
+        request_log: 已處理的請求 [(method, path, status)]
+    """
+
+    def __init__(
+        self, config: Optional[MockSSPConfig] = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        self.config = config or MockSSPConfig()
+        self.submissions: List[Dict[str, str]] = []
+        self.request_log: List[Tuple[str, str, int]] = []
+
+        self._attendance = generate_attendance_data(
+            self.config.attendance_rows, self.config.seed
+        )
+        self._personal = generate_personal_record_rows(
+            self.config.personal_rows, self.config.seed
+        )
+        self._sessions: Dict[str, _Session] = {}
+        self._forced_failures: Counter = Counter()
+        self._forced_status: Dict[str, int] = {}
+        self._rng = random.Random(self.config.seed)
+        self._secret = secrets.token_bytes(16)
+        self._lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), _MockSSPHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    # === 生命週期 ===
+
+    @property
+    def base_url(self) -> str:
+        """伺服器網址 (作為 Settings.SSP_BASE_URL)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockSSPServer":
+        """於背景執行緒啟動"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="mock-ssp", daemon=True
+        )
+        self._thread.start()
+        logger.debug("模擬 SSP 伺服器已啟動: %s", self.base_url)
+        return self
+
+    def serve_forever(self):
+        """於目前執行緒執行 (命令列模式,Ctrl+C 結束)"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """停止伺服器"""
+        if self._thread:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockSSPServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # === 測試輔助 ===
+
+    def fail_next(self, path: str, count: int = 1, status: Optional[int] = None):
+        """
+        指定路徑的接下來 count 個請求回應錯誤
+
+        Args:
+            path: 頁面路徑 (例如 /FW99001Z.aspx)
+            count: 錯誤次數
+            status: HTTP 狀態碼 (預設 config.failure_status)
+        """
+        with self._lock:
+            self._forced_failures[path] += count
+            self._forced_status[path] = status or self.config.failure_status
+
+    def expire_viewstates(self):
+        """使所有已核發的 ViewState 失效 (模擬應用程式集區回收後金鑰變更)"""
+        with self._lock:
+            self._secret = secrets.token_bytes(16)
+            for session in self._sessions.values():
+                session.viewstates.clear()
+
+    def request_count(self, path: Optional[str] = None, method: Optional[str] = None) -> int:
+        """已處理的請求數 (可依路徑與方法篩選)"""
+        with self._lock:
+            return sum(
+                1
+                for logged_method, logged_path, _ in self.request_log
+                if (path is None or logged_path == path)
+                and (method is None or logged_method == method)
+            )
+
+    # === 請求處理 (由 _MockSSPHandler 呼叫) ===
+
+    def handle(
+        self, method: str, raw_path: str, cookie_header: str, form: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], str]:
+        """
+        處理單一請求
+
+        Returns:
+            Tuple: (狀態碼, 回應標頭, 回應內容)
+        """
+        self._delay()
+        url = urlsplit(raw_path)
+        path = url.path
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        session, headers = self._get_session(cookie_header)
+
+        failure = self._take_failure(path)
+        if failure:
+            return self._log(method, path, failure, headers, "<html>Service Unavailable</html>")
+
+        if path in ("/", "/index.aspx"):
+            status, extra, body = self._handle_login(method, session, form)
+        elif not session.authenticated:
+            status, extra, body = 302, {"Location": "/index.aspx"}, ""
+        elif path == "/FW99001Z.aspx":
+            status, extra, body = self._handle_attendance(method, session, form)
+        elif path == "/FW21003Z.aspx":
+            status, extra, body = self._handle_personal(method, session, form, query)
+        elif path == "/FW21001Z.aspx":
+            status, extra, body = self._handle_report(method, session, form)
+        else:
+            status, extra, body = 404, {}, "<html>404 Not Found</html>"
+
+        headers.update(extra)
+        return self._log(method, path, status, headers, body)
+
+    def _handle_login(self, method, session, form):
+        message = ""
+        if method == "POST":
+            if self._validate_postback(session, form, "login") is None:
+                return self._invalid_viewstate()
+            if (
+                form.get("ctl00$lblAccount") == self.config.username
+                and form.get("ctl00$lblPassWord") == self.config.password
+            ):
+                session.authenticated = True
+                return 302, {"Location": "/FW99001Z.aspx"}, ""
+            message = '<span id="lblMessage">帳號或密碼錯誤</span>'
+
+        hidden = self._issue_viewstate(session, {"page": "login"})
+        body = (
+            '<!DOCTYPE html>\n<html>\n  <body>\n  <form method="post" id="form1">\n'
+            f"{render_hidden_fields(hidden)}"
+            '    <input name="ctl00$lblAccount" type="text" />\n'
+            '    <input name="ctl00$lblPassWord" type="password" />\n'
+            '    <input type="submit" name="ctl00$Submit" value="送出" />\n'
+            f"    {message}\n  </form>\n  </body>\n</html>\n"
+        )
+        return 200, {}, body
+
+    def _handle_attendance(self, method, session, form):
+        page = 1
+        if method == "POST":
+            state = self._validate_postback(session, form, "attendance")
+            if state is None:
+                return self._invalid_viewstate()
+            page = self._postback_page(
+                form,
+                "ctl00$ContentPlaceHolder1$gvWeb012",
+                state["page_no"],
+                len(self._attendance["anomalies"]),
+                self.config.anomaly_page_size,
+            )
+            if page is None:
+                return self._invalid_viewstate()
+
+        hidden = self._issue_viewstate(session, {"page": "attendance", "page_no": page})
+        body = render_attendance_page(
+            self._attendance, page, self.config.anomaly_page_size, hidden
+        )
+        return 200, {}, self._with_logout(body)
+
+    def _handle_personal(self, method, session, form, query):
+        page = 1
+        page_size = self.config.personal_page_size
+        if query.get("ctl00$ContentPlaceHolder1$ddlPage") == "9999":
+            page_size = 0
+        if method == "POST":
+            state = self._validate_postback(session, form, "personal")
+            if state is None:
+                return self._invalid_viewstate()
+            page_size = state["page_size"]
+            with self._lock:
+                total = len(self._personal)
+            page = self._postback_page(
+                form, "ctl00$ContentPlaceHolder1$gvFlow211", state["page_no"], total, page_size
+            )
+            if page is None:
+                return self._invalid_viewstate()
+
+        hidden = self._issue_viewstate(
+            session, {"page": "personal", "page_no": page, "page_size": page_size}
+        )
+        with self._lock:
+            records = list(self._personal)
+        body = render_personal_record_page(records, page, page_size, hidden)
+        return 200, {}, self._with_logout(body)
+
+    def _handle_report(self, method, session, form):
+        rows = 1
+        message = ""
+        if method == "POST":
+            state = self._validate_postback(session, form, "report")
+            if state is None:
+                return self._invalid_viewstate()
+            rows = state["rows"]
+            if form.get("__EVENTTARGET") == "ctl00$ContentPlaceHolder1$lbgvAddRowi":
+                rows += 1
+            elif "ctl00$ContentPlaceHolder1$btnCommit" in form:
+                message = self._commit_report(form, rows)
+                rows = 1
+
+        hidden = self._issue_viewstate(session, {"page": "report", "rows": rows})
+        return 200, {}, self._with_logout(self._render_report_form(hidden, rows, message))
+
+    def _commit_report(self, form: Dict[str, str], rows: int) -> str:
+        """驗證並記錄送出的表單,返回結果訊息"""
+        entries: Dict[int, Dict[str, str]] = {}
+        for name, value in form.items():
+            match = _REPORT_ROW_FIELD.match(name)
+            if match:
+                entries.setdefault(int(match.group(1)) - 3, {})[match.group(2)] = value
+
+        if not entries or any(index < 0 or index >= rows for index in entries):
+            return '<span id="lblMessage">送出失敗: 表單列數不符</span>'
+
+        new_records = []
+        for index in sorted(entries):
+            fields = entries[index]
+            if not fields.get("txtOT_Datei"):
+                return f'<span id="lblMessage">送出失敗: 第 {index + 1} 列缺少日期</span>'
+            change_hours = float(fields.get("txtChange_Minutei") or 0)
+            overtime_hours = float(fields.get("txtOT_Minutei") or 0)
+            new_records.append(
+                {
+                    "date": fields["txtOT_Datei"],
+                    "description": fields.get("txtOT_Describei", ""),
+                    "minutes": round((change_hours or overtime_hours) * 60),
+                    "is_change": change_hours > 0,
+                    "monthly_total": 0.0,
+                    "quarterly_total": 0.0,
+                    "status": "簽核中",
+                }
+            )
+
+        with self._lock:
+            self.submissions.append(dict(form))
+            self._personal[:0] = new_records
+        return f'<span id="lblMessage">申請成功,共 {len(new_records)} 筆</span>'
+
+    @staticmethod
+    def _render_report_form(hidden: Dict[str, str], rows: int, message: str) -> str:
+        prefix = "ctl00$ContentPlaceHolder1$gvFlow211i"
+        parts = [
+            '<!DOCTYPE html>\n<html>\n  <body>\n  <form method="post" id="form1">\n',
+            render_hidden_fields(hidden),
+            '    <table id="ContentPlaceHolder1_gvFlow211i">\n'
+            "      <tr><th>加班日期</th><th>加班內容</th><th>加班時數</th><th>調休時數</th></tr>\n",
+        ]
+        for index in range(rows):
+            ctl = f"ctl{index + 3:02d}"
+            parts.append(
+                "      <tr>"
+                f'<td><input name="{prefix}${ctl}$txtOT_Datei" type="text" /></td>'
+                f'<td><input name="{prefix}${ctl}$txtOT_Describei" type="text" /></td>'
+                f'<td><input name="{prefix}${ctl}$txtOT_Minutei" type="text" /></td>'
+                f'<td><input name="{prefix}${ctl}$txtChange_Minutei" type="text" /></td>'
+                "</tr>\n"
+            )
+        parts.append(
+            "    </table>\n"
+            '    <a id="ContentPlaceHolder1_lbgvAddRowi" href="javascript:__doPostBack('
+            "'ctl00$ContentPlaceHolder1$lbgvAddRowi','')\">增加列</a>\n"
+            '    <input type="submit" name="ctl00$ContentPlaceHolder1$btnCommit" value="送出" />\n'
+            f"    {message}\n  </form>\n  </body>\n</html>\n"
+        )
+        return "".join(parts)
+
+    # === ViewState ===
+
+    def _issue_viewstate(self, session: _Session, state: Dict[str, Any]) -> Dict[str, str]:
+        """核發新的隱藏欄位,並記住對應的頁面狀態"""
+        token = secrets.token_hex(8)
+        padding = max(self.config.viewstate_bytes - len(token) - 1, 0)
+        viewstate = base64.b64encode(
+            f"{token}:".encode() + self._rng.randbytes(padding)
+        ).decode()
+        with self._lock:
+            session.viewstates[token] = state
+        return {
+            "__VIEWSTATE": viewstate,
+            "__VIEWSTATEGENERATOR": hashlib.md5(state["page"].encode()).hexdigest()[:8].upper(),
+            "__EVENTVALIDATION": self._event_validation(viewstate),
+        }
+
+    def _validate_postback(
+        self, session: _Session, form: Dict[str, str], page: str
+    ) -> Optional[Dict[str, Any]]:
+        """驗證 PostBack 的 ViewState / EventValidation,返回頁面狀態 (無效時返回 None)"""
+        viewstate = form.get("__VIEWSTATE", "")
+        if form.get("__EVENTVALIDATION") != self._event_validation(viewstate):
+            return None
+        try:
+            token = base64.b64decode(viewstate).split(b":", 1)[0].decode()
+        except (ValueError, UnicodeDecodeError):
+            return None
+        with self._lock:
+            state = session.viewstates.get(token)
+        if not state or state["page"] != page:
+            return None
+        return state
+
+    def _event_validation(self, viewstate: str) -> str:
+        digest = hashlib.sha256(self._secret + viewstate.encode()).digest()
+        return base64.b64encode(digest).decode()
+
+    @staticmethod
+    def _invalid_viewstate() -> Tuple[int, Dict[str, str], str]:
+        return 500, {}, "<html><body>系統錯誤: 無效的檢視狀態 (ViewState)</body></html>"
+
+    # === 其他 ===
+
+    def _get_session(self, cookie_header: str) -> Tuple[_Session, Dict[str, str]]:
+        """取得 session (沒有或未知的 cookie 會建立新 session 並回傳 Set-Cookie)"""
+        cookie = SimpleCookie(cookie_header or "")
+        session_id = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else ""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session:
+                return session, {}
+            session_id = secrets.token_hex(12)
+            session = self._sessions[session_id] = _Session()
+        return session, {"Set-Cookie": f"{SESSION_COOKIE}={session_id}; Path=/"}
+
+    def _take_failure(self, path: str) -> int:
+        with self._lock:
+            if self._forced_failures[path] > 0:
+                self._forced_failures[path] -= 1
+                return self._forced_status[path]
+            if self.config.failure_rate and self._rng.random() < self.config.failure_rate:
+                return self.config.failure_status
+        return 0
+
+    def _delay(self):
+        delay = self.config.latency_seconds
+        if self.config.latency_jitter:
+            with self._lock:
+                delay += self._rng.uniform(0, self.config.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    @staticmethod
+    def _postback_page(
+        form: Dict[str, str], event_target: str, current: int, total: int, page_size: int
+    ) -> Optional[int]:
+        """
+        翻頁 PostBack 的目標頁碼
+
+        與 EventValidation 相同,只接受目前頁面分頁列上出現的頁碼;
+        非翻頁的 PostBack 停留在目前頁,不合法的頁碼返回 None。
+        """
+        if form.get("__EVENTTARGET") != event_target:
+            return current
+        match = _PAGE_ARGUMENT.match(form.get("__EVENTARGUMENT", ""))
+        if not match or page_size <= 0:
+            return None
+        total_pages = max((total + page_size - 1) // page_size, 1)
+        page = int(match.group(1))
+        return page if page in pager_targets(current, total_pages) else None
+
+    @staticmethod
+    def _with_logout(body: str) -> str:
+        """已登入頁面都帶有登出連結 (AuthService 以此判斷登入成功)"""
+        return body.replace(
+            "<body>\n", '<body>\n  <a id="lbtnLogout" href="index.aspx">登出</a>\n', 1
+        )
+
+    def _log(self, method, path, status, headers, body):
+        with self._lock:
+            self.request_log.append((method, path, status))
+        return status, headers, body
+
+
+class _MockSSPHandler(BaseHTTPRequestHandler):
+    """HTTP 層: 解析請求、壓縮並寫回回應 (實際邏輯在 MockSSPServer.handle)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length).decode("utf-8") if length else ""
+        form = {key: values[0] for key, values in parse_qs(raw_body, keep_blank_values=True).items()}
+
+        status, headers, body = self.server.mock.handle(
+            self.command, self.path, self.headers.get("Cookie", ""), form
+        )
+
+        payload = body.encode("utf-8")
+        if (
+            payload
+            and self.server.mock.config.gzip
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+        ):
+            payload = gzip.compress(payload)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+def main(argv=None) -> int:
+    """命令列進入點: 前景執行模擬伺服器"""
+    parser = argparse.ArgumentParser(description="本機 SSP 模擬伺服器")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="每個請求的延遲 (秒)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="額外隨機延遲上限 (秒)")
+    parser.add_argument("--rows", type=int, default=60, help="出勤 / 異常列數")
+    parser.add_argument("--personal-rows", type=int, default=40)
+    parser.add_argument("--page-size", type=int, default=0, help="gvWeb012 每頁列數")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    config = MockSSPConfig(
+        attendance_rows=args.rows,
+        personal_rows=args.personal_rows,
+        anomaly_page_size=args.page_size,
+        latency_seconds=args.latency,
+        latency_jitter=args.jitter,
+        failure_rate=args.failure_rate,
+    )
+    server = MockSSPServer(config, args.host, args.port)
+    print(f"模擬 SSP 伺服器: {server.base_url} (帳號 {config.username} / 密碼 {config.password})")
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,432 @@
+"""離線效能測試套件
+
+以合成頁面量測解析、計算與資料整合的吞吐量 (列/秒) 與峰值記憶體,
+並與 benchmarks/baselines.json 比較,退化超過容許範圍時以非零代碼結束。
+
+使用方式:
+    python -m benchmarks                           # 預設列數 10 / 1000 / 10000
+    python -m benchmarks --sizes 10 1000 50000     # 自訂列數
+    python -m benchmarks --only calculator merge   # 只執行部分項目
+    python -m benchmarks --update-baseline         # 更新基準值
+"""
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from src.config import Settings
+from src.core import OvertimeCalculator
+from src.models import OvertimeReport
+from src.parsers import (
+    AttendanceParser,
+    HtmlDocument,
+    PersonalRecordParser,
+    StreamAttendanceParser,
+    StreamPersonalRecordParser,
+)
+from src.services.data_service import DataService
+from src.services.data_sync_service import DataSyncService
+from src.services.export_service import ExportService
+from src.services.status_tracker import OvertimeStatusTracker
+
+from .synthetic_pages import (
+    generate_attendance_page,
+    generate_attendance_records,
+    generate_merge_inputs,
+    generate_personal_record_page,
+    generate_personal_record_rows,
+    render_personal_record_page,
+)
+
+DEFAULT_SIZES = (10, 1000, 10000)
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines.json"
+
+# 容許範圍: 吞吐量低於基準 50% 或峰值記憶體高於基準 50% 視為退化
+DEFAULT_THROUGHPUT_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.5
+
+# 小資料量執行時間過短,至少重複至累計此秒數以降低計時雜訊
+MIN_TOTAL_SECONDS = 0.2
+
+
+@dataclass
+class BenchmarkResult:
+    """單一效能測試結果"""
+
+    name: str
+    rows: int
+    seconds: float  # 最佳一次的執行時間
+    rows_per_second: float
+    peak_memory_bytes: int
+
+    @property
+    def key(self) -> str:
+        """基準值鍵 (名稱@列數)"""
+        return f"{self.name}@{self.rows}"
+
+
+@dataclass
+class Benchmark:
+    """
+    效能測試項目
+
+    setup 產生輸入資料 (不計時),run 為受測函式,
+    teardown (選用) 於量測結束後釋放 setup 建立的資源 (例如暫存資料夾)。
+    """
+
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    teardown: Optional[Callable[[Any], None]] = None
+
+
+def _attendance_soup(html: str):
+    document = HtmlDocument(html)
+    return (
+        AttendanceParser.parse_punch_records(document),
+        AttendanceParser.parse_leave_records(document),
+        AttendanceParser.parse_quota(document),
+        AttendanceParser.parse_anomaly_records(document),
+    )
+
+
+def _attendance_stream(html: str):
+    document = HtmlDocument(html)
+    return (
+        StreamAttendanceParser.parse_punch_records(document),
+        StreamAttendanceParser.parse_leave_records(document),
+        StreamAttendanceParser.parse_quota(document),
+        StreamAttendanceParser.parse_anomaly_records(document),
+    )
+
+
+def _data_service_setup(rows: int) -> Tuple[DataService, BeautifulSoup]:
+    soup = BeautifulSoup(generate_attendance_page(rows), "html.parser")
+    return DataService(None, Settings()), soup
+
+
+def _merge_setup(rows: int) -> Tuple[DataSyncService, Tuple[List[Dict], List[Dict]]]:
+    return DataSyncService(None, Settings()), generate_merge_inputs(rows)
+
+
+def _status_poll_setup(rows: int) -> Tuple[OvertimeStatusTracker, List, str]:
+    """上次的頁面 (最新 3 筆簽核中) 與「新增 1 筆、1 筆簽核完成」後的頁面"""
+    records = generate_personal_record_rows(rows)
+    for index, record in enumerate(records):
+        record["status"] = "簽核中" if index < 3 else "簽核完成"
+    previous = render_personal_record_page(records)
+
+    tracker = OvertimeStatusTracker()
+    tracker.seed(previous, PersonalRecordParser.parse_records(previous))
+
+    updated = [dict(records[0], date="2099/12/31")] + records
+    updated[1] = dict(records[0], status="簽核完成")
+    return tracker, list(tracker._rows), render_personal_record_page(updated)
+
+
+def _status_poll(payload: Tuple[OvertimeStatusTracker, List, str]):
+    tracker, rows, html = payload
+    tracker._set_rows(list(rows))  # 每次都從相同的上次結果開始
+    return tracker.poll(html)
+
+
+ExportPayload = Tuple[ExportService, OvertimeReport, str, tempfile.TemporaryDirectory]
+
+
+def _excel_export_setup(rows: int) -> ExportPayload:
+    report = OvertimeCalculator(Settings()).calculate_overtime(
+        generate_attendance_records(rows)
+    )
+    directory = tempfile.TemporaryDirectory(prefix="bench-export-")
+    path = Path(directory.name) / "report.xlsx"
+    return ExportService(Settings()), report, str(path), directory
+
+
+def _export_teardown(payload: ExportPayload):
+    payload[3].cleanup()
+
+
+def _record_export(fmt: str) -> Callable[[ExportPayload], Any]:
+    def run(payload):
+        service, report, path, _ = payload
+        return service.export_records(report.records, fmt, path)
+
+    return run
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    benchmark.name: benchmark
+    for benchmark in (
+        Benchmark("attendance_parser", generate_attendance_page, _attendance_soup),
+        Benchmark(
+            "attendance_parser_stream", generate_attendance_page, _attendance_stream
+        ),
+        Benchmark(
+            "personal_record_parser",
+            generate_personal_record_page,
+            PersonalRecordParser.parse_records,
+        ),
+        Benchmark(
+            "personal_record_parser_stream",
+            generate_personal_record_page,
+            StreamPersonalRecordParser.parse_records,
+        ),
+        Benchmark("status_poll", _status_poll_setup, _status_poll),
+        Benchmark(
+            "excel_export",
+            _excel_export_setup,
+            lambda payload: payload[0].export_to_excel(payload[1], payload[2]),
+            _export_teardown,
+        ),
+        Benchmark(
+            "csv_export", _excel_export_setup, _record_export("csv"), _export_teardown
+        ),
+        Benchmark(
+            "jsonl_export",
+            _excel_export_setup,
+            _record_export("jsonl"),
+            _export_teardown,
+        ),
+        Benchmark(
+            "data_service_parse",
+            _data_service_setup,
+            lambda payload: payload[0]._parse_attendance_table(payload[1]),
+        ),
+        Benchmark(
+            "calculator",
+            generate_attendance_records,
+            OvertimeCalculator(Settings()).calculate_overtime,
+        ),
+        Benchmark(
+            "merge",
+            _merge_setup,
+            lambda payload: payload[0]._merge_overtime_data(*payload[1]),
+        ),
+    )
+}
+
+
+def run_benchmark(benchmark: Benchmark, rows: int, repeat: int = 3) -> BenchmarkResult:
+    """
+    執行單一效能測試
+
+    執行時間取多次中最快的一次 (至少 repeat 次,且累計至 MIN_TOTAL_SECONDS);
+    峰值記憶體另以 tracemalloc 量測一次
+    (tracemalloc 會拖慢執行,因此不與計時同時進行)。
+
+    Args:
+        benchmark: 測試項目
+        rows: 資料列數
+        repeat: 計時重複次數
+
+    Returns:
+        BenchmarkResult: 測試結果
+    """
+    payload = benchmark.setup(rows)
+    try:
+        best, peak = _measure(benchmark, payload, repeat)
+    finally:
+        if benchmark.teardown:
+            benchmark.teardown(payload)
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        rows=rows,
+        seconds=best,
+        rows_per_second=rows / best if best > 0 else float("inf"),
+        peak_memory_bytes=peak,
+    )
+
+
+def _measure(benchmark: Benchmark, payload: Any, repeat: int) -> Tuple[float, int]:
+    """量測最快執行時間 (秒) 與峰值記憶體 (bytes)"""
+    best = float("inf")
+    total = 0.0
+    iterations = 0
+    # 與 timeit 相同,計時期間關閉 GC 以免回收時機影響結果
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while iterations < max(repeat, 1) or total < MIN_TOTAL_SECONDS:
+            started = time.perf_counter()
+            benchmark.run(payload)
+            elapsed = time.perf_counter() - started
+            best = min(best, elapsed)
+            total += elapsed
+            iterations += 1
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        benchmark.run(payload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    names: Optional[Sequence[str]] = None,
+    repeat: int = 3,
+) -> List[BenchmarkResult]:
+    """
+    執行效能測試套件
+
+    Args:
+        sizes: 資料列數列表
+        names: 測試項目名稱 (None 表示全部)
+        repeat: 計時重複次數
+
+    Returns:
+        List[BenchmarkResult]: 測試結果
+    """
+    selected = [BENCHMARKS[name] for name in (names or BENCHMARKS)]
+
+    # 受測程式的 info/debug 日誌會大幅影響計時,執行期間暫時關閉
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        return [
+            run_benchmark(benchmark, rows, repeat)
+            for benchmark in selected
+            for rows in sizes
+        ]
+    finally:
+        logging.disable(previous_disable)
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> Dict[str, Dict[str, float]]:
+    """讀取基準值 (檔案不存在時返回空字典)"""
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def save_baseline(
+    results: Sequence[BenchmarkResult], path: Path = DEFAULT_BASELINE_PATH
+) -> Dict[str, Dict[str, float]]:
+    """
+    更新基準值 (保留未重新量測的項目)
+
+    Returns:
+        Dict: 更新後的基準值
+    """
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.key] = {
+            "rows_per_second": round(result.rows_per_second, 1),
+            "peak_memory_bytes": result.peak_memory_bytes,
+        }
+
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(dict(sorted(baseline.items())), fp, indent=2)
+        fp.write("\n")
+    return baseline
+
+
+def compare_with_baseline(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, Dict[str, float]],
+    throughput_tolerance: float = DEFAULT_THROUGHPUT_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+) -> List[str]:
+    """
+    與基準值比較
+
+    Args:
+        results: 測試結果
+        baseline: 基準值
+        throughput_tolerance: 吞吐量可低於基準的比例
+        memory_tolerance: 峰值記憶體可高於基準的比例
+
+    Returns:
+        List[str]: 退化項目說明 (空列表表示無退化;無基準值的項目略過)
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.key)
+        if not expected:
+            continue
+
+        min_throughput = expected["rows_per_second"] * (1 - throughput_tolerance)
+        if result.rows_per_second < min_throughput:
+            regressions.append(
+                f"{result.key}: 吞吐量 {result.rows_per_second:,.0f} 列/秒 "
+                f"低於基準 {expected['rows_per_second']:,.0f} 列/秒"
+            )
+
+        max_memory = expected["peak_memory_bytes"] * (1 + memory_tolerance)
+        if result.peak_memory_bytes > max_memory:
+            regressions.append(
+                f"{result.key}: 峰值記憶體 {result.peak_memory_bytes / 1024:,.0f} KiB "
+                f"高於基準 {expected['peak_memory_bytes'] / 1024:,.0f} KiB"
+            )
+    return regressions
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """格式化為表格文字"""
+    lines = [
+        f"{'項目':<32}{'列數':>8}{'時間 (秒)':>12}{'列/秒':>14}{'峰值記憶體 (KiB)':>18}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name:<34}{result.rows:>8}{result.seconds:>14.4f}"
+            f"{result.rows_per_second:>16,.0f}{result.peak_memory_bytes / 1024:>20,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """命令列進入點 (有退化時返回 1)"""
+    parser = argparse.ArgumentParser(description="SSP 加班助手離線效能測試")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_THROUGHPUT_TOLERANCE
+    )
+    parser.add_argument("--json", action="store_true", help="以 JSON 輸出結果")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.only, args.repeat)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print(format_results(results))
+
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\n已更新基準值: {args.baseline}")
+        return 0
+
+    regressions = compare_with_baseline(
+        results, load_baseline(args.baseline), throughput_tolerance=args.tolerance
+    )
+    if regressions:
+        print("\n效能退化:", file=sys.stderr)
+        for message in regressions:
+            print(f"  - {message}", file=sys.stderr)
+        return 1
+
+    print("\n✅ 無效能退化")
+    return 0
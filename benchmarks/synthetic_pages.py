@@ -0,0 +1,424 @@
+"""合成 SSP 頁面產生器
+
+依 tests/fixtures/*.html 的結構產生任意列數的 FW99001Z / FW21003Z 頁面,
+供離線效能測試使用 (不需登入 SSP 系統)。
+
+- FW99001Z.aspx: gvNotes005 (打卡) / gvNotes011 (假別) / dvNotes019 (額度)
+  / gvWeb012 (異常,位於 tabs-2)
+- FW21003Z.aspx: gvFlow211 (個人記錄,含分頁列)
+
+日期由 2025/12/31 往前遞減,每列日期唯一;同一 seed 產生的內容完全相同。
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_LAST_DATE = date(2025, 12, 31)
+_ROW_CLASSES = ("RowStyle", "AlternatingRowStyle_update")
+_LEAVE_TYPES = ("特休", "病假", "事假", "婚假", "公假")
+_DESCRIPTIONS = ("專案開發", "專案維護", "客戶支援", "售前調查", "系統測試")
+
+
+def _date_str(offset: int) -> str:
+    """第 offset 列的日期 (YYYY/MM/DD,由新到舊)"""
+    return (_LAST_DATE - timedelta(days=offset)).strftime("%Y/%m/%d")
+
+
+def _time_str(seconds: int) -> str:
+    """秒數轉 HH:MM:SS"""
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def _punch_range(rng: random.Random) -> Tuple[str, str]:
+    """隨機上下班時間 (上班 07:30~09:30,下班 17:00~22:00)"""
+    start = rng.randint(7 * 3600 + 1800, 9 * 3600 + 1800)
+    end = rng.randint(17 * 3600, 22 * 3600)
+    return _time_str(start), _time_str(end)
+
+
+def render_hidden_fields(fields: Dict[str, str]) -> str:
+    """ASP.NET 隱藏欄位 (__VIEWSTATE / __EVENTVALIDATION ...)"""
+    inputs = "".join(
+        f'      <input type="hidden" name="{name}" id="{name}" value="{value}" />\n'
+        for name, value in fields.items()
+    )
+    return f'    <div class="aspNetHidden">\n{inputs}    </div>\n'
+
+
+def _page_start(hidden_fields: Optional[Dict[str, str]]) -> List[str]:
+    parts = ["<!DOCTYPE html>\n<html>\n  <body>\n"]
+    if hidden_fields is not None:
+        parts.append('  <form method="post" id="form1">\n')
+        parts.append(render_hidden_fields(hidden_fields))
+    return parts
+
+
+def _page_end(hidden_fields: Optional[Dict[str, str]]) -> str:
+    return ("  </form>\n" if hidden_fields is not None else "") + "  </body>\n</html>\n"
+
+
+def _page_slice(total: int, page: int, page_size: int) -> Tuple[range, int]:
+    """計算分頁範圍與總頁數 (page_size <= 0 表示不分頁)"""
+    if page_size <= 0:
+        return range(total), 1
+    total_pages = max((total + page_size - 1) // page_size, 1)
+    page = min(max(page, 1), total_pages)
+    return range((page - 1) * page_size, min(page * page_size, total)), total_pages
+
+
+def _pager_buttons(page: int, total_pages: int, button_count: int) -> List[Tuple[int, str]]:
+    """分頁列按鈕 [(頁碼, 文字)]: 每次只顯示 button_count 個頁碼,前後區段以 "..." 表示"""
+    first = (page - 1) // button_count * button_count + 1
+    last = min(first + button_count - 1, total_pages)
+    buttons = [(first - 1, "...")] if first > 1 else []
+    buttons.extend((number, str(number)) for number in range(first, last + 1))
+    if last < total_pages:
+        buttons.append((last + 1, "..."))
+    return buttons
+
+
+def pager_targets(page: int, total_pages: int, button_count: int = 10) -> List[int]:
+    """分頁列上可 PostBack 的頁碼 (與 ASP.NET GridView Numeric 模式相同)"""
+    if total_pages <= 1:
+        return []
+    return [
+        number
+        for number, _ in _pager_buttons(page, total_pages, button_count)
+        if number != page
+    ]
+
+
+def _pager_row(event_target: str, page: int, total_pages: int, colspan: int) -> str:
+    """GridView 分頁列 (目前頁為 span,其他頁為 __doPostBack 連結)"""
+    cells = []
+    for number, text in _pager_buttons(page, total_pages, 10):
+        if number == page:
+            cells.append(f"<td><span>{text}</span></td>")
+        else:
+            cells.append(
+                f"<td><a href=\"javascript:__doPostBack('{event_target}',"
+                f"'Page${number}')\">{text}</a></td>"
+            )
+    return (
+        f'      <tr class="PagerStyle"><td colspan="{colspan}">'
+        f"<table><tr>{''.join(cells)}</tr></table></td></tr>\n"
+    )
+
+
+def generate_attendance_data(rows: int, seed: int = 0) -> Dict[str, List[Tuple]]:
+    """
+    產生出勤頁面資料 (與 render_attendance_page 搭配)
+
+    Returns:
+        Dict: {
+            "punches": [(日期, 打卡時間)],
+            "leaves": [(假別, 天數, 時數)],
+            "anomalies": [(日期, 上班時間, 下班時間, 加班時數)],
+        }
+    """
+    rng = random.Random(seed)
+    punches = []
+    for index in range(rows):
+        start, end = _punch_range(rng)
+        punches.append((_date_str(index // 2), start if index % 2 == 0 else end))
+
+    leaves = [
+        (leave_type, rng.randint(0, 10), rng.randint(0, 7))
+        for leave_type in _LEAVE_TYPES
+    ]
+
+    anomalies = []
+    for index in range(rows):
+        start, end = _punch_range(rng)
+        anomalies.append((_date_str(index), start, end, rng.randint(1, 8) / 2))
+
+    return {"punches": punches, "leaves": leaves, "anomalies": anomalies}
+
+
+def render_attendance_page(
+    data: Dict[str, List[Tuple]],
+    page: int = 1,
+    page_size: int = 0,
+    hidden_fields: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    產生出勤頁面 HTML (FW99001Z.aspx)
+
+    Args:
+        data: generate_attendance_data 的結果
+        page: gvWeb012 頁碼 (1-based)
+        page_size: gvWeb012 每頁列數 (0 表示不分頁)
+        hidden_fields: ASP.NET 隱藏欄位 (None 表示不產生 form)
+
+    Returns:
+        str: 頁面 HTML
+    """
+    parts = _page_start(hidden_fields)
+    parts.append('    <div id="tabs-1">\n')
+
+    # 打卡記錄 (每個日期上下班各一列)
+    parts.append(
+        '    <table id="ContentPlaceHolder1_gvNotes005">\n'
+        "      <tr><th>日期</th><th>打卡時間</th></tr>\n"
+    )
+    for index, (punch_date, punch_time) in enumerate(data["punches"]):
+        parts.append(
+            f'      <tr class="{_ROW_CLASSES[index % 2]}">\n'
+            f"        <td>{punch_date}</td>\n"
+            f"        <td>{punch_time}</td>\n"
+            "      </tr>\n"
+        )
+    parts.append("    </table>\n")
+
+    # 假別記錄
+    parts.append(
+        '    <table id="ContentPlaceHolder1_gvNotes011">\n'
+        "      <tr><th>類別</th><th>日數/時數</th></tr>\n"
+    )
+    for index, (leave_type, days, hours) in enumerate(data["leaves"]):
+        parts.append(
+            f'      <tr class="{_ROW_CLASSES[index % 2]}">\n'
+            f"        <td>{leave_type}</td>\n"
+            "        <td>\n"
+            f'          <span id="ContentPlaceHolder1_gvNotes011_lblAbsenceDay_{index}">'
+            f" {days} 天</span>\n"
+            f'          <span id="ContentPlaceHolder1_gvNotes011_lblAbsenceHour_{index}">'
+            f" {hours} 小時</span>\n"
+            "        </td>\n"
+            "      </tr>\n"
+        )
+    parts.append("    </table>\n")
+
+    # 剩餘額度
+    parts.append(
+        '    <table id="ContentPlaceHolder1_dvNotes019">\n'
+        '      <tr class="RowStyle"><td>目前特休剩餘：15 天</td></tr>\n'
+        '      <tr class="AlternatingRowStyle_update"><td>目前調休剩餘：5 天</td></tr>\n'
+        '      <tr class="RowStyle"><td>未達加班換修最低申請時限： 1 小時 30 分鐘</td></tr>\n'
+        "    </table>\n"
+        "    </div>\n"
+    )
+
+    # 出勤異常 (tabs-2)
+    anomalies = data["anomalies"]
+    indices, total_pages = _page_slice(len(anomalies), page, page_size)
+    parts.append(
+        '    <div id="tabs-2">\n'
+        '    <table id="ContentPlaceHolder1_gvWeb012" cellspacing="0" cellpadding="3" rules="rows">\n'
+        "      <tr><th>日期</th><th>失損時數</th><th>異常說明</th></tr>\n"
+    )
+    for row, index in enumerate(indices):
+        anomaly_date, start, end, hours = anomalies[index]
+        parts.append(
+            f'      <tr class="{_ROW_CLASSES[row % 2]}">\n'
+            "        <td>\n"
+            f'          <span id="ContentPlaceHolder1_gvWeb012_lblWork_Date_{row}">'
+            f"{anomaly_date}</span><br />\n"
+            f'          <span id="ContentPlaceHolder1_gvWeb012_lblCard_Time_{row}">'
+            f"&nbsp;&nbsp;{start}~{end}&nbsp;&nbsp;</span>\n"
+            "        </td>\n"
+            f'        <td><span id="ContentPlaceHolder1_gvWeb012_lblLose_Manhour_{row}">0</span></td>\n'
+            f'        <td><span id="ContentPlaceHolder1_gvWeb012_lblDescribe_{row}">'
+            f"加班:{hours:.1f}小時</span></td>\n"
+            "      </tr>\n"
+        )
+    if total_pages > 1:
+        parts.append(
+            _pager_row(
+                "ctl00$ContentPlaceHolder1$gvWeb012",
+                min(max(page, 1), total_pages),
+                total_pages,
+                colspan=3,
+            )
+        )
+    parts.append("    </table>\n    </div>\n")
+    parts.append(_page_end(hidden_fields))
+    return "".join(parts)
+
+
+def generate_attendance_page(rows: int, seed: int = 0) -> str:
+    """
+    產生出勤頁面 (FW99001Z.aspx)
+
+    Args:
+        rows: gvNotes005 與 gvWeb012 各自的資料列數
+        seed: 亂數種子
+
+    Returns:
+        str: 頁面 HTML
+    """
+    return render_attendance_page(generate_attendance_data(rows, seed))
+
+
+def generate_personal_record_rows(rows: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    產生個人記錄資料 (與 render_personal_record_page 搭配)
+
+    Args:
+        rows: 資料列數 (偶數列為加班,奇數列為調休)
+        seed: 亂數種子
+
+    Returns:
+        List[Dict]: [{"date", "description", "minutes", "is_change",
+                      "monthly_total", "quarterly_total", "status"}]
+    """
+    rng = random.Random(seed)
+    records = []
+    for index in range(rows):
+        minutes = rng.randint(1, 8) * 30
+        status = "簽核中" if rng.random() < 0.3 else "簽核完成"
+        records.append(
+            {
+                "date": _date_str(index),
+                "description": _DESCRIPTIONS[index % len(_DESCRIPTIONS)],
+                "minutes": minutes,
+                "is_change": index % 2 == 1,
+                "monthly_total": rng.randint(0, 40) / 2,
+                "quarterly_total": rng.randint(0, 120) / 2,
+                "status": status,
+            }
+        )
+    return records
+
+
+def render_personal_record_page(
+    records: Sequence[Dict[str, Any]],
+    page: int = 1,
+    page_size: int = 0,
+    hidden_fields: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    產生個人記錄頁面 HTML (FW21003Z.aspx)
+
+    Args:
+        records: generate_personal_record_rows 格式的資料
+        page: 頁碼 (1-based)
+        page_size: 每頁列數 (0 表示不分頁,仍保留只有一頁的分頁列)
+        hidden_fields: ASP.NET 隱藏欄位 (None 表示不產生 form)
+
+    Returns:
+        str: 頁面 HTML
+    """
+    prefix = "ContentPlaceHolder1_gvFlow211"
+    indices, total_pages = _page_slice(len(records), page, page_size)
+    parts = _page_start(hidden_fields)
+    parts.append(
+        f'    <table id="{prefix}">\n'
+        "      <tr><th>加班人員<br />加班日期</th><th>加班單位<br />加班內容</th>"
+        "<th>狀態</th><th>申報</th><th>當月累計</th><th>當季累計</th><th>狀態</th></tr>\n"
+    )
+    for row, index in enumerate(indices):
+        record = records[index]
+        minutes = record["minutes"]
+        is_change = record["is_change"]
+        description = record["description"]
+        parts.append(
+            f'      <tr class="{_ROW_CLASSES[row % 2]}">\n'
+            "        <td>\n"
+            f'          <span id="{prefix}_lblOT_Emp_Name_{row}">測試員</span><br />\n'
+            f'          <span id="{prefix}_lblOT_Date_{row}">{record["date"]}</span>\n'
+            "        </td>\n"
+            "        <td>\n"
+            f'          <span id="{prefix}_lblOT_Dept_Text_{row}">測試部門</span><br />\n'
+            f'          <span id="{prefix}_lblOT_Describe_{row}" title="{description}">'
+            f"{description}</span>\n"
+            "        </td>\n"
+            "        <td>\n"
+            f'          <span id="{prefix}_Label9_{row}">加班</span><br />\n'
+            f'          <span id="{prefix}_lblT_Change_{row}" style="color: Blue">調休</span>\n'
+            "        </td>\n"
+            "        <td>\n"
+            f'          <span id="{prefix}_lblOT_Minute_{row}">'
+            f'{"" if is_change else minutes}</span>&nbsp;<br />\n'
+            f'          <span id="{prefix}_lblChange_Minute_{row}">'
+            f'{minutes if is_change else ""}</span>&nbsp;\n'
+            "        </td>\n"
+            f'        <td><span id="{prefix}_lblOT_Manhour_{row}">{record["monthly_total"]:.1f}</span></td>\n'
+            f'        <td><span id="{prefix}_lblOT_Monhour_{row}">{record["quarterly_total"]:.1f}</span></td>\n'
+            f'        <td><span id="{prefix}_lblProcess_Flag_Text_{row}">{record["status"]}</span></td>\n'
+            "      </tr>\n"
+        )
+    parts.append(
+        _pager_row(
+            "ctl00$ContentPlaceHolder1$gvFlow211",
+            min(max(page, 1), total_pages),
+            total_pages,
+            colspan=7,
+        )
+    )
+    parts.append("    </table>\n")
+    parts.append(_page_end(hidden_fields))
+    return "".join(parts)
+
+
+def generate_personal_record_page(rows: int, seed: int = 0) -> str:
+    """
+    產生個人記錄頁面 (FW21003Z.aspx)
+
+    Args:
+        rows: gvFlow211 資料列數 (偶數列為加班,奇數列為調休)
+        seed: 亂數種子
+
+    Returns:
+        str: 頁面 HTML
+    """
+    return render_personal_record_page(generate_personal_record_rows(rows, seed))
+
+
+def generate_attendance_records(rows: int, seed: int = 0) -> List[Dict[str, str]]:
+    """
+    產生 OvertimeCalculator.calculate_overtime 的輸入
+
+    Returns:
+        List[Dict]: [{'date': 'YYYY/MM/DD', 'time_range': 'HH:MM:SS~HH:MM:SS'}]
+    """
+    rng = random.Random(seed)
+    records = []
+    for index in range(rows):
+        start, end = _punch_range(rng)
+        records.append({"date": _date_str(index), "time_range": f"{start}~{end}"})
+    return records
+
+
+def generate_merge_inputs(rows: int, seed: int = 0) -> Tuple[List[Dict], List[Dict]]:
+    """
+    產生 DataSyncService._merge_overtime_data 的輸入
+
+    約 2/3 的異常記錄已申報,另有 rows/4 筆僅存在於個人記錄 (手動調休)。
+
+    Returns:
+        Tuple: (異常記錄, 個人記錄),皆依日期由新到舊
+    """
+    rng = random.Random(seed)
+    anomaly_records = []
+    personal_records = []
+
+    for index in range(rows):
+        start, end = _punch_range(rng)
+        anomaly_records.append(
+            {
+                "date": _date_str(index),
+                "punch_range": f"{start}~{end}",
+                "description": "加班",
+                "overtime_hours": rng.randint(1, 8) / 2,
+            }
+        )
+
+    personal_dates = [
+        _date_str(index) for index in range(rows) if index % 3 != 0
+    ] + [_date_str(rows + index) for index in range(rows // 4)]
+    for personal_date in personal_dates:
+        personal_records.append(
+            {
+                "date": personal_date,
+                "content": _DESCRIPTIONS[rng.randrange(len(_DESCRIPTIONS))],
+                "status": "簽核完成",
+                "report_type": "加班",
+                "overtime_hours": rng.randint(1, 8) / 2,
+                "monthly_total": rng.randint(0, 40) / 2,
+                "quarterly_total": rng.randint(0, 120) / 2,
+            }
+        )
+
+    return anomaly_records, personal_records
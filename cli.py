@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+TECO SSP 加班時數計算器
+命令列入口 (無 GUI,供排程批次執行)
+"""
+
+import sys
+
+from src.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
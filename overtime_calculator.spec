@@ -18,7 +18,10 @@ assets_data = []
 if assets_path.exists():
     assets_data.append((str(assets_path), "assets"))
 
-hidden_imports = ["customtkinter", "PIL._tkinter_finder"] + collect_submodules("PIL.ImageTk")
+# openpyxl 只在匯出時由 pandas 動態載入 (靜態分析看不到)
+hidden_imports = ["customtkinter", "PIL._tkinter_finder", "openpyxl"] + collect_submodules(
+    "PIL.ImageTk"
+)
 
 analysis = Analysis(
     ["app.py"],
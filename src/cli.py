@@ -0,0 +1,234 @@
+"""命令列介面 (無 GUI)
+
+同步出勤資料、計算加班時數並匯出報表,供排程批次執行:
+
+    python cli.py --username A1234 --format json > report.json
+    python cli.py --username A1234 --format xlsx --output report.xlsx
+    python cli.py --username A1234 --format parquet --output report.parquet
+
+密碼由環境變數 (預設 SSP_PASSWORD) 或 --saved-credentials (系統 keyring) 提供,
+不接受命令列參數,避免出現在程序列表與 shell 歷史中。
+
+啟動時只載入 argparse 等標準函式庫,服務層在解析參數後才匯入,
+且不匯入任何 UI 模組 (customtkinter / PIL),不需要顯示器。
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .config import Settings
+    from .models import OvertimeReport
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("json", "csv", "xlsx", "jsonl", "parquet")
+# 只能寫入檔案的格式
+FILE_ONLY_FORMATS = ("xlsx", "parquet")
+DEFAULT_PASSWORD_ENV = "SSP_PASSWORD"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """建立命令列參數解析器"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="TECO SSP 加班時數計算器 (命令列版)"
+    )
+    parser.add_argument(
+        "--username",
+        default=os.environ.get("SSP_USERNAME"),
+        help="SSP 帳號 (預設環境變數 SSP_USERNAME)",
+    )
+    parser.add_argument(
+        "--password-env",
+        default=DEFAULT_PASSWORD_ENV,
+        help=f"存放密碼的環境變數名稱 (預設 {DEFAULT_PASSWORD_ENV})",
+    )
+    parser.add_argument(
+        "--saved-credentials",
+        action="store_true",
+        help="使用 GUI 儲存於系統 keyring 的帳號密碼",
+    )
+    parser.add_argument("--format", choices=FORMATS, default="json")
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="輸出檔案 (預設 - 表示標準輸出; xlsx / parquet 必須指定檔案)",
+    )
+    parser.add_argument("--base-url", help="SSP 網址 (預設使用 Settings)")
+    parser.add_argument("--parser", choices=("soup", "stream"), help="HTML 解析後端")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="於標準錯誤輸出詳細日誌"
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    命令列進入點
+
+    Returns:
+        int: 結束碼 (0 成功, 1 登入/同步/匯出失敗, 2 參數錯誤)
+    """
+    started = time.perf_counter()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.format in FILE_ONLY_FORMATS and args.output == "-":
+        parser.error(f"{args.format} 格式必須以 --output 指定檔案")
+
+    # 日誌輸出至標準錯誤,標準輸出保留給報表
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+
+    username, password, error = _resolve_credentials(args)
+    if error:
+        print(f"✗ {error}", file=sys.stderr)
+        return 2
+
+    from .config import Settings
+
+    settings = Settings()
+    if args.base_url:
+        settings.SSP_BASE_URL = args.base_url.rstrip("/")
+    if args.parser:
+        settings.PARSER_BACKEND = args.parser
+
+    timings: Dict[str, float] = {"startup": time.perf_counter() - started}
+    report, error = fetch_report(settings, username, password, timings)
+    if error:
+        print(f"✗ {error}", file=sys.stderr)
+        return 1
+
+    step_started = time.perf_counter()
+    if not export_report(report, args.format, args.output, settings):
+        print("✗ 匯出失敗", file=sys.stderr)
+        return 1
+    timings["export"] = time.perf_counter() - step_started
+
+    logger.info(
+        "完成: %s (總計 %.3f 秒)",
+        ", ".join(f"{name}={seconds:.3f}s" for name, seconds in timings.items()),
+        time.perf_counter() - started,
+    )
+    return 0
+
+
+def fetch_report(
+    settings: "Settings",
+    username: str,
+    password: str,
+    timings: Optional[Dict[str, float]] = None,
+) -> Tuple[Optional["OvertimeReport"], Optional[str]]:
+    """
+    登入、同步並計算加班報表
+
+    Args:
+        settings: 應用程式設定
+        username: SSP 帳號
+        password: SSP 密碼
+        timings: 各步驟耗時 (秒),提供時就地填入
+
+    Returns:
+        tuple: (報表, 錯誤訊息),成功時錯誤訊息為 None
+    """
+    from .core.calculator import OvertimeCalculator
+    from .services.auth_service import AuthService
+    from .services.data_sync_service import DataSyncService
+
+    timings = timings if timings is not None else {}
+
+    step_started = time.perf_counter()
+    auth_service = AuthService(settings)
+    if not auth_service.login(username, password):
+        return None, "登入失敗,請確認帳號密碼"
+    timings["login"] = time.perf_counter() - step_started
+
+    try:
+        step_started = time.perf_counter()
+        data_sync_service = DataSyncService(auth_service.get_session(), settings)
+        data_sync_service.sync_all(force_refresh=True)
+        raw_records = data_sync_service.get_attendance_records()
+        timings["sync"] = time.perf_counter() - step_started
+    except Exception as e:
+        logger.error(f"同步資料錯誤: {e}", exc_info=True)
+        return None, f"同步資料失敗: {e}"
+
+    if not raw_records:
+        return None, "沒有找到出勤記錄"
+
+    step_started = time.perf_counter()
+    report = OvertimeCalculator(settings).calculate_overtime(raw_records)
+    timings["calculate"] = time.perf_counter() - step_started
+    return report, None
+
+
+def export_report(
+    report: "OvertimeReport", fmt: str, output: str, settings: "Settings"
+) -> bool:
+    """
+    匯出報表
+
+    Args:
+        report: 加班報表
+        fmt: json / xlsx 為報表 (含統計摘要);
+             csv / jsonl / parquet 為欄式記錄 (欄位同 AttendanceRecord)
+        output: 輸出檔案路徑 (- 表示標準輸出,xlsx / parquet 不支援)
+        settings: 應用程式設定
+
+    Returns:
+        bool: 是否成功
+    """
+    from .services.export_service import ExportService
+
+    export_service = ExportService(settings)
+
+    if fmt == "xlsx":
+        # 轉為絕對路徑,ExportService 不會再放入 reports 資料夾
+        return export_service.export_to_excel(
+            report, str(Path(output).resolve())
+        ) is not None
+
+    if fmt in ("csv", "jsonl", "parquet"):
+        target = sys.stdout if output == "-" else output
+        return export_service.export_records(report.records, fmt, target) is not None
+
+    if output == "-":
+        export_service.write_json(report, sys.stdout)
+        return True
+
+    try:
+        with open(output, "w", encoding="utf-8") as stream:
+            export_service.write_json(report, stream)
+    except OSError as e:
+        logger.error(f"✗ 寫入 {output} 時發生錯誤: {e}")
+        return False
+    return True
+
+
+def _resolve_credentials(
+    args: argparse.Namespace,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """取得帳號密碼,返回 (帳號, 密碼, 錯誤訊息)"""
+    if args.saved_credentials:
+        from .services.credential_manager import CredentialManager
+
+        username, password = CredentialManager().load_credentials()
+        if not username or not password:
+            return None, None, "系統 keyring 中沒有儲存的帳號密碼"
+        return username, password, None
+
+    if not args.username:
+        return None, None, "請以 --username 或環境變數 SSP_USERNAME 指定帳號"
+
+    password = os.environ.get(args.password_env)
+    if not password:
+        return None, None, f"請以環境變數 {args.password_env} 提供密碼"
+    return args.username, password, None
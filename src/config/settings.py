@@ -1,6 +1,28 @@
 """系統設定"""
 
+import os
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
+
+APP_DIR_NAME = "overtime-assistant"
+
+
+def default_cache_dir() -> str:
+    """
+    使用者層級的快取目錄 (不隨啟動時的工作目錄改變)
+
+    - Windows: %LOCALAPPDATA%\\overtime-assistant
+    - macOS: ~/Library/Caches/overtime-assistant
+    - 其他: $XDG_CACHE_HOME/overtime-assistant (預設 ~/.cache)
+    """
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return str(Path(base) / APP_DIR_NAME)
 
 
 @dataclass
@@ -32,6 +54,8 @@ class Settings:
         )
     )
     ENABLE_SUBMISSION: bool = True  # Beta 版本預設禁用送出功能
+    SUBMISSION_BATCH_SIZE: int = 10  # 分批送出時每批的記錄數
+    FORM_STATE_CACHE_SECONDS: int = 600  # 已增加列的表單 ViewState 重複使用時間 (10 分鐘)
 
     # 日期格式
     DATE_FORMAT: str = "%Y/%m/%d"
@@ -45,6 +69,13 @@ class Settings:
     REQUEST_TIMEOUT: int = 30
     MAX_PAGES: int = 10
     CACHE_DURATION_SECONDS: int = 300  # 快取有效時間 (5 分鐘)
+    CACHE_DIR: str = field(default_factory=default_cache_dir)  # 出勤快照等個人資料的快取目錄
+    HTTP_POOL_SIZE: int = 10  # 連線池大小 (需 >= 平行抓取的執行緒數,舊版翻頁可一次抓完 MAX_PAGES)
+    HTTP_MAX_RETRIES: int = 3  # GET 請求重試次數 (POST 不重試)
+    HTTP_BACKOFF_FACTOR: float = 0.5  # 重試退避係數 (0.5s, 1s, 2s...)
+
+    # 解析設定
+    PARSER_BACKEND: str = "soup"  # HTML 解析後端: "soup" (BeautifulSoup) 或 "stream" (串流)
 
     @classmethod
     def from_file(cls, filepath: str = "config.py"):
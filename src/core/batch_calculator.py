@@ -0,0 +1,218 @@
+"""加班時數批次計算 (NumPy / pandas 向量化)
+
+適用於大量出勤資料 (例如整個部門多年度的打卡匯出),
+以欄式資料一次完成解析、標準上班時間修正、時數計算與上下限限制。
+
+計算結果與 OvertimeCalculator.calculate_overtime 逐筆計算完全一致:
+- 相同的日期時間格式 (Settings.DATE_FORMAT / TIME_FORMAT),無法解析的記錄略過
+- 相同的浮點運算順序與四捨五入 (與 Python round 相同)
+- 相同的排序 (依日期由新到舊,同日期維持輸入順序)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..models import AttendanceRecord, OvertimeReport
+from ..config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OvertimeArrays:
+    """
+    批次計算結果 (欄式陣列)
+
+    只包含可解析的記錄,已依日期由新到舊排序。
+    適用於不需要 AttendanceRecord 物件的呼叫端 (統計、匯出等)。
+    """
+
+    dates: np.ndarray  # object: YYYY/MM/DD
+    start_times: np.ndarray  # object: HH:MM:SS
+    end_times: np.ndarray  # object: HH:MM:SS
+    total_minutes: np.ndarray  # int64: 總工時 (分鐘,無條件捨去)
+    overtime_hours: np.ndarray  # float64: 加班時數 (已限制範圍)
+    source_index: np.ndarray  # int64: 對應輸入資料的位置
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+
+class BatchOvertimeCalculator:
+    """
+    向量化加班時數計算器
+
+    使用方式:
+        ```python
+        engine = BatchOvertimeCalculator(settings)
+        arrays = engine.compute(dates, start_times, end_times)
+        report = engine.to_report(arrays)
+        ```
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+    def compute(
+        self,
+        dates: Sequence[str],
+        start_times: Sequence[str],
+        end_times: Sequence[str],
+    ) -> OvertimeArrays:
+        """
+        計算加班時數 (平行陣列輸入)
+
+        Args:
+            dates: 日期 (YYYY/MM/DD)
+            start_times: 上班時間 (HH:MM:SS)
+            end_times: 下班時間 (HH:MM:SS)
+
+        Returns:
+            OvertimeArrays: 計算結果
+
+        Raises:
+            ValueError: 三個陣列長度不一致
+        """
+        date_series = self._to_str_series(dates)
+        start_series = self._to_str_series(start_times)
+        end_series = self._to_str_series(end_times)
+
+        if not len(date_series) == len(start_series) == len(end_series):
+            raise ValueError("日期、上班時間、下班時間的筆數必須相同")
+
+        datetime_format = f"{self.settings.DATE_FORMAT} {self.settings.TIME_FORMAT}"
+        start = pd.to_datetime(
+            date_series + " " + start_series, format=datetime_format, errors="coerce"
+        )
+        end = pd.to_datetime(
+            date_series + " " + end_series, format=datetime_format, errors="coerce"
+        )
+
+        valid = (start.notna() & end.notna()).to_numpy()
+        invalid_count = int((~valid).sum())
+        if invalid_count:
+            logger.warning("批次計算: 略過 %d 筆無法解析的記錄", invalid_count)
+
+        start = start[valid]
+        end = end[valid]
+
+        # 如果上班時間晚於標準時間,以標準時間計算
+        day = start.dt.normalize()
+        standard_start = day + pd.Timedelta(hours=self.settings.STANDARD_START_HOUR)
+        actual_start = start.where(start <= standard_start, standard_start)
+
+        # 計算總工作時間(分鐘) 與加班時數 (運算順序與逐筆計算相同)
+        total_minutes = (
+            (end - actual_start) / pd.Timedelta(seconds=1)
+        ).to_numpy(dtype=np.float64) / 60
+        overtime_minutes = (
+            total_minutes
+            - self.settings.LUNCH_BREAK
+            - self.settings.WORK_HOURS
+            - self.settings.REST_TIME
+        )
+        overtime_hours = np.clip(
+            self._round_like_python(overtime_minutes / 60, 2),
+            0,
+            self.settings.MAX_OVERTIME_HOURS,
+        )
+
+        # 排序(由新到舊,同日期維持輸入順序)
+        day_numbers = day.to_numpy().astype("datetime64[D]").astype(np.int64)
+        order = np.argsort(-day_numbers, kind="stable")
+
+        source_index = np.flatnonzero(valid)
+        return OvertimeArrays(
+            dates=date_series.to_numpy(dtype=object)[valid][order],
+            start_times=start_series.to_numpy(dtype=object)[valid][order],
+            end_times=end_series.to_numpy(dtype=object)[valid][order],
+            total_minutes=np.trunc(total_minutes).astype(np.int64)[order],
+            overtime_hours=overtime_hours[order],
+            source_index=source_index[order],
+        )
+
+    def compute_frame(self, frame: pd.DataFrame) -> OvertimeArrays:
+        """
+        計算加班時數 (DataFrame 輸入)
+
+        Args:
+            frame: 需包含 date 欄位,以及 start_time / end_time 或 time_range
+                   (HH:MM:SS~HH:MM:SS) 欄位
+
+        Returns:
+            OvertimeArrays: 計算結果
+
+        Raises:
+            ValueError: 缺少必要欄位
+        """
+        if "date" not in frame.columns:
+            raise ValueError("DataFrame 缺少 date 欄位")
+
+        if {"start_time", "end_time"}.issubset(frame.columns):
+            return self.compute(frame["date"], frame["start_time"], frame["end_time"])
+
+        if "time_range" not in frame.columns:
+            raise ValueError("DataFrame 需包含 start_time/end_time 或 time_range 欄位")
+
+        # 時間範圍需恰好分成兩段,否則視為格式錯誤 (以空字串使其解析失敗)
+        parts = self._to_str_series(frame["time_range"]).str.split("~")
+        well_formed = parts.str.len() == 2
+        start_times = parts.str[0].str.strip().where(well_formed, "")
+        end_times = parts.str[-1].str.strip().where(well_formed, "")
+
+        return self.compute(frame["date"], start_times, end_times)
+
+    @staticmethod
+    def to_report(arrays: OvertimeArrays) -> OvertimeReport:
+        """
+        轉換為 OvertimeReport
+
+        Args:
+            arrays: 批次計算結果
+
+        Returns:
+            OvertimeReport: 與逐筆計算相同的報表
+        """
+        records: List[AttendanceRecord] = [
+            AttendanceRecord(
+                date=date,
+                start_time=start_time,
+                end_time=end_time,
+                total_minutes=total_minutes,
+                overtime_hours=overtime_hours,
+            )
+            for date, start_time, end_time, total_minutes, overtime_hours in zip(
+                arrays.dates.tolist(),
+                arrays.start_times.tolist(),
+                arrays.end_times.tolist(),
+                arrays.total_minutes.tolist(),
+                arrays.overtime_hours.tolist(),
+            )
+        ]
+        return OvertimeReport(records=records)
+
+    # === 輔助方法 ===
+
+    @staticmethod
+    def _to_str_series(values) -> pd.Series:
+        """轉換為字串 Series (重設索引以便對齊)"""
+        return pd.Series(values, dtype=object).reset_index(drop=True).astype(str)
+
+    @staticmethod
+    def _round_like_python(values: np.ndarray, ndigits: int) -> np.ndarray:
+        """
+        四捨五入 (結果與內建 round 相同)
+
+        np.round 以 x * 10**n 取整,在接近 .5 的邊界可能與 Python round
+        (依十進位精確值判斷) 不同;邊界附近的少數值改用 round 逐一計算。
+        """
+        rounded = np.round(values, ndigits)
+        scaled = values * 10**ndigits
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        for position in np.flatnonzero(near_half):
+            rounded[position] = round(float(values[position]), ndigits)
+        return rounded
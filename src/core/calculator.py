@@ -1,11 +1,14 @@
 """加班時數計算核心邏輯"""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence
 import logging
 from ..models import AttendanceRecord, OvertimeReport
 from ..config import Settings
 
+if TYPE_CHECKING:
+    from .batch_calculator import OvertimeArrays
+
 logger = logging.getLogger(__name__)
 
 
@@ -110,3 +113,53 @@ class OvertimeCalculator:
         attendance_records.sort(key=lambda r: r.date_obj, reverse=True)
 
         return OvertimeReport(records=attendance_records)
+
+    def calculate_overtime_batch(
+        self,
+        data,
+        start_times: Optional[Sequence[str]] = None,
+        end_times: Optional[Sequence[str]] = None,
+    ) -> OvertimeReport:
+        """
+        批次計算加班時數 (向量化,結果與 calculate_overtime 相同)
+
+        Args:
+            data: DataFrame (date + start_time/end_time 或 time_range 欄位),
+                  或日期序列 (需同時提供 start_times / end_times)
+            start_times: 上班時間序列 (HH:MM:SS)
+            end_times: 下班時間序列 (HH:MM:SS)
+
+        Returns:
+            OvertimeReport: 加班報表
+        """
+        from .batch_calculator import BatchOvertimeCalculator
+
+        arrays = self.calculate_overtime_arrays(data, start_times, end_times)
+        return BatchOvertimeCalculator.to_report(arrays)
+
+    def calculate_overtime_arrays(
+        self,
+        data,
+        start_times: Optional[Sequence[str]] = None,
+        end_times: Optional[Sequence[str]] = None,
+    ) -> "OvertimeArrays":
+        """
+        批次計算加班時數,返回欄式陣列 (不建立 AttendanceRecord)
+
+        參數同 calculate_overtime_batch。
+
+        Returns:
+            OvertimeArrays: 計算結果 (依日期由新到舊排序)
+
+        Raises:
+            ValueError: 輸入欄位缺漏或長度不一致
+        """
+        # 延遲匯入: 只有批次計算才需要 NumPy / pandas
+        from .batch_calculator import BatchOvertimeCalculator
+
+        engine = BatchOvertimeCalculator(self.settings)
+        if start_times is None and end_times is None:
+            return engine.compute_frame(data)
+        if start_times is None or end_times is None:
+            raise ValueError("start_times 與 end_times 必須同時提供")
+        return engine.compute(data, start_times, end_times)
@@ -5,9 +5,22 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
-class AttendanceRecord:
-    """出勤記錄"""
+class _ParsedDateTimeSlots:
+    """AttendanceRecord 的解析快取欄位 (不屬於 dataclass 欄位,不參與比較、顯示與 asdict)"""
+
+    __slots__ = ("_date_cache", "_start_cache", "_end_cache")
+
+
+@dataclass(slots=True)
+class AttendanceRecord(_ParsedDateTimeSlots):
+    """
+    出勤記錄
+
+    效能:
+    - __slots__ 配置,大量記錄時不為每筆建立 __dict__
+    - 日期/時間的 datetime 物件於首次存取時解析並快取,
+      排序與篩選不會重複呼叫 strptime (欄位被重新指定時自動重新解析)
+    """
 
     date: str  # 格式: YYYY/MM/DD
     start_time: str  # 格式: HH:MM:SS
@@ -15,20 +28,46 @@ class AttendanceRecord:
     overtime_hours: float = 0.0
     total_minutes: int = 0
 
+    def __post_init__(self):
+        self._date_cache = None
+        self._start_cache = None
+        self._end_cache = None
+
     @property
     def date_obj(self) -> datetime:
         """轉換為 datetime 物件"""
-        return datetime.strptime(self.date, "%Y/%m/%d")
+        cache = getattr(self, "_date_cache", None)
+        if cache is None or cache[0] is not self.date:
+            cache = (self.date, datetime.strptime(self.date, "%Y/%m/%d"))
+            self._date_cache = cache
+        return cache[1]
 
     @property
     def start_datetime(self) -> datetime:
         """開始時間 datetime 物件"""
-        return datetime.strptime(f"{self.date} {self.start_time}", "%Y/%m/%d %H:%M:%S")
+        cache = getattr(self, "_start_cache", None)
+        if cache is None or cache[0] is not self.date or cache[1] is not self.start_time:
+            cache = (self.date, self.start_time, self._combine(self.start_time))
+            self._start_cache = cache
+        return cache[2]
 
     @property
     def end_datetime(self) -> datetime:
         """結束時間 datetime 物件"""
-        return datetime.strptime(f"{self.date} {self.end_time}", "%Y/%m/%d %H:%M:%S")
+        cache = getattr(self, "_end_cache", None)
+        if cache is None or cache[0] is not self.date or cache[1] is not self.end_time:
+            cache = (self.date, self.end_time, self._combine(self.end_time))
+            self._end_cache = cache
+        return cache[2]
+
+    def _combine(self, time_str: str) -> datetime:
+        """以已快取的日期組合時間 (只解析時間部分)"""
+        parsed_time = datetime.strptime(time_str, "%H:%M:%S")
+        return self.date_obj.replace(
+            hour=parsed_time.hour,
+            minute=parsed_time.minute,
+            second=parsed_time.second,
+        )
 
     def __hash__(self):
         """用於去重"""
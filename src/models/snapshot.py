@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from .attendance import UnifiedOvertimeRecord
 from .punch import PunchRecord
@@ -10,6 +10,14 @@ from .leave import LeaveRecord
 from .quota import AttendanceQuota
 
 
+# 時數累計的小數位數 (高於記錄時數的精度，累加後取整以消除浮點誤差)
+_HOURS_DIGITS = 6
+
+
+def _add_hours(total: float, hours: float) -> float:
+    return round(total + hours, _HOURS_DIGITS)
+
+
 @dataclass
 class OvertimeStatistics:
     """加班統計資料
@@ -38,6 +46,60 @@ class OvertimeStatistics:
     # === 資料一致性 ===
     discrepancy_count: int = 0  # 計算與申報時數不一致筆數
 
+    @classmethod
+    def from_records(
+        cls, records: Iterable[UnifiedOvertimeRecord], start_date: str, end_date: str
+    ) -> "OvertimeStatistics":
+        """由統一記錄計算統計 (單次走訪)
+
+        Args:
+            records: 統一記錄列表
+            start_date: 開始日期
+            end_date: 結束日期
+        """
+        statistics = cls(start_date=start_date, end_date=end_date)
+        for record in records:
+            statistics.add_record(record)
+        return statistics
+
+    def add_record(self, record: UnifiedOvertimeRecord):
+        """加入一筆記錄的貢獻"""
+        self._apply(record, 1)
+
+    def remove_record(self, record: UnifiedOvertimeRecord):
+        """移除一筆記錄的貢獻
+
+        記錄的申報狀態改變時，於修改前呼叫 remove_record、修改後呼叫 add_record，
+        統計即與重新計算的結果一致 (時數每次累加後取至小數 6 位，
+        避免浮點誤差隨差量更新累積；記錄時數最多 2 位小數)。
+        """
+        self._apply(record, -1)
+
+    def _apply(self, record: UnifiedOvertimeRecord, sign: int):
+        hours = record.calculated_overtime_hours
+
+        self.total_days += sign
+        self.total_overtime_hours = _add_hours(self.total_overtime_hours, sign * hours)
+        if hours > 0:
+            self.workdays_with_overtime += sign
+        if record.has_anomaly:
+            self.anomaly_days += sign
+
+        if record.submitted:
+            reported = record.reported_overtime_hours
+            if reported:
+                self.submitted_overtime_hours = _add_hours(
+                    self.submitted_overtime_hours, sign * reported
+                )
+                # 計算時數與申報時數差異 > 0.1 視為不一致
+                if abs(hours - reported) > 0.1:
+                    self.discrepancy_count += sign
+        else:
+            self.pending_overtime_hours = _add_hours(
+                self.pending_overtime_hours, sign * hours
+            )
+            self.pending_submission_days += sign
+
     @property
     def average_overtime_per_day(self) -> float:
         """平均每日加班時數"""
@@ -96,6 +158,19 @@ class AttendanceSnapshot:
     # === 統計資料 (Layer 3) ===
     statistics: Optional[OvertimeStatistics] = None
 
+    # === 查詢索引 (首次查詢時建立，不參與比較與輸出) ===
+    _date_index: Optional[Dict[str, UnifiedOvertimeRecord]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _views: Dict[str, List[UnifiedOvertimeRecord]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # 建立索引時的 unified_records 列表與長度 (以 is 比對，列表被替換或長度改變時自動重建)
+    _indexed_source: Optional[List[UnifiedOvertimeRecord]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_length: int = field(default=0, init=False, repr=False, compare=False)
+
     def is_fresh(self, max_age_seconds: int = 300) -> bool:
         """檢查快取是否新鮮 (預設 5 分鐘)"""
         age = (datetime.now() - self.fetched_at).total_seconds()
@@ -112,30 +187,67 @@ class AttendanceSnapshot:
         return len(self.unified_records) > 0
 
     def get_record_by_date(self, date: str) -> Optional[UnifiedOvertimeRecord]:
-        """依日期取得記錄
-        
+        """依日期取得記錄 (O(1)，同一日期有多筆時返回第一筆)
+
         Args:
             date: YYYY/MM/DD 格式
             
         Returns:
             找到的記錄，若無則回傳 None
         """
-        for record in self.unified_records:
-            if record.date == date:
-                return record
-        return None
+        self._ensure_index()
+        return self._date_index.get(date)
 
     def get_pending_records(self) -> List[UnifiedOvertimeRecord]:
-        """取得所有待申報記錄"""
-        return [r for r in self.unified_records if r.needs_submission]
+        """取得所有待申報記錄 (快取結果，請勿修改返回的列表)"""
+        return self._view("pending", lambda r: r.needs_submission)
 
     def get_anomaly_records(self) -> List[UnifiedOvertimeRecord]:
-        """取得所有異常記錄"""
-        return [r for r in self.unified_records if r.has_anomaly]
+        """取得所有異常記錄 (快取結果，請勿修改返回的列表)"""
+        return self._view("anomaly", lambda r: r.has_anomaly)
 
     def get_submitted_records(self) -> List[UnifiedOvertimeRecord]:
-        """取得所有已申報記錄"""
-        return [r for r in self.unified_records if r.submitted]
+        """取得所有已申報記錄 (快取結果，請勿修改返回的列表)"""
+        return self._view("submitted", lambda r: r.submitted)
+
+    def invalidate_views(self):
+        """清除查詢索引
+
+        指定新的 unified_records 列表，或在列表中新增、移除記錄 (長度改變) 會自動偵測；
+        替換列表中的元素 (unified_records[i] = ...)、長度不變的增刪，
+        或直接修改記錄的欄位 (例如申報狀態) 後必須呼叫。
+        """
+        self._date_index = None
+        self._views = {}
+        self._indexed_source = None
+
+    def _ensure_index(self):
+        """unified_records 變動後重建日期索引"""
+        records = self.unified_records
+        if (
+            self._date_index is not None
+            and self._indexed_source is records
+            and self._indexed_length == len(records)
+        ):
+            return
+
+        index: Dict[str, UnifiedOvertimeRecord] = {}
+        for record in records:
+            index.setdefault(record.date, record)
+        self._date_index = index
+        self._views = {}
+        self._indexed_source = records
+        self._indexed_length = len(records)
+
+    def _view(
+        self, name: str, predicate: Callable[[UnifiedOvertimeRecord], bool]
+    ) -> List[UnifiedOvertimeRecord]:
+        """取得分類檢視 (首次查詢時建立)"""
+        self._ensure_index()
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = [r for r in self.unified_records if predicate(r)]
+        return view
 
     def __str__(self) -> str:
         """字串表示"""
@@ -5,9 +5,17 @@
 """
 
 from .attendance_parser import AttendanceParser
+from .html_document import HtmlDocument
 from .personal_record_parser import PersonalRecordParser
+from .postback_state import PostbackState, extract_hidden_fields
+from .stream_parser import StreamAttendanceParser, StreamPersonalRecordParser
 
 __all__ = [
     "AttendanceParser",
+    "HtmlDocument",
     "PersonalRecordParser",
+    "PostbackState",
+    "StreamAttendanceParser",
+    "StreamPersonalRecordParser",
+    "extract_hidden_fields",
 ]
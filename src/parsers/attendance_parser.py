@@ -9,10 +9,10 @@
 
 import logging
 import re
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import Iterable, List, Dict, Optional, Union
 
 from ..models import PunchRecord, LeaveRecord, AttendanceQuota
+from .html_document import HtmlDocument
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +30,12 @@ class AttendanceParser:
     設計原則:
     - SRP: 只負責 HTML → 資料模型轉換
     - DRY: 共用表格查找與row處理邏輯
+    - 效能: 接受 HtmlDocument,同一頁面只需建立一次 DOM
     - Fail-safe: 解析失敗時返回空列表而非拋出異常
     """
 
     @staticmethod
-    def parse_punch_records(html: str) -> List[PunchRecord]:
+    def parse_punch_records(html: Union[str, HtmlDocument]) -> List[PunchRecord]:
         """
         解析打卡記錄表格
         
@@ -46,7 +47,7 @@ class AttendanceParser:
         </tr>
         
         Args:
-            html: FW99001Z.aspx#tabs-1 的 HTML 內容
+            html: FW99001Z.aspx#tabs-1 的 HTML 內容或已解析的 HtmlDocument
             
         Returns:
             List[PunchRecord]: 打卡記錄列表
@@ -56,46 +57,18 @@ class AttendanceParser:
             - 自動合併為 PunchRecord.punch_times 列表
             - 支援分頁表格 (自動跳過 PagerStyle row)
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
+        document = HtmlDocument.ensure(html)
+
         # 查找打卡表格
-        table = soup.find("table", id="ContentPlaceHolder1_gvNotes005")
+        table = document.find_table("ContentPlaceHolder1_gvNotes005")
         if not table:
             logger.warning("找不到打卡表格 (gvNotes005)")
             return []
-        
-        # 解析資料列
-        rows = table.find_all("tr")
-        punch_data: Dict[str, List[str]] = {}  # {date: [punch_times]}
-        
-        for row in rows:
-            # 跳過表頭和分頁
-            if row.find("th") or AttendanceParser._is_pager_row(row):
-                continue
-            
-            cells = row.find_all("td")
-            if len(cells) < 2:
-                continue
-            
-            date = cells[0].get_text(strip=True)
-            punch_time = cells[1].get_text(strip=True)
-            
-            if date and punch_time:
-                if date not in punch_data:
-                    punch_data[date] = []
-                punch_data[date].append(punch_time)
-        
-        # 轉換為 PunchRecord
-        records = [
-            PunchRecord(date=date, punch_times=sorted(times))
-            for date, times in punch_data.items()
-        ]
-        
-        logger.info("解析打卡記錄: %d 個日期, 共 %d 筆打卡", len(records), sum(len(r.punch_times) for r in records))
-        return records
+
+        return AttendanceParser._parse_punch_rows(table.find_all("tr"))
 
     @staticmethod
-    def parse_leave_records(html: str) -> List[LeaveRecord]:
+    def parse_leave_records(html: Union[str, HtmlDocument]) -> List[LeaveRecord]:
         """
         解析假別統計表格
         
@@ -110,7 +83,7 @@ class AttendanceParser:
         </tr>
         
         Args:
-            html: FW99001Z.aspx#tabs-1 的 HTML 內容
+            html: FW99001Z.aspx#tabs-1 的 HTML 內容或已解析的 HtmlDocument
             
         Returns:
             List[LeaveRecord]: 假別記錄列表
@@ -119,49 +92,18 @@ class AttendanceParser:
             - 天數和小時需分別提取 (使用 span id)
             - 支援 "X 天" 和 "X 小時" 格式
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
+        document = HtmlDocument.ensure(html)
+
         # 查找假別表格
-        table = soup.find("table", id="ContentPlaceHolder1_gvNotes011")
+        table = document.find_table("ContentPlaceHolder1_gvNotes011")
         if not table:
             logger.warning("找不到假別表格 (gvNotes011)")
             return []
-        
-        # 解析資料列
-        rows = table.find_all("tr")
-        records = []
-        
-        for row in rows:
-            # 跳過表頭
-            if row.find("th"):
-                continue
-            
-            cells = row.find_all("td")
-            if len(cells) < 2:
-                continue
-            
-            # 假別名稱
-            leave_type = cells[0].get_text(strip=True)
-            
-            # 天數和小時 (從 span 中提取)
-            day_span = cells[1].find("span", id=re.compile(r"lblAbsenceDay"))
-            hour_span = cells[1].find("span", id=re.compile(r"lblAbsenceHour"))
-            
-            days = AttendanceParser._extract_number(day_span.get_text() if day_span else "0 天")
-            hours = AttendanceParser._extract_number(hour_span.get_text() if hour_span else "0 小時")
-            
-            if leave_type and (days > 0 or hours > 0):
-                records.append(LeaveRecord(
-                    leave_type=leave_type,
-                    days=days,
-                    hours=hours
-                ))
-        
-        logger.info("解析假別記錄: %d 筆", len(records))
-        return records
+
+        return AttendanceParser._parse_leave_rows(table.find_all("tr"))
 
     @staticmethod
-    def parse_quota(html: str) -> Optional[AttendanceQuota]:
+    def parse_quota(html: Union[str, HtmlDocument]) -> Optional[AttendanceQuota]:
         """
         解析剩餘額度表格
         
@@ -184,7 +126,7 @@ class AttendanceParser:
         </tr>
         
         Args:
-            html: FW99001Z.aspx#tabs-1 的 HTML 內容
+            html: FW99001Z.aspx#tabs-1 的 HTML 內容或已解析的 HtmlDocument
             
         Returns:
             AttendanceQuota | None: 額度資訊,找不到表格時返回 None
@@ -193,16 +135,128 @@ class AttendanceParser:
             - 只提取 "目前特休剩餘" 和 "目前調休剩餘"
             - "未達加班換休最低申請時限" 轉換為分鐘數
         """
-        soup = BeautifulSoup(html, "html.parser")
-        
+        document = HtmlDocument.ensure(html)
+
         # 查找額度表格
-        table = soup.find("table", id="ContentPlaceHolder1_dvNotes019")
+        table = document.find_table("ContentPlaceHolder1_dvNotes019")
         if not table:
             logger.warning("找不到額度表格 (dvNotes019)")
             return None
+
+        return AttendanceParser._parse_quota_rows(table.find_all("tr"))
+
+    @staticmethod
+    def parse_anomaly_records(html: Union[str, HtmlDocument]) -> List[Dict]:
+        """
+        解析出勤異常表格
         
-        # 解析資料列
-        rows = table.find_all("tr")
+        表格 ID: ContentPlaceHolder1_gvWeb012
+        表格結構:
+        <tr class="RowStyle|AlternatingRowStyle_update">
+            <td>
+                <span id="...lblWork_Date_0">2025/11/28</span><br>
+                <span id="...lblCard_Time_0">&nbsp;&nbsp;09:00:15~19:31:09&nbsp;&nbsp;</span>
+            </td>
+            <td><span id="...lblLose_Manhour_0">0</span></td>
+            <td>下班刷卡超出正常下班時刻</td>
+            <td>...</td>
+        </tr>
+        
+        Args:
+            html: FW99001Z.aspx#tabs-2 的 HTML 內容或已解析的 HtmlDocument
+            
+        Returns:
+            List[Dict]: 異常記錄列表
+                [{
+                    'date': 'YYYY/MM/DD',
+                    'punch_range': 'HH:MM:SS~HH:MM:SS',
+                    'description': '下班刷卡超出正常下班時刻'
+                }]
+            
+        Notes:
+            - 用於標記 UnifiedOvertimeRecord.has_anomaly
+            - 僅提取必要欄位 (不解析按鈕)
+        """
+        document = HtmlDocument.ensure(html)
+
+        # 查找異常表格
+        table = document.find_table("ContentPlaceHolder1_gvWeb012")
+        if not table:
+            logger.warning("找不到異常表格 (gvWeb012)")
+            return []
+
+        return AttendanceParser._parse_anomaly_rows(table.find_all("tr"))
+
+    # === 資料列解析 (BeautifulSoup 與串流後端共用) ===
+
+    @staticmethod
+    def _parse_punch_rows(rows: Iterable) -> List[PunchRecord]:
+        """解析打卡表格資料列"""
+        punch_data: Dict[str, List[str]] = {}  # {date: [punch_times]}
+        
+        for row in rows:
+            # 跳過表頭和分頁
+            if row.find("th") or AttendanceParser._is_pager_row(row):
+                continue
+            
+            cells = row.find_all("td")
+            if len(cells) < 2:
+                continue
+            
+            date = cells[0].get_text(strip=True)
+            punch_time = cells[1].get_text(strip=True)
+            
+            if date and punch_time:
+                if date not in punch_data:
+                    punch_data[date] = []
+                punch_data[date].append(punch_time)
+        
+        # 轉換為 PunchRecord
+        records = [
+            PunchRecord(date=date, punch_times=sorted(times))
+            for date, times in punch_data.items()
+        ]
+        
+        logger.info("解析打卡記錄: %d 個日期, 共 %d 筆打卡", len(records), sum(len(r.punch_times) for r in records))
+        return records
+
+    @staticmethod
+    def _parse_leave_rows(rows: Iterable) -> List[LeaveRecord]:
+        """解析假別表格資料列"""
+        records = []
+        
+        for row in rows:
+            # 跳過表頭
+            if row.find("th"):
+                continue
+            
+            cells = row.find_all("td")
+            if len(cells) < 2:
+                continue
+            
+            # 假別名稱
+            leave_type = cells[0].get_text(strip=True)
+            
+            # 天數和小時 (從 span 中提取)
+            day_span = cells[1].find("span", id=re.compile(r"lblAbsenceDay"))
+            hour_span = cells[1].find("span", id=re.compile(r"lblAbsenceHour"))
+            
+            days = AttendanceParser._extract_number(day_span.get_text() if day_span else "0 天")
+            hours = AttendanceParser._extract_number(hour_span.get_text() if hour_span else "0 小時")
+            
+            if leave_type and (days > 0 or hours > 0):
+                records.append(LeaveRecord(
+                    leave_type=leave_type,
+                    days=days,
+                    hours=hours
+                ))
+        
+        logger.info("解析假別記錄: %d 筆", len(records))
+        return records
+
+    @staticmethod
+    def _parse_quota_rows(rows: Iterable) -> AttendanceQuota:
+        """解析額度表格資料列"""
         annual_leave = 0
         compensatory_leave = 0
         overtime_threshold_minutes = 0
@@ -240,47 +294,8 @@ class AttendanceParser:
         return quota
 
     @staticmethod
-    def parse_anomaly_records(html: str) -> List[Dict]:
-        """
-        解析出勤異常表格
-        
-        表格 ID: ContentPlaceHolder1_gvWeb012
-        表格結構:
-        <tr class="RowStyle|AlternatingRowStyle_update">
-            <td>
-                <span id="...lblWork_Date_0">2025/11/28</span><br>
-                <span id="...lblCard_Time_0">&nbsp;&nbsp;09:00:15~19:31:09&nbsp;&nbsp;</span>
-            </td>
-            <td><span id="...lblLose_Manhour_0">0</span></td>
-            <td>下班刷卡超出正常下班時刻</td>
-            <td>...</td>
-        </tr>
-        
-        Args:
-            html: FW99001Z.aspx#tabs-2 的 HTML 內容
-            
-        Returns:
-            List[Dict]: 異常記錄列表
-                [{
-                    'date': 'YYYY/MM/DD',
-                    'punch_range': 'HH:MM:SS~HH:MM:SS',
-                    'description': '下班刷卡超出正常下班時刻'
-                }]
-            
-        Notes:
-            - 用於標記 UnifiedOvertimeRecord.has_anomaly
-            - 僅提取必要欄位 (不解析按鈕)
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # 查找異常表格
-        table = soup.find("table", id="ContentPlaceHolder1_gvWeb012")
-        if not table:
-            logger.warning("找不到異常表格 (gvWeb012)")
-            return []
-        
-        # 解析資料列
-        rows = table.find_all("tr")
+    def _parse_anomaly_rows(rows: Iterable) -> List[Dict]:
+        """解析異常表格資料列"""
         records = []
         
         for row in rows:
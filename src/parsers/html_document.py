@@ -0,0 +1,76 @@
+"""已解析的 HTML 頁面模型
+
+同一個 SSP 頁面 (例如 FW99001Z.aspx) 包含多個表格,
+各解析方法若各自建立 BeautifulSoup 會導致同一頁面被重複解析。
+HtmlDocument 只建立一次 DOM,之後以表格 id 查詢並快取結果。
+"""
+
+from typing import Any, Dict, Optional, Union
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+
+class HtmlDocument:
+    """
+    已解析的 HTML 頁面
+
+    使用方式:
+        ```python
+        document = HtmlDocument(html)
+        punch_records = AttendanceParser.parse_punch_records(document)
+        anomaly_records = AttendanceParser.parse_anomaly_records(document)
+        ```
+
+    設計原則:
+    - DRY: 一個頁面只建立一次 DOM
+    - 相容: 解析器同時接受原始 HTML 字串與 HtmlDocument
+    """
+
+    def __init__(self, html: str):
+        """
+        建立已解析頁面
+
+        Args:
+            html: 頁面 HTML 內容
+        """
+        self.html = html
+        self._soup: Optional[BeautifulSoup] = None
+        self._tables: Dict[str, Optional[Tag]] = {}
+        # 串流解析後端的表格解析結果 (表格 id → 結果,由 StreamAttendanceParser 填入)
+        self.stream_tables: Optional[Dict[str, Any]] = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup DOM (首次存取時才建立,串流解析後端不會觸發)"""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "html.parser")
+        return self._soup
+
+    @classmethod
+    def ensure(cls, source: Union[str, "HtmlDocument"]) -> "HtmlDocument":
+        """
+        將 HTML 字串轉換為 HtmlDocument (已是 HtmlDocument 則直接返回)
+
+        Args:
+            source: HTML 字串或已解析頁面
+
+        Returns:
+            HtmlDocument: 已解析頁面
+        """
+        if isinstance(source, cls):
+            return source
+        return cls(source)
+
+    def find_table(self, table_id: str) -> Optional[Tag]:
+        """
+        依 id 查詢表格 (結果會快取,重複查詢不再掃描 DOM)
+
+        Args:
+            table_id: 表格 id (例如 ContentPlaceHolder1_gvNotes005)
+
+        Returns:
+            Tag | None: 表格元素,找不到時返回 None
+        """
+        if table_id not in self._tables:
+            self._tables[table_id] = self.soup.find("table", id=table_id)
+        return self._tables[table_id]
@@ -5,8 +5,9 @@
 """
 
 import logging
-from typing import List, Dict
-from bs4 import BeautifulSoup
+from typing import Iterable, List, Dict, Union
+
+from .html_document import HtmlDocument
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,11 @@ class PersonalRecordParser:
     - 與 PersonalRecordService 相容,可直接替換 _parse_personal_records_table
     """
 
+    # 資料列樣式 (表頭與分頁列不含這些樣式)
+    DATA_ROW_CLASSES = ("RowStyle", "AlternatingRowStyle_update")
+
     @staticmethod
-    def parse_records(html: str) -> List[Dict]:
+    def parse_records(html: Union[str, HtmlDocument]) -> List[Dict]:
         """
         解析個人加班記錄表格
 
@@ -51,7 +55,7 @@ class PersonalRecordParser:
         </tr>
 
         Args:
-            html: FW21003Z.aspx 的 HTML 內容
+            html: FW21003Z.aspx 的 HTML 內容或已解析的 HtmlDocument
 
         Returns:
             List[Dict]: 記錄列表
@@ -70,16 +74,31 @@ class PersonalRecordParser:
             - title 屬性包含完整內容 (優先使用)
             - 使用 ddlPage=9999 參數避免換頁問題
         """
-        soup = BeautifulSoup(html, "html.parser")
+        document = HtmlDocument.ensure(html)
 
         # 查找表格
-        table = soup.find("table", id="ContentPlaceHolder1_gvFlow211")
+        table = document.find_table("ContentPlaceHolder1_gvFlow211")
         if not table:
             logger.warning("找不到個人記錄表格 (gvFlow211)")
             return []
 
         # 解析資料列
-        rows = table.find_all("tr", class_=["RowStyle", "AlternatingRowStyle_update"])
+        rows = table.find_all("tr", class_=list(PersonalRecordParser.DATA_ROW_CLASSES))
+        return PersonalRecordParser._parse_record_rows(rows)
+
+    # === 資料列解析 (BeautifulSoup 與串流後端共用) ===
+
+    @staticmethod
+    def _parse_record_rows(rows: Iterable) -> List[Dict]:
+        """
+        解析個人記錄資料列
+
+        Args:
+            rows: 資料列 (僅包含 RowStyle / AlternatingRowStyle_update)
+
+        Returns:
+            List[Dict]: 記錄列表 (格式同 parse_records)
+        """
         records = []
 
         for index, row in enumerate(rows):
@@ -0,0 +1,152 @@
+"""ASP.NET PostBack 隱藏欄位擷取
+
+SSP 頁面每次 PostBack 都必須帶回 __VIEWSTATE / __VIEWSTATEGENERATOR /
+__EVENTVALIDATION,其中 ViewState 可達數百 KB。
+為了讀這三個欄位而把整份頁面建成 BeautifulSoup DOM 成本過高,
+本模組直接在原始回應 (bytes 或 str) 上以正規表示式定位 <input> 標籤,
+不建立 DOM。
+"""
+
+import html as html_lib
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+_FIELD_NAMES = ("__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION")
+
+# 以字面字串開頭的樣式,re 可快速跳到候選位置;
+# ViewState 值本身只以 str.find / bytes.find 掃描 (不經過正規表示式)
+_NAME_PATTERN = r"name\s*=\s*([\"'])(__VIEWSTATE|__VIEWSTATEGENERATOR|__EVENTVALIDATION)\1"
+_VALUE_PATTERN = r"value\s*=\s*([\"'])"
+
+_STR_NAME = re.compile(_NAME_PATTERN)
+_STR_VALUE = re.compile(_VALUE_PATTERN, re.IGNORECASE)
+_BYTES_NAME = re.compile(_NAME_PATTERN.encode())
+_BYTES_VALUE = re.compile(_VALUE_PATTERN.encode(), re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class PostbackState:
+    """
+    PostBack 所需的隱藏欄位
+
+    使用方式:
+        ```python
+        state = PostbackState.from_html(response.content)
+        if state is None:
+            raise ValueError("找不到 ViewState")
+
+        form_data = state.to_form("ctl00$ContentPlaceHolder1$gvWeb012", "Page$2")
+        response = session.post(url, data=form_data)
+        ```
+    """
+
+    viewstate: str
+    viewstate_generator: str = ""
+    event_validation: str = ""
+
+    @classmethod
+    def from_html(cls, source: Union[str, bytes]) -> Optional["PostbackState"]:
+        """
+        從原始頁面擷取隱藏欄位 (不建立 DOM)
+
+        Args:
+            source: 頁面內容 (response.content 或 response.text)
+
+        Returns:
+            PostbackState | None: 找不到 __VIEWSTATE 時返回 None
+        """
+        fields = extract_hidden_fields(source)
+        if "__VIEWSTATE" not in fields:
+            return None
+        return cls(
+            viewstate=fields["__VIEWSTATE"],
+            viewstate_generator=fields.get("__VIEWSTATEGENERATOR", ""),
+            event_validation=fields.get("__EVENTVALIDATION", ""),
+        )
+
+    def to_form(
+        self, event_target: Optional[str] = None, event_argument: str = ""
+    ) -> Dict[str, str]:
+        """
+        轉換為 PostBack 表單資料
+
+        Args:
+            event_target: __EVENTTARGET (None 表示一般按鈕送出,不帶事件欄位)
+            event_argument: __EVENTARGUMENT
+
+        Returns:
+            Dict[str, str]: 表單資料 (可再加入其他欄位)
+        """
+        form = {}
+        if event_target is not None:
+            form["__EVENTTARGET"] = event_target
+            form["__EVENTARGUMENT"] = event_argument
+        form["__VIEWSTATE"] = self.viewstate
+        form["__VIEWSTATEGENERATOR"] = self.viewstate_generator
+        form["__EVENTVALIDATION"] = self.event_validation
+        return form
+
+
+def extract_hidden_fields(source: Union[str, bytes]) -> Dict[str, str]:
+    """
+    擷取 __VIEWSTATE / __VIEWSTATEGENERATOR / __EVENTVALIDATION
+
+    同名欄位只取第一個 (與 BeautifulSoup.find 相同);值會做 HTML 實體解碼。
+
+    Args:
+        source: 頁面內容 (bytes 以 UTF-8 解碼欄位值)
+
+    Returns:
+        Dict[str, str]: {欄位名稱: 值},頁面沒有的欄位不會出現
+    """
+    is_bytes = isinstance(source, (bytes, bytearray))
+    name_pattern = _BYTES_NAME if is_bytes else _STR_NAME
+    value_pattern = _BYTES_VALUE if is_bytes else _STR_VALUE
+    tag_open, tag_close = (b"<", b">") if is_bytes else ("<", ">")
+
+    fields: Dict[str, str] = {}
+    for match in name_pattern.finditer(source):
+        name = match.group(2).decode("ascii") if is_bytes else match.group(2)
+        if name in fields or not _is_attribute_start(source, match.start()):
+            continue
+
+        # 所在標籤須為 <input ...>
+        tag_start = source.rfind(tag_open, 0, match.start())
+        tag_end = source.find(tag_close, match.end())
+        if tag_start < 0 or tag_end < 0:
+            continue
+        if source[tag_start + 1 : tag_start + 6].lower() != (
+            b"input" if is_bytes else "input"
+        ):
+            continue
+
+        value = _find_value(source, value_pattern, tag_start, tag_end)
+        if is_bytes:
+            value = value.decode("utf-8", errors="replace")
+        fields[name] = html_lib.unescape(value) if "&" in value else value
+
+        if len(fields) == len(_FIELD_NAMES):
+            break
+    return fields
+
+
+def _is_attribute_start(source: Union[str, bytes], position: int) -> bool:
+    """position 前一個字元是否為空白 (排除 data-name= 之類的屬性)"""
+    return position > 0 and source[position - 1 : position].isspace()
+
+
+def _find_value(source, value_pattern, tag_start: int, tag_end: int):
+    """在標籤範圍內尋找 value 屬性 (找不到時返回空值)"""
+    position = tag_start
+    while True:
+        match = value_pattern.search(source, position, tag_end)
+        if not match:
+            return source[0:0]
+        if _is_attribute_start(source, match.start()):
+            quote = match.group(1)
+            value_end = source.find(quote, match.end(), tag_end)
+            if value_end < 0:
+                return source[0:0]
+            return source[match.end() : value_end]
+        position = match.end()
@@ -0,0 +1,442 @@
+"""串流式 GridView 表格解析器
+
+以 html.parser.HTMLParser 事件驅動方式單次走訪 HTML,
+只保留目標表格「目前這一列」的資料,不建立整份頁面的 DOM。
+
+適用場景:
+- FW21003Z.aspx (ddlPage=9999) 的 gvFlow211 可能有數千列
+- BeautifulSoup 對每列執行多次 id 查詢 (子樹掃描),成本為 列數 × 欄位數
+
+資料列以 StreamElement 表示,提供與 bs4 Tag 相容的最小介面
+(find / find_all / get / get_text),因此可直接套用
+AttendanceParser / PersonalRecordParser 既有的資料列解析邏輯,
+兩種後端輸出完全一致。
+"""
+
+import logging
+from collections import deque
+from html.parser import HTMLParser
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..models import PunchRecord, LeaveRecord, AttendanceQuota
+from .attendance_parser import AttendanceParser
+from .html_document import HtmlDocument
+from .personal_record_parser import PersonalRecordParser
+
+logger = logging.getLogger(__name__)
+
+# 需要追蹤的標籤 (其餘標籤只貢獻文字內容)
+_TRACKED_TAGS = frozenset({"table", "tr", "td", "th", "span"})
+
+# 每次餵給 tokenizer 的字元數
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamElement:
+    """
+    串流解析出的元素 (tr / td / th / span)
+
+    只記錄解析器需要的資訊: 屬性、文字片段、子孫元素 (依標籤分類)。
+    """
+
+    __slots__ = ("tag", "attrs", "texts", "closed", "_descendants", "_ids")
+
+    def __init__(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        self.tag = tag
+        self.attrs: Dict[str, str] = {name: value or "" for name, value in attrs}
+        self.texts: List[str] = []
+        self.closed = False
+        self._descendants: Dict[str, List["StreamElement"]] = {}
+        self._ids: Dict[Tuple[str, str], "StreamElement"] = {}
+
+    def add_descendant(self, element: "StreamElement"):
+        """登記子孫元素 (依文件順序)"""
+        self._descendants.setdefault(element.tag, []).append(element)
+        element_id = element.attrs.get("id")
+        if element_id:
+            self._ids.setdefault((element.tag, element_id), element)
+
+    # === bs4 Tag 相容介面 ===
+
+    def get(self, key: str, default=None):
+        """取得屬性 (class 屬性與 bs4 相同,返回列表)"""
+        if key not in self.attrs:
+            return default
+        if key == "class":
+            return self.attrs[key].split()
+        return self.attrs[key]
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        """取得文字內容 (strip=True 時與 bs4 相同: 逐段去除空白並略過空段)"""
+        if strip:
+            return separator.join(text.strip() for text in self.texts if text.strip())
+        return separator.join(self.texts)
+
+    def find(
+        self,
+        name: str,
+        id: Union[str, Pattern, None] = None,  # pylint: disable=redefined-builtin
+    ) -> Optional["StreamElement"]:
+        """查找第一個符合的子孫元素 (id 可為字串或正規表示式)"""
+        if isinstance(id, str):
+            return self._ids.get((name, id))
+
+        for element in self._descendants.get(name, ()):
+            if id is None:
+                return element
+            element_id = element.attrs.get("id")
+            if element_id is not None and id.search(element_id):
+                return element
+        return None
+
+    def find_all(self, name: str) -> List["StreamElement"]:
+        """查找所有符合標籤的子孫元素"""
+        return list(self._descendants.get(name, ()))
+
+
+class _TableTokenizer(HTMLParser):
+    """
+    事件驅動的表格 tokenizer
+
+    - 不在目標表格內時忽略所有事件
+    - 表格內只追蹤 tr / td / th / span 的開啟堆疊
+    - 子孫元素只登記在目前資料列 (最外層開啟的 tr) 及其子孫上,
+      表格本身不保留任何元素參照,取出的資料列即可釋放
+    - 資料列依開始順序排隊,關閉後才可取出 (與 bs4 find_all 順序一致)
+    - 所有目標表格都結束後不再處理後續內容
+    """
+
+    def __init__(self, table_ids: Iterable[str]):
+        super().__init__(convert_charrefs=True)
+        self.table_ids = frozenset(table_ids)
+        self.found: Set[str] = set()
+        self.done: Set[str] = set()
+        self.finished = False
+        self._table_id: Optional[str] = None  # 目前所在的目標表格
+        self._stack: List[StreamElement] = []
+        self._row_depth: Optional[int] = None  # 目前資料列在堆疊中的位置
+        self._rows: Dict[str, Deque[StreamElement]] = {}
+        self._discarded: Set[str] = set()
+        self._pending_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.finished:
+            return
+        self._flush_text()
+
+        if self._table_id is None:
+            if tag == "table":
+                table_id = dict(attrs).get("id")
+                if table_id in self.table_ids and table_id not in self.found:
+                    self._table_id = table_id
+                    self.found.add(table_id)
+                    self._rows[table_id] = deque()
+                    self._stack.append(StreamElement(tag, attrs))
+            return
+
+        if tag not in _TRACKED_TAGS:
+            return
+
+        element = StreamElement(tag, attrs)
+        if tag != "table" and self._row_depth is not None:
+            for open_element in self._stack[self._row_depth :]:
+                open_element.add_descendant(element)
+        if tag == "tr":
+            if self._table_id not in self._discarded:
+                self._rows[self._table_id].append(element)
+            if self._row_depth is None:
+                self._row_depth = len(self._stack)
+        self._stack.append(element)
+
+    def handle_endtag(self, tag):
+        if self._table_id is None or self.finished:
+            return
+        self._flush_text()
+
+        if tag not in _TRACKED_TAGS:
+            return
+
+        # 關閉至最近一個同名元素 (與 bs4 html.parser 行為相同)
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position].tag == tag:
+                break
+        else:
+            return
+
+        for element in self._stack[position:]:
+            element.closed = True
+        del self._stack[position:]
+        if self._row_depth is not None and position <= self._row_depth:
+            self._row_depth = None
+
+        if not self._stack:
+            self.done.add(self._table_id)
+            self._table_id = None
+            if self.done == self.table_ids:
+                self.finished = True
+
+    def handle_data(self, data):
+        if self._table_id is not None and not self.finished:
+            self._pending_text.append(data)
+
+    def handle_comment(self, data):
+        # 註解不屬於文字內容,但會分隔前後的文字節點
+        self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        for element in self._stack:
+            element.closed = True
+        self._stack.clear()
+        self._row_depth = None
+        self._table_id = None
+        self.done = set(self.found)
+        self.finished = True
+
+    def pop_ready_rows(self, table_id: str) -> Iterator[StreamElement]:
+        """取出指定表格已關閉的資料列 (取出後 tokenizer 不再保留)"""
+        rows = self._rows.get(table_id)
+        while rows and rows[0].closed:
+            yield rows.popleft()
+
+    def discard(self, table_id: str):
+        """不再保留指定表格的資料列 (已讀取完畢或不再需要)"""
+        self._discarded.add(table_id)
+        self._rows.pop(table_id, None)
+
+    def _flush_text(self):
+        """將累積的文字片段寫入所有開啟中的元素 (同一文字節點只寫入一次)"""
+        if not self._pending_text:
+            return
+        text = "".join(self._pending_text)
+        self._pending_text.clear()
+        for element in self._stack:
+            if element.tag != "table":
+                element.texts.append(text)
+
+
+class _PageReader:
+    """
+    分段餵入 HTML 並依表格取出資料列
+
+    同一頁面的多個表格共用一個 tokenizer,頁面只走訪一次。
+    依文件順序讀取表格時,只會保留目前這一列。
+    """
+
+    def __init__(
+        self,
+        html: Union[str, HtmlDocument],
+        table_ids: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self._html = html.html if isinstance(html, HtmlDocument) else html
+        self._chunk_size = chunk_size
+        self._offset = 0
+        self._closed = False
+        self._tokenizer = _TableTokenizer(table_ids)
+
+    def locate(self, table_id: str) -> bool:
+        """讀取至指定表格開始處,返回是否找到"""
+        while table_id not in self._tokenizer.found and self._feed_next():
+            pass
+        return table_id in self._tokenizer.found
+
+    def rows(self, table_id: str) -> Iterator[StreamElement]:
+        """逐列產生指定表格的資料列 (結束或中途停止後不再保留該表格的資料列)"""
+        try:
+            while True:
+                yield from self._tokenizer.pop_ready_rows(table_id)
+                if table_id in self._tokenizer.done or not self._feed_next():
+                    yield from self._tokenizer.pop_ready_rows(table_id)
+                    return
+        finally:
+            self._tokenizer.discard(table_id)
+
+    def _feed_next(self) -> bool:
+        """餵入下一段 HTML,已無內容時結束 tokenizer 並返回 False"""
+        if self._closed:
+            return False
+
+        if self._tokenizer.finished or self._offset >= len(self._html):
+            self._tokenizer.close()
+            self._closed = True
+            return False
+
+        chunk = self._html[self._offset : self._offset + self._chunk_size]
+        self._offset += self._chunk_size
+        self._tokenizer.feed(chunk)
+        return True
+
+
+class TableRowStream:
+    """
+    串流讀取指定表格的資料列
+
+    使用方式:
+        ```python
+        stream = TableRowStream(html, "ContentPlaceHolder1_gvFlow211")
+        if stream.locate():
+            for row in stream:
+                ...
+        ```
+    """
+
+    def __init__(
+        self,
+        html: Union[str, HtmlDocument],
+        table_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self._table_id = table_id
+        self._page = _PageReader(html, [table_id], chunk_size)
+
+    def locate(self) -> bool:
+        """
+        讀取至目標表格開始處
+
+        Returns:
+            bool: 是否找到目標表格
+        """
+        return self._page.locate(self._table_id)
+
+    def __iter__(self) -> Iterator[StreamElement]:
+        return self._page.rows(self._table_id)
+
+
+class StreamAttendanceParser(AttendanceParser):
+    """
+    串流式出勤頁面解析器
+
+    與 AttendanceParser 介面與輸出相同,但不建立 DOM。
+    傳入 HtmlDocument 時只使用其原始 HTML,不會觸發 DOM 建立;
+    第一次解析時單次走訪頁面解析全部四個表格,結果快取於 HtmlDocument。
+    """
+
+    # 出勤頁面的表格 (文件順序) 與資料列解析方法
+    TABLES = (
+        ("ContentPlaceHolder1_gvNotes005", "_parse_punch_rows"),
+        ("ContentPlaceHolder1_gvNotes011", "_parse_leave_rows"),
+        ("ContentPlaceHolder1_dvNotes019", "_parse_quota_rows"),
+        ("ContentPlaceHolder1_gvWeb012", "_parse_anomaly_rows"),
+    )
+
+    @staticmethod
+    def parse_punch_records(html: Union[str, HtmlDocument]) -> List[PunchRecord]:
+        """串流解析打卡記錄表格 (gvNotes005)"""
+        found, records = StreamAttendanceParser._parse_table(
+            html, "ContentPlaceHolder1_gvNotes005", "_parse_punch_rows"
+        )
+        if not found:
+            logger.warning("找不到打卡表格 (gvNotes005)")
+            return []
+        return records
+
+    @staticmethod
+    def parse_leave_records(html: Union[str, HtmlDocument]) -> List[LeaveRecord]:
+        """串流解析假別統計表格 (gvNotes011)"""
+        found, records = StreamAttendanceParser._parse_table(
+            html, "ContentPlaceHolder1_gvNotes011", "_parse_leave_rows"
+        )
+        if not found:
+            logger.warning("找不到假別表格 (gvNotes011)")
+            return []
+        return records
+
+    @staticmethod
+    def parse_quota(html: Union[str, HtmlDocument]) -> Optional[AttendanceQuota]:
+        """串流解析剩餘額度表格 (dvNotes019)"""
+        found, quota = StreamAttendanceParser._parse_table(
+            html, "ContentPlaceHolder1_dvNotes019", "_parse_quota_rows"
+        )
+        if not found:
+            logger.warning("找不到額度表格 (dvNotes019)")
+            return None
+        return quota
+
+    @staticmethod
+    def parse_anomaly_records(html: Union[str, HtmlDocument]) -> List[Dict]:
+        """串流解析出勤異常表格 (gvWeb012)"""
+        found, records = StreamAttendanceParser._parse_table(
+            html, "ContentPlaceHolder1_gvWeb012", "_parse_anomaly_rows"
+        )
+        if not found:
+            logger.warning("找不到異常表格 (gvWeb012)")
+            return []
+        return records
+
+    @staticmethod
+    def _parse_table(
+        html: Union[str, HtmlDocument], table_id: str, parse_rows: str
+    ) -> Tuple[bool, Any]:
+        """
+        解析單一表格
+
+        HtmlDocument: 單次走訪解析四個表格並快取於文件上;
+        HTML 字串: 只串流讀取指定表格。
+
+        Returns:
+            tuple: (是否找到表格, 解析結果)
+        """
+        if isinstance(html, HtmlDocument):
+            if html.stream_tables is None:
+                html.stream_tables = StreamAttendanceParser._parse_page(html)
+            return table_id in html.stream_tables, html.stream_tables.get(table_id)
+
+        stream = TableRowStream(html, table_id)
+        if not stream.locate():
+            return False, None
+        return True, getattr(AttendanceParser, parse_rows)(stream)
+
+    @staticmethod
+    def _parse_page(document: HtmlDocument) -> Dict[str, Any]:
+        """單次走訪出勤頁面,依序解析各表格 (表格 id → 解析結果,找不到的表格不列入)"""
+        page = _PageReader(
+            document, [table_id for table_id, _ in StreamAttendanceParser.TABLES]
+        )
+        results = {}
+        for table_id, parse_rows in StreamAttendanceParser.TABLES:
+            if page.locate(table_id):
+                results[table_id] = getattr(AttendanceParser, parse_rows)(
+                    page.rows(table_id)
+                )
+        return results
+
+
+class StreamPersonalRecordParser(PersonalRecordParser):
+    """
+    串流式個人加班記錄解析器
+
+    與 PersonalRecordParser 介面與輸出相同,逐列產生資料,
+    每列的 id 查詢為字典查找而非子樹掃描。
+    """
+
+    @staticmethod
+    def parse_records(html: Union[str, HtmlDocument]) -> List[Dict]:
+        """串流解析個人加班記錄表格 (gvFlow211)"""
+        stream = TableRowStream(html, "ContentPlaceHolder1_gvFlow211")
+        if not stream.locate():
+            logger.warning("找不到個人記錄表格 (gvFlow211)")
+            return []
+
+        data_rows = (
+            row
+            for row in stream
+            if any(
+                css_class in PersonalRecordParser.DATA_ROW_CLASSES
+                for css_class in row.get("class", [])
+            )
+        )
+        return PersonalRecordParser._parse_record_rows(data_rows)
@@ -3,10 +3,20 @@
 from .auth_service import AuthService
 from .data_service import DataService
 from .export_service import ExportService
+from .exporters import RecordExporter, available_formats, register_exporter
 from .update_service import UpdateService
-from .overtime_report_service import OvertimeReportService
+from .overtime_report_service import OvertimeReportService, PreparedSubmission
+from .bulk_submission_service import (
+    BulkSubmissionProgress,
+    BulkSubmissionResult,
+    BulkSubmissionService,
+)
+from .submission_journal import SubmissionJournal
 from .template_manager import TemplateManager
 from .data_sync_service import DataSyncService
+from .team_sync_service import AccountSyncResult, TeamSyncResult, TeamSyncService
+from .snapshot_store import SnapshotStore
+from .async_client import EventLoopThread
 
 # 已棄用的服務 (保留以維持向後相容,將於 v2.0.0 移除)
 from .overtime_status_service import OvertimeStatusService
@@ -16,9 +26,22 @@ __all__ = [
     "AuthService",
     "DataService",
     "DataSyncService",  # ✅ 推薦使用
+    "TeamSyncService",
+    "TeamSyncResult",
+    "AccountSyncResult",
+    "SnapshotStore",
+    "EventLoopThread",
     "ExportService",
+    "RecordExporter",
+    "register_exporter",
+    "available_formats",
     "UpdateService",
     "OvertimeReportService",
+    "PreparedSubmission",
+    "BulkSubmissionService",
+    "BulkSubmissionProgress",
+    "BulkSubmissionResult",
+    "SubmissionJournal",
     "TemplateManager",
     # 以下已棄用,請使用 DataSyncService
     "OvertimeStatusService",  # [已棄用] 使用 DataSyncService
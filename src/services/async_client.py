@@ -0,0 +1,90 @@
+"""長駐事件迴圈執行緒
+
+以「一條長駐事件迴圈執行緒 + 固定大小的 I/O 執行緒池」取代每個操作
+各自建立 threading.Thread 的模式:
+- 事件迴圈只建立一次,整個應用程式共用
+- 阻塞的服務呼叫 (登入、同步、送出) 在固定的執行緒池中執行 (共用 AuthService 的連線池)
+- 同一個執行緒池也注入 DataSyncService / DataService,作為平行抓取與背景更新的執行緒池
+
+UI 端透過 ui.async_bridge.TkAsyncBridge 將結果以 after() 送回 Tk 主執行緒。
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Coroutine
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopThread:
+    """
+    長駐事件迴圈執行緒
+
+    使用方式:
+        ```python
+        loop_thread = EventLoopThread(max_workers=4)
+        future = loop_thread.submit(coro)  # concurrent.futures.Future
+        result = future.result()
+        loop_thread.stop()
+        ```
+    """
+
+    def __init__(self, max_workers: int = 4, name: str = "ssp-event-loop"):
+        """
+        啟動事件迴圈執行緒
+
+        Args:
+            max_workers: 阻塞 I/O 執行緒池大小 (asyncio.to_thread 使用)
+            name: 執行緒名稱
+        """
+        self._loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-io"
+        )
+        self._loop.set_default_executor(self._executor)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """事件迴圈"""
+        return self._loop
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """阻塞 I/O 執行緒池 (與 run_blocking / asyncio.to_thread 共用)"""
+        return self._executor
+
+    @property
+    def is_running(self) -> bool:
+        """事件迴圈是否執行中"""
+        return self._thread.is_alive() and not self._loop.is_closed()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        從任意執行緒提交協程
+
+        Args:
+            coro: 要執行的協程
+
+        Returns:
+            concurrent.futures.Future: 執行結果
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(self, timeout: float = 5.0):
+        """停止事件迴圈並釋放執行緒池"""
+        if self._loop.is_closed():
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("事件迴圈已停止")
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
@@ -1,12 +1,13 @@
 """認證服務"""
 
 import requests
-from bs4 import BeautifulSoup
 import logging
 from typing import Optional
 import urllib3
 
 from ..config import Settings
+from ..parsers import PostbackState
+from .http_transport import RequestMetrics, create_session
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +17,9 @@ class AuthService:
 
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or Settings()
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-        )
+        # 連線池 + GET 重試 + 壓縮 + 請求計時 (登入、同步、申報共用同一連線池)
+        self.metrics = RequestMetrics()
+        self.session = create_session(self.settings, self.metrics)
 
         if not self.settings.VERIFY_SSL:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -46,30 +44,23 @@ class AuthService:
                 timeout=self.settings.REQUEST_TIMEOUT,
                 verify=self.settings.VERIFY_SSL,
             )
-            soup = BeautifulSoup(response.text, "html.parser")
 
-            # 提取 ASP.NET 必要的隱藏欄位
-            viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-            viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
-            event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
+            # 提取 ASP.NET 必要的隱藏欄位 (不建立 DOM)
+            postback_state = PostbackState.from_html(response.content)
 
-            if not viewstate:
+            if not postback_state:
                 logger.error("無法找到 ViewState,可能網頁結構已變更")
                 return False
 
             # 準備登入資料
-            login_data = {
-                "__VIEWSTATE": viewstate["value"],
-                "__VIEWSTATEGENERATOR": (
-                    viewstate_generator["value"] if viewstate_generator else ""
-                ),
-                "__EVENTVALIDATION": (
-                    event_validation["value"] if event_validation else ""
-                ),
-                "ctl00$lblAccount": username,
-                "ctl00$lblPassWord": password,
-                "ctl00$Submit": "送出",
-            }
+            login_data = postback_state.to_form()
+            login_data.update(
+                {
+                    "ctl00$lblAccount": username,
+                    "ctl00$lblPassWord": password,
+                    "ctl00$Submit": "送出",
+                }
+            )
 
             logger.info("正在驗證登入資訊...")
             response = self.session.post(
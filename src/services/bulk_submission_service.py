@@ -0,0 +1,365 @@
+"""加班申請分批送出服務
+
+大量記錄一次送出時,表單 (與 ViewState) 過大容易逾時,
+失敗時也無法得知哪些記錄已送達。本服務將記錄分批依序送出:
+
+- 每批以 OvertimeReportService.submit_form 送出 (_check_submission_result 判斷結果)
+- 送出前後各查詢一次個人記錄頁面,以新出現的記錄確認該批哪些記錄已送達
+  (先前已申請過的同一日期不會被誤認為本次送達)
+- SubmissionJournal 記錄每批狀態,中斷後以相同記錄重新送出可續傳,不會重複送出
+- 每批開始與結束時呼叫進度回呼 (在呼叫端的執行緒中)
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import requests
+
+from ..config import Settings
+from ..models import OvertimeSubmissionRecord
+from ..parsers.personal_record_parser import PersonalRecordParser
+from ..parsers.stream_parser import StreamPersonalRecordParser
+from .overtime_report_service import OvertimeReportService
+from .submission_journal import STATUS_IN_FLIGHT, STATUS_SUBMITTED, SubmissionJournal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkSubmissionProgress:
+    """分批送出進度"""
+
+    batch_index: int  # 目前批次 (從 1 開始,0 表示尚未開始)
+    batch_count: int
+    done_count: int  # 已確認送達 (含先前已送出而略過) 的記錄數
+    total_count: int
+    message: str = ""
+
+    @property
+    def fraction(self) -> float:
+        """完成比例 (0.0 ~ 1.0)"""
+        return self.done_count / self.total_count if self.total_count else 1.0
+
+
+@dataclass
+class BatchResult:
+    """單批送出結果"""
+
+    index: int
+    dates: List[str]
+    success: bool
+    confirmed: bool  # 該批所有記錄都已確認送達
+    error: Optional[str] = None
+    seconds: float = 0.0
+    submitted: List[str] = field(default_factory=list)  # 確認送達的日期
+    failed: List[str] = field(default_factory=list)  # 確定未送達 (可重新送出)
+    unconfirmed: List[str] = field(default_factory=list)  # 無法確認是否送達
+
+
+@dataclass
+class BulkSubmissionResult:
+    """分批送出結果"""
+
+    total_count: int
+    submitted: List[str] = field(default_factory=list)  # 本次送達的日期
+    skipped: List[str] = field(default_factory=list)  # 先前已送達而略過的日期
+    failed: List[str] = field(default_factory=list)  # 未送出 (可重新送出)
+    unconfirmed: List[str] = field(default_factory=list)  # 已送出但無法確認
+    batches: List[BatchResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """所有記錄都已送達"""
+        return not self.failed and not self.unconfirmed
+
+    @property
+    def submitted_count(self) -> int:
+        return len(self.submitted)
+
+
+class BulkSubmissionService:
+    """
+    加班申請分批送出服務
+
+    使用方式:
+        ```python
+        service = BulkSubmissionService(report_service, settings)
+        result = service.submit(session, records, progress_callback=on_progress)
+        if not result.success:
+            # 以相同記錄再次呼叫 submit 即可續傳
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        report_service: OvertimeReportService,
+        settings: Optional[Settings] = None,
+        journal: Optional[SubmissionJournal] = None,
+        status_fetcher: Optional[Callable[[requests.Session], Iterable[str]]] = None,
+    ):
+        """
+        初始化分批送出服務
+
+        Args:
+            report_service: 加班補報服務
+            settings: 應用程式設定 (預設使用 report_service.settings)
+            journal: 送出紀錄 (預設 cache/submission_journal.json)
+            status_fetcher: 查詢已申請記錄日期的函式 (每筆記錄一個日期,預設抓取個人記錄頁面)
+        """
+        self.report_service = report_service
+        self.settings = settings or report_service.settings
+        self.journal = journal or SubmissionJournal()
+        self.status_fetcher = status_fetcher or self._fetch_submitted_dates
+
+    def submit(
+        self,
+        session: requests.Session,
+        records: List[OvertimeSubmissionRecord],
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[BulkSubmissionProgress], None]] = None,
+    ) -> BulkSubmissionResult:
+        """
+        分批送出
+
+        某一批失敗或無法確認時停止,不再送出後續批次。
+
+        Args:
+            session: 已登入的 Session
+            records: 要送出的記錄列表
+            batch_size: 每批記錄數 (預設 SUBMISSION_BATCH_SIZE)
+            progress_callback: 進度回呼
+
+        Returns:
+            BulkSubmissionResult: 送出結果
+        """
+        batch_size = max(batch_size or self.settings.SUBMISSION_BATCH_SIZE, 1)
+        result = BulkSubmissionResult(total_count=len(records))
+
+        def report(batch_index: int, batch_count: int, message: str):
+            if progress_callback:
+                progress_callback(
+                    BulkSubmissionProgress(
+                        batch_index=batch_index,
+                        batch_count=batch_count,
+                        done_count=len(result.submitted) + len(result.skipped),
+                        total_count=len(records),
+                        message=message,
+                    )
+                )
+
+        pending = self._resume(session, records, result)
+        batches = [
+            pending[start : start + batch_size]
+            for start in range(0, len(pending), batch_size)
+        ]
+        logger.info(
+            "分批送出 %d 筆記錄: %d 批 (略過已送出 %d 筆)",
+            len(pending),
+            len(batches),
+            len(result.skipped),
+        )
+        report(0, len(batches), "準備送出")
+
+        # 送出前的已申請記錄 (每批送出後的查詢結果即為下一批的基準)
+        before: Optional[Counter] = None
+        for index, batch in enumerate(batches, start=1):
+            report(index, len(batches), f"正在送出第 {index}/{len(batches)} 批")
+            if before is None:
+                before = self._query_submitted_dates(session)
+            batch_result, before = self._submit_batch(session, index, batch, before)
+            result.batches.append(batch_result)
+            result.submitted.extend(batch_result.submitted)
+
+            if batch_result.confirmed:
+                report(index, len(batches), f"第 {index}/{len(batches)} 批已送達")
+                continue
+
+            # 停止送出,剩餘批次留待續傳
+            result.unconfirmed.extend(batch_result.unconfirmed)
+            result.failed.extend(batch_result.failed)
+            for remaining in batches[index:]:
+                result.failed.extend(r.date for r in remaining)
+            result.error = batch_result.error
+            report(index, len(batches), f"第 {index}/{len(batches)} 批送出失敗")
+            return result
+
+        if result.success:
+            # 全部送達,清除紀錄
+            self.journal.remove(records)
+            logger.info("✓ 分批送出完成: %d 筆", len(result.submitted))
+        else:
+            result.error = "部分記錄無法確認是否已送達,請稍後重新整理後再送出"
+        return result
+
+    def _resume(
+        self,
+        session: requests.Session,
+        records: List[OvertimeSubmissionRecord],
+        result: BulkSubmissionResult,
+    ) -> List[OvertimeSubmissionRecord]:
+        """
+        依送出紀錄決定要送出的記錄
+
+        in_flight (上次中斷時不確定是否送達) 的記錄查詢個人記錄頁面,
+        與送出前記錄的筆數 (baseline) 比對 (同 _submit_batch):
+        該日期筆數增加的視為送達,其餘重新送出;
+        無法查詢或沒有 baseline 時不重送,避免重複申請。
+        """
+        entries = self.journal.load()
+        pending: List[OvertimeSubmissionRecord] = []
+        in_flight: List[Tuple[OvertimeSubmissionRecord, Optional[int]]] = []
+
+        for record in records:
+            entry = entries.get(SubmissionJournal.fingerprint(record))
+            status = entry["status"] if entry else None
+            if status == STATUS_SUBMITTED:
+                result.skipped.append(record.date)
+            elif status == STATUS_IN_FLIGHT:
+                in_flight.append((record, entry.get("baseline")))
+            else:
+                pending.append(record)
+
+        if not in_flight:
+            return pending
+
+        logger.info("發現 %d 筆未確認的記錄,查詢個人記錄頁面", len(in_flight))
+        submitted_dates = self._query_submitted_dates(session)
+        if submitted_dates is None:
+            result.unconfirmed.extend(record.date for record, _ in in_flight)
+            return pending
+
+        landed: List[OvertimeSubmissionRecord] = []
+        retry: List[OvertimeSubmissionRecord] = []
+        claimed: Counter = Counter()  # (日期, baseline) 已歸屬的新增筆數
+        for record, baseline in in_flight:
+            if baseline is None:
+                # 無法得知送出前的筆數,不重送也不視為送達
+                result.unconfirmed.append(record.date)
+                continue
+            key = (record.date, baseline)
+            if submitted_dates[record.date] - baseline > claimed[key]:
+                claimed[key] += 1
+                landed.append(record)
+            else:
+                retry.append(record)
+
+        self.journal.mark(landed, STATUS_SUBMITTED)
+        result.skipped.extend(r.date for r in landed)
+        self.journal.remove(retry)
+
+        # 保持原本的順序
+        keep = {id(r) for r in pending} | {id(r) for r in retry}
+        return [r for r in records if id(r) in keep]
+
+    def _submit_batch(
+        self,
+        session: requests.Session,
+        index: int,
+        batch: List[OvertimeSubmissionRecord],
+        before: Optional[Counter],
+    ) -> Tuple[BatchResult, Optional[Counter]]:
+        """
+        送出一批並確認結果
+
+        以送出前後個人記錄頁面的差異判斷每筆記錄是否送達:
+        - 送達: 送出後新出現該日期的記錄,標記為已送出
+        - 未送達且送出失敗: 移除紀錄以便重新送出
+        - 其餘 (送出成功但未出現、無法比對): 保留 in_flight,續傳時再確認
+
+        Args:
+            before: 送出前的已申請記錄日期 (無法查詢時為 None)
+
+        Returns:
+            tuple: (批次結果, 送出後的已申請記錄日期)
+        """
+        started = time.perf_counter()
+        dates = [record.date for record in batch]
+
+        self.journal.mark(batch, STATUS_IN_FLIGHT, baseline=before)
+        submission = self.report_service.submit_form(session, batch)
+        success = bool(submission.get("success"))
+
+        # 送出結果與個人記錄頁面交叉確認
+        after = self._query_submitted_dates(session)
+        landed: List[OvertimeSubmissionRecord] = []
+        missing: List[OvertimeSubmissionRecord] = []
+        if after is None:
+            # 無法查詢時以送出結果為準
+            if success:
+                landed = list(batch)
+        elif before is None:
+            # 沒有送出前的記錄可比對,已出現的日期只在送出成功時視為送達
+            missing = [record for record in batch if record.date not in after]
+            if success:
+                landed = [record for record in batch if record.date in after]
+        else:
+            new_dates = after - before
+            for record in batch:
+                if new_dates[record.date] > 0:
+                    new_dates[record.date] -= 1
+                    landed.append(record)
+                else:
+                    missing.append(record)
+
+        confirmed = len(landed) == len(batch)
+        if success and not confirmed:
+            logger.warning("第 %d 批送出成功,但個人記錄頁面未出現所有記錄", index)
+
+        if landed:
+            self.journal.mark(landed, STATUS_SUBMITTED)
+        failed = missing if not success else []
+        if failed:
+            # 確定沒有送達,移除紀錄以便重新送出
+            self.journal.remove(failed)
+
+        error = submission.get("error")
+        if success and not confirmed:
+            error = "送出後無法在個人記錄頁面確認"
+
+        settled = {id(record) for record in landed} | {id(record) for record in failed}
+        batch_result = BatchResult(
+            index=index,
+            dates=dates,
+            success=success,
+            confirmed=confirmed,
+            error=None if confirmed else error,
+            seconds=time.perf_counter() - started,
+            submitted=[record.date for record in landed],
+            failed=[record.date for record in failed],
+            unconfirmed=[record.date for record in batch if id(record) not in settled],
+        )
+        logger.info(
+            "第 %d 批 (%d 筆): %s (%.2f 秒)",
+            index,
+            len(batch),
+            "✓ 已送達" if confirmed else f"✗ {batch_result.error}",
+            batch_result.seconds,
+        )
+        return batch_result, after
+
+    def _query_submitted_dates(self, session: requests.Session) -> Optional[Counter]:
+        """查詢已申請記錄的日期與筆數 (失敗時返回 None)"""
+        try:
+            return Counter(self.status_fetcher(session))
+        except Exception as error:
+            logger.warning("查詢個人記錄失敗: %s", error)
+            return None
+
+    def _fetch_submitted_dates(self, session: requests.Session) -> List[str]:
+        """抓取個人記錄頁面,返回已申請記錄的日期 (每筆記錄一個)"""
+        url = f"{self.settings.SSP_BASE_URL}{self.settings.PERSONAL_RECORD_URL}"
+        response = session.get(
+            url, timeout=self.settings.REQUEST_TIMEOUT, verify=self.settings.VERIFY_SSL
+        )
+        response.raise_for_status()
+
+        if getattr(self.settings, "PARSER_BACKEND", "soup") == "stream":
+            records = StreamPersonalRecordParser().parse_records(response.text)
+        else:
+            records = PersonalRecordParser.parse_records(response.text)
+        return [record["date"] for record in records]
@@ -132,6 +132,27 @@ class CredentialManager:
             logger.warning(f"載入憑證失敗: {e}")
             return (None, None)
 
+    def load_password(self, username: str) -> Optional[str]:
+        """
+        載入指定帳號儲存的密碼 (多帳號同步時使用)
+
+        Args:
+            username: 使用者名稱
+
+        Returns:
+            str: 密碼,沒有儲存或解密失敗時返回 None
+        """
+        try:
+            password_key = f"{self.PASSWORD_KEY_PREFIX}{username}"
+            encrypted_password = keyring.get_password(self.SERVICE_NAME, password_key)
+            if not encrypted_password:
+                return None
+            return self._decrypt_password(encrypted_password)
+
+        except Exception as e:
+            logger.warning(f"載入憑證失敗: {e}")
+            return None
+
     def clear_credentials(self) -> bool:
         """
         清除儲存的憑證
@@ -3,27 +3,51 @@
 import requests
 from bs4 import BeautifulSoup
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import Executor
+from typing import List, Dict, Optional, Tuple
 import re
 
 from ..config import Settings
+from ..parsers import PostbackState
+from .shared_executor import default_executor, map_in_order
 
 logger = logging.getLogger(__name__)
 
+# 分頁連結: javascript:__doPostBack('ctl00$ContentPlaceHolder1$gvWeb012','Page$3')
+_PAGE_ARGUMENT_PATTERN = re.compile(r"Page\$(\d+)")
+
 
 class DataService:
     """資料擷取服務 - 處理出勤資料抓取"""
 
-    def __init__(self, session: requests.Session, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        session: requests.Session,
+        settings: Optional[Settings] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        初始化資料擷取服務
+
+        Args:
+            session: 已登入的 Session
+            settings: 應用程式設定
+            executor: 平行翻頁使用的執行緒池 (預設為服務層共用的執行緒池)
+        """
         self.session = session
         self.settings = settings or Settings()
+        self.executor = executor or default_executor()
 
-    def get_attendance_data(self, max_pages: Optional[int] = None) -> List[Dict]:
+    def get_attendance_data(
+        self, max_pages: Optional[int] = None, parallel: bool = True
+    ) -> List[Dict]:
         """
         取得出勤異常清單資料
 
         Args:
             max_pages: 最大頁數限制
+            parallel: 是否平行翻頁 (以第 1 頁的 ViewState 同時送出其餘頁面的 PostBack,
+                      同時進行的請求數受執行緒池大小限制);False 時逐頁翻頁
 
         Returns:
             List[Dict]: 出勤記錄列表 [{'date': 'YYYY/MM/DD', 'time_range': 'HH:MM:SS~HH:MM:SS'}]
@@ -31,7 +55,9 @@ class DataService:
         max_pages = max_pages or self.settings.MAX_PAGES
         attendance_url = f"{self.settings.SSP_BASE_URL}/FW99001Z.aspx"
         all_records = []
-        current_page = 1
+
+        # 使用 set 來追蹤已處理的記錄
+        seen_records = set()
 
         try:
             logger.info("正在訪問出勤異常頁面...")
@@ -41,44 +67,17 @@ class DataService:
                 verify=self.settings.VERIFY_SSL,
             )
             soup = BeautifulSoup(response.text, "html.parser")
+            state = PostbackState.from_html(response.content)
+            self._collect_page_records(soup, 1, seen_records, all_records)
 
-            # 使用 set 來追蹤已處理的記錄
-            seen_records = set()
-
-            while current_page <= max_pages:
-                logger.info(f"正在處理第 {current_page} 頁...")
-
-                # 解析當前頁面的資料
-                records = self._parse_attendance_table(soup)
-
-                # 去重處理
-                new_count = 0
-                for record in records:
-                    record_key = f"{record['date']}_{record['time_range']}"
-                    if record_key not in seen_records:
-                        seen_records.add(record_key)
-                        all_records.append(record)
-                        new_count += 1
-
-                if new_count > 0:
-                    logger.info(f"  新增 {new_count} 筆記錄 (本頁共 {len(records)} 筆)")
-                else:
-                    logger.warning(f"  第 {current_page} 頁沒有新資料")
-
-                # 檢查是否有下一頁
-                has_next = self._has_next_page(soup, current_page)
-                if not has_next:
-                    logger.info("已處理完所有頁面")
-                    break
-
-                # 執行翻頁
-                response = self._goto_next_page(soup, current_page + 1)
-                if not response:
-                    logger.warning("翻頁失敗,停止處理")
-                    break
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                current_page += 1
+            if parallel and self.settings.HTTP_POOL_SIZE > 1:
+                self._fetch_pages_parallel(
+                    soup, state, max_pages, seen_records, all_records
+                )
+            else:
+                self._fetch_pages_sequential(
+                    soup, state, max_pages, seen_records, all_records
+                )
 
             logger.info(f"✓ 共取得 {len(all_records)} 筆不重複記錄")
             return all_records
@@ -191,6 +190,145 @@ class DataService:
         logger.info(f"  成功解析 {len(records)} 筆記錄")
         return records
 
+    def _collect_page_records(
+        self,
+        soup: BeautifulSoup,
+        page_num: int,
+        seen_records: set,
+        all_records: List[Dict],
+    ):
+        """解析單頁資料並去重後加入 all_records"""
+        logger.info(f"正在處理第 {page_num} 頁...")
+
+        # 解析當前頁面的資料
+        records = self._parse_attendance_table(soup)
+
+        # 去重處理
+        new_count = 0
+        for record in records:
+            record_key = f"{record['date']}_{record['time_range']}"
+            if record_key not in seen_records:
+                seen_records.add(record_key)
+                all_records.append(record)
+                new_count += 1
+
+        if new_count > 0:
+            logger.info(f"  新增 {new_count} 筆記錄 (本頁共 {len(records)} 筆)")
+        else:
+            logger.warning(f"  第 {page_num} 頁沒有新資料")
+
+    def _fetch_pages_sequential(
+        self,
+        soup: BeautifulSoup,
+        state: Optional[PostbackState],
+        max_pages: int,
+        seen_records: set,
+        all_records: List[Dict],
+    ):
+        """逐頁翻頁 (每一頁的 PostBack 都使用上一頁的 ViewState)"""
+        current_page = 1
+        while current_page < max_pages:
+            # 檢查是否有下一頁
+            if not self._has_next_page(soup, current_page):
+                logger.info("已處理完所有頁面")
+                return
+
+            # 執行翻頁
+            page = self._fetch_page(state, current_page + 1)
+            if not page:
+                logger.warning("翻頁失敗,停止處理")
+                return
+
+            soup, state = page
+            current_page += 1
+            self._collect_page_records(soup, current_page, seen_records, all_records)
+
+    def _fetch_pages_parallel(
+        self,
+        soup: BeautifulSoup,
+        state: Optional[PostbackState],
+        max_pages: int,
+        seen_records: set,
+        all_records: List[Dict],
+    ):
+        """
+        平行翻頁
+
+        ASP.NET 允許以同一份 ViewState 送出分頁列上任一頁碼的 PostBack,
+        因此以第 1 頁的 ViewState 同時抓取分頁列上其餘的頁面;
+        超過 10 頁時分頁列以 "..." 連到下一區段,再以該區段最後一頁的 ViewState
+        抓取下一批。結果依頁碼順序合併,去重規則與逐頁翻頁相同,
+        某一頁失敗時只保留其之前的頁面 (與逐頁翻頁相同)。
+        """
+        current_page = 1
+        while True:
+            page_nums = [
+                page_num
+                for page_num in self._get_pager_pages(soup)
+                if current_page < page_num <= max_pages
+            ]
+            if not page_nums:
+                logger.info("已處理完所有頁面")
+                return
+
+            logger.info(f"正在平行抓取第 {page_nums[0]}~{page_nums[-1]} 頁...")
+            base_state = state
+            # HTML 解析也在工作執行緒進行,與其他頁面的等待重疊
+            pages = map_in_order(
+                self.executor,
+                lambda page_num: self._fetch_page(base_state, page_num),
+                page_nums,
+            )
+
+            # 依頁碼順序合併,下一批以本批最後一頁的 ViewState 抓取
+            for page_num, page in zip(page_nums, pages):
+                if page is None:
+                    logger.warning(f"第 {page_num} 頁翻頁失敗,停止處理")
+                    return
+                soup, state = page
+                self._collect_page_records(soup, page_num, seen_records, all_records)
+                current_page = page_num
+
+    def _fetch_page(
+        self, state: Optional[PostbackState], page_num: int
+    ) -> Optional[Tuple[BeautifulSoup, Optional[PostbackState]]]:
+        """
+        翻到指定頁並解析
+
+        Returns:
+            Tuple | None: (頁面 DOM, 該頁的 PostBack 隱藏欄位),失敗時返回 None
+        """
+        response = self._goto_next_page(state, page_num)
+        if not response:
+            return None
+        return (
+            BeautifulSoup(response.text, "html.parser"),
+            PostbackState.from_html(response.content),
+        )
+
+    def _get_pager_pages(self, soup: BeautifulSoup) -> List[int]:
+        """取得分頁列上可 PostBack 的頁碼 (含 "..." 連結指向的頁碼),由小到大"""
+        table = soup.find("table", id="ContentPlaceHolder1_gvWeb012")
+        if not table:
+            table = soup.find("table", {"id": re.compile(".*gvWeb012.*")})
+
+        if not table:
+            return []
+
+        pager = table.find("tr", class_="PagerStyle")
+        if not pager:
+            return []
+
+        page_nums = set()
+        for link in pager.find_all("a"):
+            match = _PAGE_ARGUMENT_PATTERN.search(link.get("href", ""))
+            if match:
+                page_nums.add(int(match.group(1)))
+            elif link.text.strip().isdigit():
+                page_nums.add(int(link.text.strip()))
+
+        return sorted(page_nums)
+
     def _has_next_page(self, soup: BeautifulSoup, current_page: int) -> bool:
         """檢查是否有下一頁"""
         table = soup.find("table", id="ContentPlaceHolder1_gvWeb012")
@@ -215,29 +353,17 @@ class DataService:
         return False
 
     def _goto_next_page(
-        self, soup: BeautifulSoup, page_num: int
+        self, state: Optional[PostbackState], page_num: int
     ) -> Optional[requests.Response]:
-        """前往下一頁"""
+        """前往指定頁 (state 為目前頁面的 PostBack 隱藏欄位)"""
         try:
-            viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-            viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
-            event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
-
-            if not viewstate:
+            if not state:
                 logger.error("無法取得 ViewState,翻頁失敗")
                 return None
 
-            post_data = {
-                "__VIEWSTATE": viewstate["value"],
-                "__VIEWSTATEGENERATOR": (
-                    viewstate_generator["value"] if viewstate_generator else ""
-                ),
-                "__EVENTVALIDATION": (
-                    event_validation["value"] if event_validation else ""
-                ),
-                "__EVENTTARGET": "ctl00$ContentPlaceHolder1$gvWeb012",
-                "__EVENTARGUMENT": f"Page${page_num}",
-            }
+            post_data = state.to_form(
+                "ctl00$ContentPlaceHolder1$gvWeb012", f"Page${page_num}"
+            )
 
             response = self.session.post(
                 f"{self.settings.SSP_BASE_URL}/FW99001Z.aspx",
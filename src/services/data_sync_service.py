@@ -6,7 +6,11 @@
 - 全量同步: 抓取所有頁面資料並建立 AttendanceSnapshot
 - 增量同步: 僅更新已申請記錄的狀態
 - 智慧快取: 5 分鐘內重複請求直接返回快取資料
+- 持久快取: 可選的磁碟快照,重新啟動後直接載入
+- 背景更新: stale-while-revalidate,先返回舊資料再於背景更新並通知訂閱者
 - 平行抓取: 同時請求多個頁面提升效能
+- 共用執行緒池: 背景更新與平行抓取使用注入的 executor (GUI 為 EventLoopThread 的 I/O 執行緒池),
+  不再為每次同步建立執行緒或執行緒池
 - 資料整合: 合併異常記錄與個人記錄為統一模型
 
 設計原則:
@@ -16,24 +20,31 @@
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from concurrent.futures import Executor, Future
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from requests import Session
 from requests.exceptions import RequestException, Timeout
 import urllib3
 
 from ..config.settings import Settings
 from ..parsers.attendance_parser import AttendanceParser
+from ..parsers.html_document import HtmlDocument
 from ..parsers.personal_record_parser import PersonalRecordParser
+from ..parsers.stream_parser import StreamAttendanceParser, StreamPersonalRecordParser
 from ..models.snapshot import AttendanceSnapshot, OvertimeStatistics
 from ..models.attendance import UnifiedOvertimeRecord
 from ..models.punch import PunchRecord
 from ..models.personal_record import PersonalRecord, PersonalRecordSummary
+from ..models.overtime_submission import SubmittedRecord
+from .record_merger import merge_overtime_records, merge_unified_records
+from .shared_executor import default_executor, map_in_order
+from .snapshot_store import SnapshotStore
+from .status_tracker import OvertimeStatusTracker
 
 logger = logging.getLogger(__name__)
 
-
 class DataSyncService:
     """
     統一資料同步服務
@@ -44,48 +55,104 @@ class DataSyncService:
         snapshot = service.sync_all()  # 首次抓取
         snapshot = service.sync_all()  # 使用快取
         snapshot = service.sync_all(force_refresh=True)  # 強制重新抓取
+
+        # 啟用磁碟快照 (重新啟動後 CACHE_DURATION_SECONDS 內直接載入)
+        service = DataSyncService(
+            session,
+            settings,
+            snapshot_store=SnapshotStore(settings=settings),
+            cache_key=SnapshotStore.make_key(username),
+        )
+
+        # stale-while-revalidate: 快取過期時先返回舊資料,背景更新完成後通知
+        # (GUI 傳入 EventLoopThread 的執行緒池,背景工作不另建執行緒)
+        service = DataSyncService(
+            session,
+            settings,
+            stale_while_revalidate=True,
+            executor=event_loop.executor,
+        )
+        unsubscribe = service.subscribe(lambda snapshot: ...)
+        snapshot = service.sync_all()
         ```
     """
 
-    def __init__(self, session: Session, settings: Settings):
+    def __init__(
+        self,
+        session: Session,
+        settings: Settings,
+        snapshot_store: Optional[SnapshotStore] = None,
+        cache_key: Optional[str] = None,
+        stale_while_revalidate: bool = False,
+        executor: Optional[Executor] = None,
+    ):
         """
         初始化資料同步服務
 
         Args:
             session: 已登入的 requests.Session
             settings: 應用程式設定
+            snapshot_store: 磁碟快照儲存 (可選,需同時提供 cache_key)
+            cache_key: 磁碟快照的快取鍵 (使用者 + 期間)
+            stale_while_revalidate: sync_all 預設是否先返回舊資料並於背景更新
+            executor: 背景更新與平行抓取使用的執行緒池 (預設為模組共用的執行緒池)
         """
         self.session = session
         self.settings = settings
+        self.executor = executor or default_executor()
+        self.snapshot_store = snapshot_store if cache_key else None
+        self.cache_key = cache_key
 
         # 禁用 SSL 警告 (內部系統)
         if not self.settings.VERIFY_SSL:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        # HTML 解析器 (依賴注入)
-        self.attendance_parser = AttendanceParser()
-        self.personal_record_parser = PersonalRecordParser()
+        # HTML 解析器 (依賴注入, 依 PARSER_BACKEND 選擇後端)
+        if getattr(self.settings, "PARSER_BACKEND", "soup") == "stream":
+            self.attendance_parser = StreamAttendanceParser()
+            self.personal_record_parser = StreamPersonalRecordParser()
+        else:
+            self.attendance_parser = AttendanceParser()
+            self.personal_record_parser = PersonalRecordParser()
+
+        # 個人記錄增量追蹤 (sync_overtime_status 只解析新出現或改變的列)
+        self.status_tracker = OvertimeStatusTracker(parser=self.personal_record_parser)
 
         # 快取
         self._cache: Optional[AttendanceSnapshot] = None
         self._cache_timestamp: Optional[datetime] = None
 
+        # 背景更新 (同一時間只有一個進行中的同步,其餘呼叫者共用結果)
+        self.stale_while_revalidate = stale_while_revalidate
+        self._refresh_lock = threading.Lock()
+        self._inflight_refresh: Optional[Future] = None
+        self._refresh_task: Optional[Future] = None  # 背景更新在執行緒池中的工作
+        self._subscribers: List[Callable[[AttendanceSnapshot], None]] = []
+
         logger.info("DataSyncService 初始化完成")
 
-    def sync_all(self, force_refresh: bool = False) -> AttendanceSnapshot:
+    def sync_all(
+        self,
+        force_refresh: bool = False,
+        stale_while_revalidate: Optional[bool] = None,
+    ) -> AttendanceSnapshot:
         """
         全量同步所有出勤資料
 
         執行流程:
         1. 檢查快取是否有效 (若非強制重新整理)
-        2. 平行抓取出勤頁面與個人記錄頁面
-        3. 解析 HTML 為資料模型
-        4. 整合異常記錄與個人記錄
-        5. 計算統計資料
-        6. 更新快取
+        2. stale-while-revalidate: 有舊資料時直接返回,並於背景更新
+        3. 平行抓取出勤頁面與個人記錄頁面
+        4. 解析 HTML 為資料模型 (出勤頁面只建立一次 DOM)
+        5. 整合異常記錄與個人記錄
+        6. 計算統計資料
+        7. 更新快取
+
+        同一時間只會有一個進行中的同步,並行的呼叫者會等待並共用同一結果。
 
         Args:
             force_refresh: 是否強制重新抓取 (忽略快取)
+            stale_while_revalidate: 是否先返回舊資料 (None 表示使用建構時的設定)
 
         Returns:
             AttendanceSnapshot: 完整的出勤資料快照
@@ -94,88 +161,72 @@ class DataSyncService:
             RequestException: HTTP 請求失敗
             Exception: 資料解析失敗
         """
-        # 快取檢查
+        if stale_while_revalidate is None:
+            stale_while_revalidate = self.stale_while_revalidate
+
+        # 快取檢查 (記憶體 → 磁碟)
         if not force_refresh and self._is_cache_valid():
             logger.info("使用快取資料 (age: %.1f 秒)", self._get_cache_age())
             return self._cache
 
-        logger.info("開始全量同步資料...")
-
-        try:
-            # 平行抓取頁面 (優化: 異常記錄已在出勤頁面,只需 2 次請求)
-            html_pages = self._fetch_all_pages_parallel()
-
-            # 解析資料
-            attendance_html = html_pages["attendance"]
-            personal_html = html_pages["personal"]
-
-            # 解析出勤頁面 (tabs-1)
-            punch_records = self.attendance_parser.parse_punch_records(attendance_html)
-            leave_records = self.attendance_parser.parse_leave_records(attendance_html)
-            quota = self.attendance_parser.parse_quota(attendance_html)
+        if not force_refresh and self._load_persisted_snapshot():
+            logger.info("使用磁碟快照 (age: %.1f 秒)", self._get_cache_age())
+            return self._cache
 
-            # 解析異常記錄 (tabs-2, 但在同一個 HTML 中)
-            anomaly_records = self.attendance_parser.parse_anomaly_records(
-                attendance_html
+        # 先返回舊資料,背景更新完成後通知訂閱者
+        if stale_while_revalidate and (
+            self._cache or self._load_persisted_snapshot(allow_expired=True)
+        ):
+            logger.info(
+                "返回舊資料 (age: %.1f 秒),背景更新中...", self._get_cache_age()
             )
+            self.refresh_in_background()
+            return self._cache
 
-            # 解析個人記錄
-            personal_records = self.personal_record_parser.parse_records(personal_html)
+        return self._refresh_shared()
 
-            # 整合資料為統一模型
-            unified_records = self._merge_overtime_data(
-                anomaly_records, personal_records
-            )
+    def subscribe(
+        self, callback: Callable[[AttendanceSnapshot], None]
+    ) -> Callable[[], None]:
+        """
+        訂閱背景更新完成事件
 
-            # 計算統計資料
-            start_date, end_date = self._calculate_date_range(unified_records)
-            statistics = self._calculate_statistics(
-                unified_records, start_date, end_date
-            )
+        callback 在背景執行緒中呼叫,UI 需自行切換回主執行緒 (例如 after)。
 
-            # 建立快照
-            snapshot = AttendanceSnapshot(
-                start_date=start_date,
-                end_date=end_date,
-                fetched_at=datetime.now(),
-                punch_records=punch_records,
-                leave_records=leave_records,
-                quota=quota,
-                unified_records=unified_records,
-                statistics=statistics,
-            )
+        Args:
+            callback: 收到新快照時呼叫
 
-            # 更新快取
-            self._cache = snapshot
-            self._cache_timestamp = datetime.now()
+        Returns:
+            Callable: 取消訂閱函式
+        """
+        self._subscribers.append(callback)
 
-            logger.info(
-                "全量同步完成: %d 筆記錄, 耗時 %.2f 秒",
-                len(unified_records),
-                (datetime.now() - snapshot.fetched_at).total_seconds(),
-            )
+        def unsubscribe():
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
 
-            return snapshot
+        return unsubscribe
 
-        except Timeout as e:
-            logger.error("資料同步逾時: %s", str(e))
-            # 嘗試使用過期快取
-            if self._cache:
-                logger.warning("使用過期快取資料 (age: %.1f 秒)", self._get_cache_age())
-                return self._cache
-            raise
+    def refresh_in_background(self) -> bool:
+        """
+        啟動背景更新 (已有進行中的同步時不重複啟動)
 
-        except RequestException as e:
-            logger.error("資料同步失敗 (網路錯誤): %s", str(e))
-            # 嘗試使用過期快取
-            if self._cache:
-                logger.warning("使用過期快取資料 (age: %.1f 秒)", self._get_cache_age())
-                return self._cache
-            raise
+        Returns:
+            bool: 是否啟動新的背景更新
+        """
+        # 啟動執行緒前先佔用進行中的同步,避免並行呼叫重複啟動
+        future, is_owner = self._claim_refresh()
+        if not is_owner:
+            logger.debug("已有進行中的同步,不重複啟動")
+            return False
 
-        except Exception as e:
-            logger.error("資料同步失敗 (未知錯誤): %s", str(e), exc_info=True)
-            raise
+        self._refresh_task = self.executor.submit(self._background_refresh, future)
+        return True
+
+    @property
+    def is_refreshing(self) -> bool:
+        """是否有進行中的同步"""
+        return self._inflight_refresh is not None
 
     def sync_overtime_status(self) -> List[UnifiedOvertimeRecord]:
         """
@@ -190,6 +241,7 @@ class DataSyncService:
         Notes:
             - 若無快取,會執行完整同步
             - 只抓取個人記錄頁面 (1 次 HTTP 請求)
+            - 只解析新出現或內容改變的列 (見 OvertimeStatusTracker)
         """
         if not self._cache:
             logger.warning("無快取資料,執行完整同步")
@@ -198,25 +250,48 @@ class DataSyncService:
         logger.info("開始增量同步加班狀態...")
 
         try:
-            # 僅抓取個人記錄頁面
-            personal_html = self._fetch_personal_record_page()
-            personal_records = self.personal_record_parser.parse_records(personal_html)
+            # 僅抓取個人記錄頁面 (伺服器支援時為條件式請求)
+            url = f"{self.settings.SSP_BASE_URL}{self.settings.PERSONAL_RECORD_URL}"
+            response = self.session.get(
+                url,
+                headers=self.status_tracker.conditional_headers(),
+                timeout=self.settings.REQUEST_TIMEOUT,
+                verify=self.settings.VERIFY_SSL,
+            )
+            response.raise_for_status()
+            poll = self.status_tracker.poll_response(response)
+
+            if not poll.full and not poll.changed:
+                logger.info("增量同步完成: 狀態沒有變化")
+                return self._cache.unified_records
 
-            # 建立日期索引
-            personal_by_date = {r["date"]: r for r in personal_records}
+            # 增量解析時只需更新變更的記錄 (以快照的日期索引查詢)
+            personal_by_date = {
+                r["date"]: r for r in (poll.records if poll.full else poll.changed)
+            }
 
             # 更新快取中的狀態
             updated_count = 0
-            for record in self._cache.unified_records:
-                personal = personal_by_date.get(record.date)
-                if personal:
+            statistics = self._cache.statistics
+            for date, personal in personal_by_date.items():
+                record = self._cache.get_record_by_date(date)
+                if record:
+                    # 統計以差量更新: 先移除舊狀態的貢獻,修改後再加入
+                    if statistics:
+                        statistics.remove_record(record)
                     record.submitted = True
                     record.submission_status = personal.get("status")
                     record.monthly_total = personal.get("monthly_total")
                     record.quarterly_total = personal.get("quarterly_total")
+                    if statistics:
+                        statistics.add_record(record)
                     updated_count += 1
 
+            # 申報狀態已改變,分類檢視需重建
+            self._cache.invalidate_views()
+
             logger.info("增量同步完成: 更新 %d 筆記錄", updated_count)
+            self._persist_snapshot()
             return self._cache.unified_records
 
         except Exception as e:
@@ -225,9 +300,12 @@ class DataSyncService:
             return self._cache.unified_records
 
     def clear_cache(self):
-        """清除快取"""
+        """清除快取 (含磁碟快照)"""
         self._cache = None
         self._cache_timestamp = None
+        self.status_tracker.reset()
+        if self.snapshot_store:
+            self.snapshot_store.delete(self.cache_key)
         logger.info("快取已清除")
 
     # === 適配器方法 (向後相容) ===
@@ -252,7 +330,7 @@ class DataSyncService:
         records = []
 
         # 使用異常記錄 (has_anomaly=True)
-        anomaly_records = [r for r in snapshot.unified_records if r.has_anomaly]
+        anomaly_records = snapshot.get_anomaly_records()
 
         for record in anomaly_records:
             if record.punch_start and record.punch_end:
@@ -276,7 +354,7 @@ class DataSyncService:
             Tuple: (個人記錄列表, 統計摘要)
         """
         snapshot = self.sync_all()
-        submitted = [r for r in snapshot.unified_records if r.submitted]
+        submitted = snapshot.get_submitted_records()
 
         # 轉換為 PersonalRecord
         records = []
@@ -325,6 +403,33 @@ class DataSyncService:
 
         return records, summary
 
+    def get_submitted_records(self) -> Dict[str, SubmittedRecord]:
+        """
+        適配器: 返回已申請記錄對照表 (取代 OvertimeStatusService.fetch_submitted_records)
+
+        資料來源: snapshot.unified_records (submitted=True)
+        個人記錄頁面已在 sync_all() 中抓取,此方法不會再發送 HTTP 請求
+
+        Returns:
+            Dict[str, SubmittedRecord]: {日期: SubmittedRecord}
+        """
+        snapshot = self.sync_all()
+        submitted_records = {}
+
+        for record in snapshot.get_submitted_records():
+            minutes = (record.reported_overtime_hours or 0.0) * 60
+            is_change = record.submission_type == "調休"
+
+            submitted_records[record.date] = SubmittedRecord(
+                date=record.date,
+                status=record.submission_status or "未知",
+                overtime_minutes=0.0 if is_change else minutes,
+                change_minutes=minutes if is_change else 0.0,
+            )
+
+        logger.debug("返回 %d 筆已申請記錄 (來自快照)", len(submitted_records))
+        return submitted_records
+
     def get_punch_records(self) -> List[PunchRecord]:
         """
         適配器: 返回打卡記錄列表 (供新增的打卡記錄分頁使用)
@@ -339,6 +444,158 @@ class DataSyncService:
 
     # === 私有方法 ===
 
+    def _refresh_shared(self) -> AttendanceSnapshot:
+        """
+        執行同步 (重複呼叫去重)
+
+        第一個呼叫者實際抓取資料,其餘呼叫者等待同一個 Future。
+        """
+        future, is_owner = self._claim_refresh()
+        if not is_owner:
+            task = self._refresh_task
+            if task is not None and task.cancel():
+                # 背景更新仍在執行緒池排隊 (執行緒都被佔用),改在目前執行緒執行,避免互相等待
+                logger.info("背景更新尚未開始,改在目前執行緒同步")
+                self._background_refresh(future)
+            else:
+                logger.info("等待進行中的同步結果...")
+            return future.result()
+        return self._run_refresh(future)
+
+    def _claim_refresh(self) -> Tuple[Future, bool]:
+        """
+        取得進行中的同步 (沒有時建立並佔用)
+
+        Returns:
+            tuple: (同步結果 Future, 是否由呼叫者負責執行)
+        """
+        with self._refresh_lock:
+            if self._inflight_refresh is not None:
+                return self._inflight_refresh, False
+            self._inflight_refresh = Future()
+            return self._inflight_refresh, True
+
+    def _run_refresh(self, future: Future) -> AttendanceSnapshot:
+        """執行已佔用的同步,結果寫入 future 後釋放"""
+        try:
+            snapshot = self._fetch_snapshot()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(snapshot)
+            return snapshot
+        finally:
+            with self._refresh_lock:
+                self._inflight_refresh = None
+
+    def _background_refresh(self, future: Future):
+        """背景更新並通知訂閱者 (降級返回舊快取時不通知)"""
+        previous = self._cache
+        try:
+            snapshot = self._run_refresh(future)
+        except Exception as e:
+            logger.warning("背景更新失敗,保留舊資料: %s", str(e))
+            return
+
+        if snapshot is previous:
+            return
+
+        for callback in list(self._subscribers):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error("快照更新通知失敗: %s", str(e), exc_info=True)
+
+    def _fetch_snapshot(self) -> AttendanceSnapshot:
+        """抓取並解析所有頁面,建立新快照 (網路錯誤時降級為舊快取)"""
+        logger.info("開始全量同步資料...")
+
+        try:
+            # 平行抓取頁面 (優化: 異常記錄已在出勤頁面,只需 2 次請求)
+            html_pages = self._fetch_all_pages_parallel()
+
+            # 解析資料
+            attendance_html = html_pages["attendance"]
+            personal_html = html_pages["personal"]
+
+            # 出勤頁面只建立一次 DOM,供四個表格解析共用 (串流後端不建立 DOM)
+            attendance_document = HtmlDocument(attendance_html)
+
+            # 解析出勤頁面 (tabs-1)
+            punch_records = self.attendance_parser.parse_punch_records(
+                attendance_document
+            )
+            leave_records = self.attendance_parser.parse_leave_records(
+                attendance_document
+            )
+            quota = self.attendance_parser.parse_quota(attendance_document)
+
+            # 解析異常記錄 (tabs-2, 但在同一個 HTML 中)
+            anomaly_records = self.attendance_parser.parse_anomaly_records(
+                attendance_document
+            )
+
+            # 解析個人記錄
+            personal_records = self.personal_record_parser.parse_records(personal_html)
+            self.status_tracker.seed(personal_html, personal_records)
+
+            # 整合資料為統一模型
+            unified_records = self._merge_overtime_data(
+                anomaly_records, personal_records
+            )
+
+            # 計算統計資料
+            start_date, end_date = self._calculate_date_range(unified_records)
+            statistics = self._calculate_statistics(
+                unified_records, start_date, end_date
+            )
+
+            # 建立快照
+            snapshot = AttendanceSnapshot(
+                start_date=start_date,
+                end_date=end_date,
+                fetched_at=datetime.now(),
+                punch_records=punch_records,
+                leave_records=leave_records,
+                quota=quota,
+                unified_records=unified_records,
+                statistics=statistics,
+            )
+
+            # 更新快取
+            self._cache = snapshot
+            self._cache_timestamp = datetime.now()
+            self._persist_snapshot()
+
+            logger.info(
+                "全量同步完成: %d 筆記錄, 耗時 %.2f 秒",
+                len(unified_records),
+                (datetime.now() - snapshot.fetched_at).total_seconds(),
+            )
+
+            return snapshot
+
+        except Timeout as e:
+            logger.error("資料同步逾時: %s", str(e))
+            # 嘗試使用過期快取 (記憶體或磁碟)
+            if self._cache or self._load_persisted_snapshot(allow_expired=True):
+                logger.warning("使用過期快取資料 (age: %.1f 秒)", self._get_cache_age())
+                return self._cache
+            raise
+
+        except RequestException as e:
+            logger.error("資料同步失敗 (網路錯誤): %s", str(e))
+            # 嘗試使用過期快取 (記憶體或磁碟)
+            if self._cache or self._load_persisted_snapshot(allow_expired=True):
+                logger.warning("使用過期快取資料 (age: %.1f 秒)", self._get_cache_age())
+                return self._cache
+            raise
+
+        except Exception as e:
+            logger.error("資料同步失敗 (未知錯誤): %s", str(e), exc_info=True)
+            raise
+
     def _is_cache_valid(self) -> bool:
         """
         檢查快取是否有效
@@ -353,6 +610,38 @@ class DataSyncService:
         age = (datetime.now() - self._cache_timestamp).total_seconds()
         return age < max_age
 
+    def _load_persisted_snapshot(self, allow_expired: bool = False) -> bool:
+        """
+        從磁碟快照載入記憶體快取
+
+        Args:
+            allow_expired: 是否接受超過 CACHE_DURATION_SECONDS 的快照 (網路失敗時的降級)
+
+        Returns:
+            bool: 是否成功載入
+        """
+        if not self.snapshot_store:
+            return False
+
+        max_age_seconds = (
+            None
+            if allow_expired
+            else getattr(self.settings, "CACHE_DURATION_SECONDS", 300)
+        )
+        snapshot = self.snapshot_store.load(self.cache_key, max_age_seconds)
+        if snapshot is None:
+            return False
+
+        # 快取年齡以原始抓取時間計算,避免磁碟快照被視為剛抓取的資料
+        self._cache = snapshot
+        self._cache_timestamp = snapshot.fetched_at
+        return True
+
+    def _persist_snapshot(self):
+        """將記憶體快取寫入磁碟快照 (未啟用時不做任何事)"""
+        if self.snapshot_store and self._cache:
+            self.snapshot_store.save(self.cache_key, self._cache)
+
     def _get_cache_age(self) -> float:
         """取得快取年齡 (秒)"""
         if not self._cache_timestamp:
@@ -366,24 +655,21 @@ class DataSyncService:
         優化策略:
         - 異常記錄已包含在出勤頁面 (tabs-2)
         - 只需抓取 2 個頁面: 出勤 + 個人記錄
-        - 使用 ThreadPoolExecutor 平行執行
+        - 兩個頁面交給共用執行緒池平行抓取
+        - 尚未開始的抓取 (執行緒池忙碌) 改在目前執行緒執行,
+          呼叫端本身在同一個執行緒池中時也不會互相等待
 
         Returns:
             Dict: {'attendance': HTML, 'personal': HTML}
         """
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_attendance = executor.submit(self._fetch_attendance_page)
-            future_personal = executor.submit(self._fetch_personal_record_page)
-
-            results = {
-                "attendance": future_attendance.result(),
-                "personal": future_personal.result(),
-            }
-
-            # 異常記錄使用相同的 HTML (在 tabs-2)
-            results["anomaly"] = results["attendance"]
+        attendance, personal = map_in_order(
+            self.executor,
+            lambda fetch: fetch(),
+            (self._fetch_attendance_page, self._fetch_personal_record_page),
+        )
 
-        return results
+        # 異常記錄使用相同的 HTML (在 tabs-2)
+        return {"attendance": attendance, "personal": personal, "anomaly": attendance}
 
     def _fetch_attendance_page(self) -> str:
         """抓取出勤頁面 (FW99001Z.aspx)
@@ -412,7 +698,10 @@ class DataSyncService:
         return response.text
 
     def _merge_overtime_data(
-        self, anomaly_records: List[Dict], personal_records: List[Dict]
+        self,
+        anomaly_records: List[Dict],
+        personal_records: List[Dict],
+        existing: Optional[List[UnifiedOvertimeRecord]] = None,
     ) -> List[UnifiedOvertimeRecord]:
         """
         合併異常記錄與個人記錄為統一模型
@@ -421,99 +710,21 @@ class DataSyncService:
         - 以異常記錄為基礎 (所有需要申報的加班)
         - 匹配個人記錄 (已申報狀態)
         - 補充未在異常清單中的個人記錄 (手動申請的調休等)
+        - 提供 existing 時,將合併結果併入既有記錄 (同日期以新記錄為準)
 
         Args:
             anomaly_records: 異常記錄列表 (來自 gvWeb012)
             personal_records: 個人記錄列表 (來自 gvFlow211)
+            existing: 既有的統一記錄 (例如快照的 unified_records)
 
         Returns:
-            List[UnifiedOvertimeRecord]: 整合後的統一記錄
-        """
-        # 建立日期索引
-        personal_by_date = {r["date"]: r for r in personal_records}
-        anomaly_dates = {r["date"] for r in anomaly_records}
-
-        unified = []
-
-        # 1. 處理異常記錄
-        for anomaly in anomaly_records:
-            date = anomaly["date"]
-            personal = personal_by_date.get(date)
-
-            # 解析 punch_range (格式: "09:00:15~19:31:09")
-            punch_start = None
-            punch_end = None
-            if anomaly.get("punch_range"):
-                punch_range = anomaly["punch_range"].strip()
-                if "~" in punch_range:
-                    times = punch_range.split("~")
-                    if len(times) == 2:
-                        punch_start = times[0].strip()
-                        punch_end = times[1].strip()
-
-            record = UnifiedOvertimeRecord(
-                date=date,
-                punch_start=punch_start,
-                punch_end=punch_end,
-                calculated_overtime_hours=anomaly.get("overtime_hours", 0.0),
-                has_anomaly=True,
-                anomaly_description=anomaly.get("description"),
-                submitted=personal is not None,
-                submission_content=personal.get("content") if personal else None,
-                submission_status=personal.get("status") if personal else None,
-                submission_type=personal.get("report_type") if personal else None,
-                reported_overtime_hours=(
-                    personal.get("overtime_hours") if personal else None
-                ),
-                monthly_total=personal.get("monthly_total") if personal else None,
-                quarterly_total=personal.get("quarterly_total") if personal else None,
-            )
-
-            # Debug log
-            if personal:
-                logger.debug(
-                    "合併記錄 %s: 類型=%s, 時數=%s, 月累計=%s, 季累計=%s",
-                    date,
-                    personal.get("report_type"),
-                    personal.get("overtime_hours"),
-                    personal.get("monthly_total"),
-                    personal.get("quarterly_total"),
-                )
-            unified.append(record)
-
-        # 2. 補充個人記錄中但不在異常清單的記錄 (如手動申請調休)
-        for personal in personal_records:
-            if personal["date"] not in anomaly_dates:
-                record = UnifiedOvertimeRecord(
-                    date=personal["date"],
-                    punch_start=None,
-                    punch_end=None,
-                    calculated_overtime_hours=0.0,
-                    has_anomaly=False,
-                    anomaly_description=None,
-                    submitted=True,
-                    submission_content=personal.get("content"),
-                    submission_status=personal.get("status"),
-                    submission_type=personal.get("report_type"),
-                    reported_overtime_hours=personal.get("overtime_hours", 0.0),
-                    monthly_total=personal.get("monthly_total"),
-                    quarterly_total=personal.get("quarterly_total"),
-                )
-
-                # Debug log
-                logger.debug(
-                    "補充個人記錄 %s: 類型=%s, 時數=%s, 月累計=%s, 季累計=%s",
-                    personal["date"],
-                    personal.get("report_type"),
-                    personal.get("overtime_hours"),
-                    personal.get("monthly_total"),
-                    personal.get("quarterly_total"),
-                )
-
-                unified.append(record)
-
-        # 依日期排序
-        unified.sort(key=lambda x: x.date, reverse=True)
+            List[UnifiedOvertimeRecord]: 整合後的統一記錄 (依日期由新到舊)
+        """
+        # 兩者皆依日期由新到舊,merge-join 一次走訪 (不需最後排序)
+        merged = merge_overtime_records(anomaly_records, personal_records)
+        if existing is not None:
+            merged = merge_unified_records(existing, list(merged))
+        unified = list(merged)
 
         logger.info(
             "資料整合完成: %d 筆異常記錄, %d 筆已申報",
@@ -553,45 +764,5 @@ class DataSyncService:
         Returns:
             OvertimeStatistics: 統計資料
         """
-        if not records:
-            return OvertimeStatistics(start_date=start_date, end_date=end_date)
-
-        # 計算各項統計
-        total_overtime_hours = sum(r.calculated_overtime_hours for r in records)
-        submitted_records = [r for r in records if r.submitted]
-        submitted_overtime_hours = sum(
-            r.reported_overtime_hours
-            for r in submitted_records
-            if r.reported_overtime_hours
-        )
-        pending_records = [r for r in records if not r.submitted]
-        pending_overtime_hours = sum(
-            r.calculated_overtime_hours for r in pending_records
-        )
-
-        workdays_with_overtime = len(
-            [r for r in records if r.calculated_overtime_hours > 0]
-        )
-        anomaly_days = len([r for r in records if r.has_anomaly])
-
-        # 計算不一致筆數 (計算時數與申報時數差異 > 0.1)
-        discrepancy_count = sum(
-            1
-            for r in submitted_records
-            if r.reported_overtime_hours
-            and abs(r.calculated_overtime_hours - r.reported_overtime_hours) > 0.1
-        )
-
-        return OvertimeStatistics(
-            start_date=start_date,
-            end_date=end_date,
-            total_overtime_hours=total_overtime_hours,
-            submitted_overtime_hours=submitted_overtime_hours,
-            pending_overtime_hours=pending_overtime_hours,
-            total_days=len(records),
-            workdays_with_overtime=workdays_with_overtime,
-            pending_submission_days=len(pending_records),
-            anomaly_days=anomaly_days,
-            incomplete_punch_days=0,  # TODO: 實作打卡不完整檢測
-            discrepancy_count=discrepancy_count,
-        )
+        # 單次走訪累計;incomplete_punch_days 尚未實作 (TODO: 打卡不完整檢測)
+        return OvertimeStatistics.from_records(records, start_date, end_date)
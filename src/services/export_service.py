@@ -1,13 +1,20 @@
-"""匯出服務"""
+"""匯出服務
 
-import pandas as pd
+- Excel 以 openpyxl write-only 工作簿逐列寫入,不經過 pandas DataFrame
+- openpyxl 只在匯出 Excel、pandas 只在產生文字報表時才載入,
+  匯入本模組 (以及 src.services) 不會拖慢程式啟動
+"""
+
+import itertools
+import json
 from pathlib import Path
 from datetime import datetime
 import logging
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
 
-from ..models import OvertimeReport
+from ..models import AttendanceRecord, OvertimeReport
 from ..config import Settings
+from .exporters import ExportSchema, ExportTarget, get_exporter, schema_for
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +22,9 @@ logger = logging.getLogger(__name__)
 class ExportService:
     """匯出服務 - 處理報表匯出"""
 
+    # 記錄欄位 (Excel / JSON 報表共用)
+    COLUMNS = ("日期", "上班時間", "下班時間", "總工時(分)", "加班時數")
+
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or Settings()
         self._ensure_reports_folder()
@@ -40,79 +50,128 @@ class ExportService:
             logger.warning("沒有記錄可匯出")
             return None
 
-        if filename is None:
-            filename = f"{self.settings.EXCEL_FILENAME_PREFIX}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        return self.export_records_to_excel(report.records, filename)
 
-        if not filename.startswith("reports/"):
-            filename = f"reports/{filename}"
+    def export_records_to_excel(
+        self, records: Iterable[AttendanceRecord], filename: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        以串流方式匯出記錄為 Excel 檔案 (格式同 export_to_excel)
+
+        使用 openpyxl write-only 工作簿逐列寫入,統計資訊於寫入時累計,
+        不建立 DataFrame,記憶體用量不隨記錄數增加;records 可為產生器。
+
+        Args:
+            records: 出勤記錄 (可迭代物件)
+            filename: 檔案名稱 (可選)
+
+        Returns:
+            str: 匯出的檔案路徑,失敗則返回 None
+        """
+        filename = self._resolve_excel_filename(filename)
 
         try:
-            # 準備資料
-            data = []
-            for record in report.records:
-                data.append(
-                    {
-                        "日期": record.date,
-                        "上班時間": record.start_time,
-                        "下班時間": record.end_time,
-                        "總工時(分)": record.total_minutes,
-                        "加班時數": record.overtime_hours,
-                    }
-                )
+            from openpyxl import Workbook  # 延遲載入
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Alignment, Border, Font, Side
 
-            df = pd.DataFrame(data)
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet("加班記錄")
+
+            # 調整欄寬 (write-only 須在寫入資料前設定)
+            for column, width in zip("ABCDE", (15, 12, 12, 12, 12)):
+                worksheet.column_dimensions[column].width = width
+
+            # 表頭 (樣式同 pandas 匯出)
+            thin = Side(style="thin")
+            header = []
+            for title in self.COLUMNS:
+                cell = WriteOnlyCell(worksheet, value=title)
+                cell.font = Font(bold=True)
+                cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+                cell.alignment = Alignment(horizontal="center", vertical="top")
+                header.append(cell)
+            worksheet.append(header)
+
+            summary = _SummaryAccumulator()
+            for record in records:
+                worksheet.append(self._record_row(record))
+                summary.add(record)
 
             # 加入統計資料
-            summary = report.get_summary()
-            summary_df = pd.DataFrame(
-                {
-                    "日期": [
-                        "",
-                        "統計資訊",
-                        "記錄天數",
-                        "加班天數",
-                        "總加班時數",
-                        "平均每日加班",
-                        "最長加班",
-                        "最長加班日期",
-                    ],
-                    "上班時間": [
-                        "",
-                        "",
-                        summary["記錄天數"],
-                        summary["加班天數"],
-                        f"{summary['總加班時數']} hr",
-                        f"{summary['平均每日加班']} hr",
-                        f"{summary['最長加班']} hr",
-                        summary["最長加班日期"],
-                    ],
-                    "下班時間": [""] * 8,
-                    "總工時(分)": [""] * 8,
-                    "加班時數": [""] * 8,
-                }
-            )
-
-            final_df = pd.concat([df, summary_df], ignore_index=True)
-
-            # 寫入 Excel
-            with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-                final_df.to_excel(writer, sheet_name="加班記錄", index=False)
-
-                # 調整欄寬
-                worksheet = writer.sheets["加班記錄"]
-                worksheet.column_dimensions["A"].width = 15
-                worksheet.column_dimensions["B"].width = 12
-                worksheet.column_dimensions["C"].width = 12
-                worksheet.column_dimensions["D"].width = 12
-                worksheet.column_dimensions["E"].width = 12
-
-            logger.info(f"✓ 已匯出至: {filename}")
+            for row in summary.rows():
+                worksheet.append(row)
+
+            workbook.save(filename)
+
+            logger.info(f"✓ 已匯出至: {filename} ({summary.total_days} 筆)")
             return filename
 
         except Exception as e:
             logger.error(f"✗ 匯出 Excel 時發生錯誤: {e}")
             return None
 
+    def export_records(
+        self,
+        records: Iterable,
+        fmt: str,
+        target: ExportTarget,
+        schema: Optional[ExportSchema] = None,
+    ) -> Optional[int]:
+        """
+        以欄式格式 (csv / jsonl / parquet) 逐筆匯出記錄
+
+        欄位取自資料模型 (見 exporters 模組),供下游系統讀取。
+
+        Args:
+            records: OvertimeReport.records、AttendanceSnapshot.unified_records
+                     或 PersonalRecord 列表 (可為產生器)
+            fmt: 格式名稱 (exporters.available_formats())
+            target: 檔案路徑或已開啟的串流
+            schema: 欄位定義 (預設依第一筆記錄的類型決定)
+
+        Returns:
+            int: 寫入筆數,失敗則返回 None
+        """
+        records = iter(records)
+        if schema is None:
+            first = next(records, None)
+            if first is None:
+                logger.warning("沒有記錄可匯出")
+                return None
+            records = itertools.chain([first], records)
+
+        try:
+            if schema is None:
+                schema = schema_for(type(first))
+            count = get_exporter(fmt, schema).export(records, target)
+        except Exception as e:
+            logger.error(f"✗ 匯出 {fmt} 時發生錯誤: {e}")
+            return None
+
+        logger.info(f"✓ 已匯出 {count} 筆 {schema.name} ({fmt})")
+        return count
+
+    def write_json(self, report: OvertimeReport, stream: TextIO):
+        """
+        以 JSON 寫入報表 (產生時間、統計摘要、記錄)
+
+        Args:
+            report: 加班報表
+            stream: 文字串流
+        """
+        json.dump(
+            {
+                "generated_at": report.generated_at.isoformat(timespec="seconds"),
+                "summary": report.get_summary(),
+                "records": self._report_rows(report),
+            },
+            stream,
+            ensure_ascii=False,
+            indent=2,
+        )
+        stream.write("\n")
+
     def generate_text_report(
         self, report: OvertimeReport, show_all: bool = True
     ) -> str:
@@ -150,6 +209,8 @@ class ExportService:
                 )
 
         if data:
+            import pandas as pd  # 延遲載入
+
             df = pd.DataFrame(data)
             text += df.to_string(index=False)
         else:
@@ -172,3 +233,64 @@ class ExportService:
         text += "=" * 80 + "\n"
 
         return text
+
+    def _resolve_excel_filename(self, filename: Optional[str]) -> str:
+        """預設檔名與 reports 資料夾"""
+        if filename is None:
+            filename = f"{self.settings.EXCEL_FILENAME_PREFIX}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+
+        # 絕對路徑 (例如命令列指定的輸出檔) 不放入 reports 資料夾
+        if not filename.startswith("reports/") and not Path(filename).is_absolute():
+            filename = f"reports/{filename}"
+        return filename
+
+    @staticmethod
+    def _record_row(record: AttendanceRecord) -> Tuple:
+        """記錄轉為欄位值 (順序同 COLUMNS)"""
+        return (
+            record.date,
+            record.start_time,
+            record.end_time,
+            record.total_minutes,
+            record.overtime_hours,
+        )
+
+    @classmethod
+    def _report_rows(cls, report: OvertimeReport) -> List[Dict]:
+        """報表記錄轉為欄位字典"""
+        return [dict(zip(cls.COLUMNS, cls._record_row(r))) for r in report.records]
+
+
+class _SummaryAccumulator:
+    """逐筆累計統計摘要 (結果同 OvertimeReport.get_summary)"""
+
+    def __init__(self):
+        self.total_days = 0
+        self.overtime_days = 0
+        self.total_hours = 0.0
+        self.max_hours = 0.0
+        self.max_date = ""
+
+    def add(self, record: AttendanceRecord):
+        hours = record.overtime_hours
+        if self.total_days == 0 or hours > self.max_hours:
+            self.max_hours = hours
+            self.max_date = record.date
+        self.total_days += 1
+        self.total_hours += hours
+        if hours > 0:
+            self.overtime_days += 1
+
+    def rows(self) -> List[Tuple]:
+        """Excel 統計區塊 (日期欄為標題,上班時間欄為數值)"""
+        average = self.total_hours / self.total_days if self.total_days else 0.0
+        return [
+            (None, None),
+            ("統計資訊", None),
+            ("記錄天數", self.total_days),
+            ("加班天數", self.overtime_days),
+            ("總加班時數", f"{self.total_hours:.1f} hr"),
+            ("平均每日加班", f"{average:.1f} hr"),
+            ("最長加班", f"{self.max_hours:.1f} hr"),
+            ("最長加班日期", self.max_date),
+        ]
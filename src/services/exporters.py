@@ -0,0 +1,282 @@
+"""欄式資料匯出 (CSV / JSON-lines / Parquet)
+
+供下游系統 (薪資核對等) 讀取的匯出格式,與給人閱讀的 Excel 報表分開:
+
+- 欄位 (ExportSchema) 直接取自資料模型的欄位,同一種記錄在各格式的欄位名稱、順序與型別一致
+- 逐筆寫入 (Parquet 每 batch_size 筆寫入一個 row group),記憶體用量不隨記錄數增加
+- 以 register_exporter 註冊新格式;Parquet 需要 pyarrow (未安裝時不列入 available_formats)
+
+支援的記錄: AttendanceRecord (OvertimeReport.records)、
+UnifiedOvertimeRecord (AttendanceSnapshot.unified_records)、PersonalRecord
+"""
+
+import csv
+import importlib.util
+import json
+import logging
+import typing
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ..models import AttendanceRecord, PersonalRecord, UnifiedOvertimeRecord
+
+logger = logging.getLogger(__name__)
+
+# 匯出目標: 檔案路徑或已開啟的串流 (CSV / JSON-lines 為文字串流)
+ExportTarget = Union[str, Path, IO]
+
+_TYPE_NAMES = {str: "string", float: "float", int: "int", bool: "bool"}
+
+
+@dataclass(frozen=True)
+class Column:
+    """匯出欄位"""
+
+    name: str
+    type: str  # string / float / int / bool
+    getter: Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class ExportSchema:
+    """匯出欄位定義 (欄位名稱、順序與型別)"""
+
+    name: str
+    columns: Tuple[Column, ...]
+
+    @property
+    def names(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def row(self, record: Any) -> Tuple:
+        """記錄轉為欄位值 (順序同 columns)"""
+        return tuple(column.getter(record) for column in self.columns)
+
+    @classmethod
+    def from_dataclass(cls, record_type: type) -> "ExportSchema":
+        """以 dataclass 欄位建立 (Optional[X] 視為 X,值可為 None)"""
+        hints = typing.get_type_hints(record_type)
+        columns = []
+        for item in fields(record_type):
+            hint = hints[item.name]
+            args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+            if typing.get_origin(hint) is Union and len(args) == 1:
+                hint = args[0]
+            columns.append(
+                Column(
+                    name=item.name,
+                    type=_TYPE_NAMES.get(hint, "string"),
+                    getter=attrgetter(item.name),
+                )
+            )
+        return cls(name=record_type.__name__, columns=tuple(columns))
+
+
+ATTENDANCE_SCHEMA = ExportSchema.from_dataclass(AttendanceRecord)
+UNIFIED_SCHEMA = ExportSchema.from_dataclass(UnifiedOvertimeRecord)
+PERSONAL_SCHEMA = ExportSchema.from_dataclass(PersonalRecord)
+
+_SCHEMAS: Dict[type, ExportSchema] = {
+    AttendanceRecord: ATTENDANCE_SCHEMA,
+    UnifiedOvertimeRecord: UNIFIED_SCHEMA,
+    PersonalRecord: PERSONAL_SCHEMA,
+}
+
+
+def schema_for(record_type: type) -> ExportSchema:
+    """記錄類型對應的欄位定義"""
+    try:
+        return _SCHEMAS[record_type]
+    except KeyError:
+        raise ValueError(f"不支援匯出的記錄類型: {record_type.__name__}") from None
+
+
+class RecordExporter(ABC):
+    """
+    匯出格式基底類別
+
+    子類別設定 format / extension 並實作 _write,以 register_exporter 註冊。
+    """
+
+    format: ClassVar[str]
+    extension: ClassVar[str]
+    binary: ClassVar[bool] = False  # 是否需要二進位串流
+
+    def __init__(self, schema: ExportSchema, batch_size: int = 10000):
+        self.schema = schema
+        self.batch_size = max(batch_size, 1)
+
+    @classmethod
+    def available(cls) -> bool:
+        """相依套件是否已安裝"""
+        return True
+
+    def export(self, records: Iterable[Any], target: ExportTarget) -> int:
+        """
+        逐筆寫入記錄
+
+        Args:
+            records: 記錄 (可為產生器,類型須符合 schema)
+            target: 檔案路徑或已開啟的串流
+
+        Returns:
+            int: 寫入筆數
+        """
+        rows = (self.schema.row(record) for record in records)
+        if not isinstance(target, (str, Path)):
+            return self._write(rows, target)
+
+        if self.binary:
+            with open(target, "wb") as stream:
+                return self._write(rows, stream)
+        with open(target, "w", encoding="utf-8", newline="") as stream:
+            return self._write(rows, stream)
+
+    @abstractmethod
+    def _write(self, rows: Iterable[Tuple], stream: IO) -> int:
+        """寫入欄位值 (rows 為產生器),返回筆數"""
+
+
+_EXPORTERS: Dict[str, Type[RecordExporter]] = {}
+
+
+def register_exporter(exporter: Type[RecordExporter]) -> Type[RecordExporter]:
+    """註冊匯出格式 (可作為類別裝飾器)"""
+    _EXPORTERS[exporter.format] = exporter
+    return exporter
+
+
+def available_formats() -> List[str]:
+    """可使用的匯出格式 (相依套件已安裝)"""
+    return [name for name, exporter in _EXPORTERS.items() if exporter.available()]
+
+
+def get_exporter(fmt: str, schema: ExportSchema, **kwargs) -> RecordExporter:
+    """
+    取得匯出器
+
+    Args:
+        fmt: 格式名稱 (csv / jsonl / parquet)
+        schema: 欄位定義
+        **kwargs: 傳給匯出器的參數 (例如 batch_size)
+
+    Raises:
+        ValueError: 不支援的格式,或相依套件未安裝
+    """
+    exporter = _EXPORTERS.get(fmt)
+    if exporter is None:
+        raise ValueError(f"不支援的匯出格式: {fmt}")
+    if not exporter.available():
+        raise ValueError(f"{fmt} 格式需要安裝額外套件 (pip install pyarrow)")
+    return exporter(schema, **kwargs)
+
+
+@register_exporter
+class CsvExporter(RecordExporter):
+    """CSV (UTF-8,None 為空字串,布林值為 true / false)"""
+
+    format = "csv"
+    extension = ".csv"
+
+    def _write(self, rows: Iterable[Tuple], stream: IO) -> int:
+        writer = csv.writer(stream)
+        writer.writerow(self.schema.names)
+        count = 0
+        for row in rows:
+            writer.writerow(_csv_value(value) for value in row)
+            count += 1
+        return count
+
+
+@register_exporter
+class JsonLinesExporter(RecordExporter):
+    """JSON-lines (每行一筆記錄的 JSON 物件)"""
+
+    format = "jsonl"
+    extension = ".jsonl"
+
+    def _write(self, rows: Iterable[Tuple], stream: IO) -> int:
+        names = self.schema.names
+        count = 0
+        for row in rows:
+            stream.write(json.dumps(dict(zip(names, row)), ensure_ascii=False))
+            stream.write("\n")
+            count += 1
+        return count
+
+
+@register_exporter
+class ParquetExporter(RecordExporter):
+    """Parquet (需要 pyarrow,每 batch_size 筆寫入一個 row group)"""
+
+    format = "parquet"
+    extension = ".parquet"
+    binary = True
+
+    _ARROW_TYPES = {
+        "string": "string",
+        "float": "float64",
+        "int": "int64",
+        "bool": "bool_",
+    }
+
+    @classmethod
+    def available(cls) -> bool:
+        # 只檢查是否安裝,不在此載入 pyarrow
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def _write(self, rows: Iterable[Tuple], stream: IO) -> int:
+        import pyarrow as pa  # 選用套件,延遲載入
+        import pyarrow.parquet as pq
+
+        arrow_schema = pa.schema(
+            [
+                (column.name, getattr(pa, self._ARROW_TYPES[column.type])())
+                for column in self.schema.columns
+            ]
+        )
+
+        count = 0
+        with pq.ParquetWriter(stream, arrow_schema) as writer:
+            batch: List[Tuple] = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    writer.write_table(self._to_table(pa, arrow_schema, batch))
+                    count += len(batch)
+                    batch = []
+            if batch or count == 0:
+                writer.write_table(self._to_table(pa, arrow_schema, batch))
+                count += len(batch)
+        return count
+
+    @staticmethod
+    def _to_table(pa, arrow_schema, batch: List[Tuple]):
+        columns = list(zip(*batch)) if batch else [[] for _ in arrow_schema.names]
+        arrays = [
+            pa.array(values, type=field.type)
+            for values, field in zip(columns, arrow_schema)
+        ]
+        return pa.Table.from_arrays(arrays, schema=arrow_schema)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
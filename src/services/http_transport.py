@@ -0,0 +1,267 @@
+"""SSP 連線管理 (連線池、重試、壓縮、請求計時)
+
+AuthService 建立的 Session 會在 登入 → 同步 → 申報 全程共用,
+DataSyncService 也會在 ThreadPoolExecutor 中同時使用同一個 Session。
+本模組負責:
+- 連線池: 依平行抓取數量設定 pool 大小,維持 keep-alive 連線重用
+- 重試: 僅對冪等請求 (GET/HEAD) 以指數退避重試,POST 絕不重試
+- 壓縮: 明確協商 gzip / deflate
+- 計時: 記錄每個請求的 連線 (含 DNS)、TLS 交握、等待回應 (TTFB)、下載 時間
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from ..config import Settings
+
+logger = logging.getLogger(__name__)
+
+# 單一請求的連線計時 (urllib3 在呼叫端執行緒建立連線,因此以 thread-local 傳遞)
+_connect_timing = threading.local()
+
+
+@dataclass
+class RequestTiming:
+    """單一 HTTP 請求的計時結果 (秒)"""
+
+    method: str
+    path: str
+    status_code: int
+    connect_seconds: float  # 建立 TCP 連線 (含 DNS 解析),重用連線時為 0
+    tls_seconds: float  # TLS 交握
+    ttfb_seconds: float  # 送出請求至收到回應標頭 (含連線與交握)
+    download_seconds: float  # 讀取回應內容
+    content_bytes: int  # 解壓縮後內容大小
+    content_encoding: str  # 回應壓縮方式 (gzip / deflate / 空字串)
+    reused_connection: bool  # 是否重用既有連線
+    retries: int = 0  # 重試次數
+
+    @property
+    def total_seconds(self) -> float:
+        """總耗時"""
+        return self.ttfb_seconds + self.download_seconds
+
+    @property
+    def server_seconds(self) -> float:
+        """伺服器處理時間 (TTFB 扣除連線與交握)"""
+        return max(self.ttfb_seconds - self.connect_seconds - self.tls_seconds, 0.0)
+
+
+class RequestMetrics:
+    """
+    請求計時紀錄 (執行緒安全,只保留最近 N 筆)
+
+    使用方式:
+        ```python
+        metrics = auth_service.metrics
+        for path, stats in metrics.summary().items():
+            print(path, stats["count"], stats["avg_ttfb_seconds"])
+        ```
+    """
+
+    def __init__(self, max_entries: int = 500):
+        self._entries: Deque[RequestTiming] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming):
+        """新增一筆紀錄"""
+        with self._lock:
+            self._entries.append(timing)
+
+        logger.debug(
+            "HTTP %s %s %d: 總計 %.3fs (連線 %.3fs, TLS %.3fs, 伺服器 %.3fs, "
+            "下載 %.3fs, %d bytes, %s, %s)",
+            timing.method,
+            timing.path,
+            timing.status_code,
+            timing.total_seconds,
+            timing.connect_seconds,
+            timing.tls_seconds,
+            timing.server_seconds,
+            timing.download_seconds,
+            timing.content_bytes,
+            timing.content_encoding or "未壓縮",
+            "重用連線" if timing.reused_connection else "新連線",
+        )
+
+    def recent(self) -> List[RequestTiming]:
+        """取得所有保留中的紀錄 (由舊到新)"""
+        with self._lock:
+            return list(self._entries)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        依 method + path 彙總
+
+        Returns:
+            Dict: {"GET /FW99001Z.aspx": {"count", "avg_connect_seconds",
+                   "avg_tls_seconds", "avg_ttfb_seconds", "avg_total_seconds",
+                   "new_connections", "retries"}}
+        """
+        grouped: Dict[str, List[RequestTiming]] = {}
+        for timing in self.recent():
+            grouped.setdefault(f"{timing.method} {timing.path}", []).append(timing)
+
+        summary = {}
+        for key, timings in grouped.items():
+            count = len(timings)
+            summary[key] = {
+                "count": count,
+                "avg_connect_seconds": sum(t.connect_seconds for t in timings) / count,
+                "avg_tls_seconds": sum(t.tls_seconds for t in timings) / count,
+                "avg_ttfb_seconds": sum(t.ttfb_seconds for t in timings) / count,
+                "avg_total_seconds": sum(t.total_seconds for t in timings) / count,
+                "new_connections": sum(1 for t in timings if not t.reused_connection),
+                "retries": sum(t.retries for t in timings),
+            }
+        return summary
+
+    def clear(self):
+        """清除紀錄"""
+        with self._lock:
+            self._entries.clear()
+
+
+# === 計時連線 (urllib3) ===
+
+
+class _TimedConnectionMixin:
+    """記錄建立連線 (_new_conn: DNS + TCP) 與完整 connect (含 TLS) 的耗時"""
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _connect_timing.connect = time.perf_counter() - started
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            elapsed = time.perf_counter() - started
+            _connect_timing.tls = max(
+                elapsed - getattr(_connect_timing, "connect", 0.0), 0.0
+            )
+            _connect_timing.new_connection = True
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    記錄請求計時的 HTTPAdapter
+
+    非串流請求會在 adapter 內讀取回應內容,以便同時量測下載時間;
+    Session 之後讀取 response.content 時直接使用已讀取的內容。
+    """
+
+    def __init__(self, metrics: RequestMetrics, **kwargs):
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        _connect_timing.connect = 0.0
+        _connect_timing.tls = 0.0
+        _connect_timing.new_connection = False
+
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        ttfb = time.perf_counter() - started
+
+        download = 0.0
+        content_bytes = 0
+        if not kwargs.get("stream"):
+            download_started = time.perf_counter()
+            content_bytes = len(response.content)
+            download = time.perf_counter() - download_started
+
+        history = getattr(getattr(response.raw, "retries", None), "history", None)
+        self.metrics.record(
+            RequestTiming(
+                method=request.method,
+                path=urlsplit(request.url).path or "/",
+                status_code=response.status_code,
+                connect_seconds=_connect_timing.connect,
+                tls_seconds=_connect_timing.tls,
+                ttfb_seconds=ttfb,
+                download_seconds=download,
+                content_bytes=content_bytes,
+                content_encoding=response.headers.get("Content-Encoding", ""),
+                reused_connection=not _connect_timing.new_connection,
+                retries=len(history) if history else 0,
+            )
+        )
+        return response
+
+
+def create_session(
+    settings: Settings, metrics: Optional[RequestMetrics] = None
+) -> requests.Session:
+    """
+    建立 SSP 專用 Session
+
+    Args:
+        settings: 應用程式設定 (HTTP_POOL_SIZE / HTTP_MAX_RETRIES / HTTP_BACKOFF_FACTOR)
+        metrics: 請求計時紀錄 (預設建立新的)
+
+    Returns:
+        requests.Session: 已掛載連線池與重試設定的 Session
+    """
+    retry = Retry(
+        total=settings.HTTP_MAX_RETRIES,
+        backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = TimedHTTPAdapter(
+        metrics or RequestMetrics(),
+        pool_maxsize=settings.HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+    )
+    return session
@@ -1,6 +1,10 @@
 """加班補報表單填寫服務"""
 
 import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 import requests
 from bs4 import BeautifulSoup
@@ -8,9 +12,63 @@ import urllib3
 
 from ..config import Settings
 from ..models import OvertimeSubmissionRecord
+from ..parsers import PostbackState
 
 logger = logging.getLogger(__name__)
 
+# ViewState / EventValidation 驗證失敗的回應內容 (頁面文字,小寫比對;
+# 隱藏欄位 __VIEWSTATE 不屬於頁面文字,正常頁面不會符合)
+_STALE_STATE_INDICATORS = (
+    "viewstate",
+    "檢視狀態",
+    "state information is invalid",
+    "postback or callback argument",
+)
+
+
+@dataclass
+class _FormStateCache:
+    """
+    單一 Session 已準備好的表單狀態
+
+    ViewState 由用戶端帶回,同一份狀態可重複 PostBack,
+    因此每增加一列後的狀態都保留下來: 之後需要 N 列時,
+    從不超過 N 列的最大快取狀態繼續增加即可。
+    """
+
+    created_at: float  # time.monotonic(),取得初始頁面的時間
+    states: Dict[int, PostbackState] = field(default_factory=dict)  # 列數 → 狀態
+
+    def closest(self, row_count: int) -> int:
+        """不超過 row_count 的最大快取列數 (沒有時返回 0)"""
+        return max((rows for rows in self.states if rows <= row_count), default=0)
+
+
+@dataclass(frozen=True)
+class PreparedSubmission:
+    """
+    預覽產生的送出控制代碼
+
+    保存預覽時已增加好列數的表單狀態與填好的欄位,
+    submit_form(..., prepared=handle) 直接送出,不需再取得頁面或增加列。
+
+    使用方式:
+        ```python
+        preview = service.preview_form(session, records)
+        result = service.submit_form(session, records, prepared=preview["prepared"])
+        ```
+    """
+
+    state: PostbackState = field(repr=False)
+    form_data: Dict[str, str] = field(repr=False)  # 不含送出按鈕
+    records_count: int
+    created_at: float  # time.monotonic()
+    session_ref: "weakref.ReferenceType[requests.Session]" = field(repr=False)
+
+    def belongs_to(self, session: requests.Session) -> bool:
+        """是否由此 Session 預覽產生"""
+        return self.session_ref() is session
+
 
 class OvertimeReportService:
     """加班補報表單填寫服務"""
@@ -18,9 +76,28 @@ class OvertimeReportService:
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or Settings()
 
+        # 每個 Session 的表單狀態快取 (Session 釋放後自動移除)
+        self._form_caches: "weakref.WeakKeyDictionary[requests.Session, _FormStateCache]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._form_cache_lock = threading.Lock()
+
         if not self.settings.VERIFY_SSL:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+    def clear_form_cache(self, session: Optional[requests.Session] = None):
+        """
+        清除表單狀態快取
+
+        Args:
+            session: 只清除此 Session 的快取 (None 表示全部清除)
+        """
+        with self._form_cache_lock:
+            if session is None:
+                self._form_caches.clear()
+            else:
+                self._form_caches.pop(session, None)
+
     def preview_form(
         self, session: requests.Session, records: List[OvertimeSubmissionRecord]
     ) -> Dict[str, Any]:
@@ -34,31 +111,35 @@ class OvertimeReportService:
         Returns:
             預覽結果
         """
-        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
 
         try:
             logger.info(f"正在預覽填寫 {len(records)} 筆記錄...")
 
-            # 取得初始頁面
-            response = session.get(
-                url,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 如果需要多筆記錄,先增加列
-            if len(records) > 1:
-                soup = self._add_form_rows(session, soup, len(records) - 1)
+            # 取得已增加足夠列數的表單狀態 (送出時會重複使用)
+            state = self._prepare_form(session, len(records), timings)
 
             # 構建表單資料
-            form_data = self._build_form_data(soup, records)
+            step_started = time.perf_counter()
+            form_data = self._build_form_data(state, records)
+            timings["build_form"] = time.perf_counter() - step_started
+            timings["total"] = time.perf_counter() - started
+
+            prepared = PreparedSubmission(
+                state=state,
+                form_data=dict(form_data),
+                records_count=len(records),
+                created_at=time.monotonic(),
+                session_ref=weakref.ref(session),
+            )
 
             preview_result = {
                 "success": True,
                 "records_count": len(records),
                 "form_data": form_data,
+                "prepared": prepared,
+                "timings": timings,
                 "preview_data": [
                     {
                         "date": r.date,
@@ -79,7 +160,10 @@ class OvertimeReportService:
             return {"success": False, "error": str(e)}
 
     def submit_form(
-        self, session: requests.Session, records: List[OvertimeSubmissionRecord]
+        self,
+        session: requests.Session,
+        records: List[OvertimeSubmissionRecord],
+        prepared: Optional[PreparedSubmission] = None,
     ) -> Dict[str, Any]:
         """
         送出加班補報表單
@@ -87,9 +171,11 @@ class OvertimeReportService:
         Args:
             session: 已登入的 Session
             records: 要送出的記錄列表
+            prepared: preview_form 返回的 "prepared" (記錄與預覽時相同才使用)
 
         Returns:
-            送出結果
+            送出結果 (以快取或預覽的表單狀態送出被伺服器拒絕時,
+            會重新取得頁面再送出一次,結果帶 "rebuilt": True)
         """
         # Beta 版本檢查
         if not self.settings.ENABLE_SUBMISSION:
@@ -99,94 +185,243 @@ class OvertimeReportService:
                 "error": "此功能尚在測試階段,無法實際送出。請使用「預覽填寫」功能。",
             }
 
-        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        rebuilt = False
 
         try:
             logger.info(f"正在送出 {len(records)} 筆加班申請...")
 
-            # 取得初始頁面
-            response = session.get(
-                url,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 如果需要多筆記錄,先增加列
-            if len(records) > 1:
-                soup = self._add_form_rows(session, soup, len(records) - 1)
-
-            # 構建表單資料
-            form_data = self._build_form_data(soup, records)
+            # 預覽時填好的欄位可直接送出
+            form_data = self._prepared_form_data(session, records, prepared)
+            if form_data is None:
+                form_data = self._rebuild_form_data(session, records, timings)
+                reused_state = "fetch_form" not in timings
+            else:
+                logger.debug("使用預覽的表單狀態送出")
+                reused_state = True
 
-            # 加入送出按鈕
-            form_data["ctl00$ContentPlaceHolder1$btnCommit"] = "送出"
+            response = self._post_commit(session, form_data, timings)
 
-            # 送出表單
-            response = session.post(
-                url,
-                data=form_data,
-                timeout=self.settings.REQUEST_TIMEOUT,
-                verify=self.settings.VERIFY_SSL,
-            )
+            # 重複使用的狀態已失效 (伺服器拒絕 ViewState),重新建立表單後再送出
+            if reused_state and self._is_rejected_state(response):
+                logger.warning("表單狀態已失效,重新取得頁面後再送出")
+                self.clear_form_cache(session)
+                form_data = self._rebuild_form_data(session, records, timings)
+                response = self._post_commit(session, form_data, timings)
+                rebuilt = True
 
             # 檢查送出結果
             success = self._check_submission_result(response.text)
+            timings["total"] = time.perf_counter() - started
+
+            # 送出後伺服器端狀態已改變,快取的狀態不再重複使用
+            self.clear_form_cache(session)
 
             if success:
                 logger.info(f"✓ 成功送出 {len(records)} 筆加班申請")
-                return {"success": True, "submitted_count": len(records)}
+                result = {
+                    "success": True,
+                    "submitted_count": len(records),
+                    "timings": timings,
+                }
             else:
                 logger.error("✗ 送出失敗")
-                return {"success": False, "error": "表單送出失敗,請檢查日誌"}
+                result = {
+                    "success": False,
+                    "error": "表單送出失敗,請檢查日誌",
+                    "timings": timings,
+                }
+
+            if rebuilt:
+                result["rebuilt"] = True
+            return result
 
         except Exception as e:
             logger.error(f"✗ 送出失敗: {e}")
+            self.clear_form_cache(session)
             return {"success": False, "error": str(e)}
 
+    def _prepared_form_data(
+        self,
+        session: requests.Session,
+        records: List[OvertimeSubmissionRecord],
+        prepared: Optional[PreparedSubmission],
+    ) -> Optional[Dict[str, str]]:
+        """
+        檢查預覽的控制代碼是否可用於這次送出
+
+        Returns:
+            Dict | None: 可用時返回表單資料副本,否則返回 None (需重新建立)
+        """
+        if prepared is None:
+            return None
+
+        if not prepared.belongs_to(session):
+            logger.warning("預覽的表單狀態不屬於目前的 Session,重新建立表單")
+            return None
+
+        if time.monotonic() - prepared.created_at > self.settings.FORM_STATE_CACHE_SECONDS:
+            logger.info("預覽的表單狀態已過期,重新建立表單")
+            return None
+
+        if self._build_form_data(prepared.state, records) != prepared.form_data:
+            logger.warning("送出的記錄與預覽時不同,重新建立表單")
+            return None
+
+        return dict(prepared.form_data)
+
+    def _rebuild_form_data(
+        self,
+        session: requests.Session,
+        records: List[OvertimeSubmissionRecord],
+        timings: Dict[str, float],
+    ) -> Dict[str, str]:
+        """取得 (或從快取繼續增加列) 表單狀態並填入記錄"""
+        state = self._prepare_form(session, len(records), timings)
+
+        step_started = time.perf_counter()
+        form_data = self._build_form_data(state, records)
+        timings["build_form"] = time.perf_counter() - step_started
+        return form_data
+
+    def _post_commit(
+        self,
+        session: requests.Session,
+        form_data: Dict[str, str],
+        timings: Dict[str, float],
+    ) -> requests.Response:
+        """按下「送出」按鈕"""
+        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
+
+        # 加入送出按鈕
+        form_data = dict(form_data)
+        form_data["ctl00$ContentPlaceHolder1$btnCommit"] = "送出"
+
+        step_started = time.perf_counter()
+        response = session.post(
+            url,
+            data=form_data,
+            timeout=self.settings.REQUEST_TIMEOUT,
+            verify=self.settings.VERIFY_SSL,
+        )
+        timings["submit"] = timings.get("submit", 0.0) + time.perf_counter() - step_started
+        return response
+
+    @staticmethod
+    def _is_rejected_state(response: requests.Response) -> bool:
+        """
+        伺服器是否因 ViewState / EventValidation 無效而拒絕 PostBack
+
+        ASP.NET 在處理按鈕事件前就會驗證狀態,此時表單尚未送出,可安全重送。
+        錯誤頁面可能以 500、200 或轉向後的頁面回應,因此不以狀態碼判斷,
+        只比對頁面文字。
+        """
+        text = BeautifulSoup(response.text, "html.parser").get_text().lower()
+        return any(indicator in text for indicator in _STALE_STATE_INDICATORS)
+
+    def _prepare_form(
+        self,
+        session: requests.Session,
+        row_count: int,
+        timings: Dict[str, float],
+    ) -> PostbackState:
+        """
+        取得已有 row_count 列的表單狀態
+
+        從快取中不超過 row_count 列的最大狀態繼續增加列,
+        沒有可用的快取 (或已超過 FORM_STATE_CACHE_SECONDS) 時才重新取得頁面。
+
+        Args:
+            session: 已登入的 Session
+            row_count: 需要的列數 (至少 1 列)
+            timings: 記錄各步驟耗時 (fetch_form / add_rows,秒)
+
+        Returns:
+            PostbackState: 表單狀態
+        """
+        row_count = max(row_count, 1)
+
+        with self._form_cache_lock:
+            cache = self._form_caches.get(session)
+            if cache and time.monotonic() - cache.created_at > (
+                self.settings.FORM_STATE_CACHE_SECONDS
+            ):
+                logger.debug("表單狀態快取已過期")
+                cache = None
+                self._form_caches.pop(session, None)
+            base_rows = cache.closest(row_count) if cache else 0
+            state = cache.states[base_rows] if base_rows else None
+
+        if not base_rows:
+            step_started = time.perf_counter()
+            cache = _FormStateCache(created_at=time.monotonic())
+            state = self._fetch_form_state(session)
+            timings["fetch_form"] = time.perf_counter() - step_started
+            if not state:
+                raise ValueError("找不到 ViewState")
+            base_rows = 1
+            cache.states[base_rows] = state
+            with self._form_cache_lock:
+                self._form_caches[session] = cache
+        else:
+            logger.debug(f"使用快取的 {base_rows} 列表單狀態")
+
+        # 如果需要多筆記錄,從快取狀態繼續增加列
+        if row_count > base_rows:
+            step_started = time.perf_counter()
+            state = self._add_form_rows(
+                session, state, row_count - base_rows, cache, base_rows
+            )
+            timings["add_rows"] = time.perf_counter() - step_started
+
+        return state
+
+    def _fetch_form_state(self, session: requests.Session) -> Optional[PostbackState]:
+        """取得初始 (1 列) 表單頁面的 PostBack 隱藏欄位"""
+        url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
+        response = session.get(
+            url,
+            timeout=self.settings.REQUEST_TIMEOUT,
+            verify=self.settings.VERIFY_SSL,
+        )
+
+        # 只擷取 PostBack 隱藏欄位,不建立整份頁面的 DOM
+        return PostbackState.from_html(response.content)
+
     def _add_form_rows(
-        self, session: requests.Session, soup: BeautifulSoup, count: int
-    ) -> BeautifulSoup:
+        self,
+        session: requests.Session,
+        state: Optional[PostbackState],
+        count: int,
+        cache: Optional[_FormStateCache] = None,
+        start_rows: int = 1,
+    ) -> Optional[PostbackState]:
         """
         增加表單列
 
         Args:
             session: 已登入的 Session
-            soup: 當前頁面的 BeautifulSoup 物件
+            state: 當前頁面的 PostBack 隱藏欄位
             count: 要增加的列數
+            cache: 記錄每增加一列後的狀態 (None 表示不快取)
+            start_rows: state 目前的列數
 
         Returns:
-            更新後的 BeautifulSoup 物件
+            增加列之後頁面的 PostBack 隱藏欄位
         """
         url = f"{self.settings.SSP_BASE_URL}{self.settings.OVERTIME_REPORT_URL}"
 
         try:
             for i in range(count):
-                logger.debug(f"正在增加第 {i + 1} 列...")
+                logger.debug(f"正在增加第 {start_rows + i + 1} 列...")
+                step_started = time.perf_counter()
 
-                # 提取 ViewState
-                viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-                viewstate_generator = soup.find(
-                    "input", {"name": "__VIEWSTATEGENERATOR"}
-                )
-                event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
-
-                if not viewstate:
+                if not state:
                     raise ValueError("找不到 ViewState")
 
                 # 準備 PostBack 資料 (觸發「增加列」)
-                post_data = {
-                    "__EVENTTARGET": "ctl00$ContentPlaceHolder1$lbgvAddRowi",
-                    "__EVENTARGUMENT": "",
-                    "__VIEWSTATE": viewstate["value"],
-                    "__VIEWSTATEGENERATOR": (
-                        viewstate_generator["value"] if viewstate_generator else ""
-                    ),
-                    "__EVENTVALIDATION": (
-                        event_validation["value"] if event_validation else ""
-                    ),
-                }
+                post_data = state.to_form("ctl00$ContentPlaceHolder1$lbgvAddRowi")
 
                 # 發送 PostBack 請求
                 response = session.post(
@@ -196,44 +431,38 @@ class OvertimeReportService:
                     verify=self.settings.VERIFY_SSL,
                 )
 
-                # 更新 soup
-                soup = BeautifulSoup(response.text, "html.parser")
+                # 更新隱藏欄位 (下一次 PostBack 使用)
+                state = PostbackState.from_html(response.content)
+                logger.debug(f"  耗時 {time.perf_counter() - step_started:.3f}s")
+
+                if cache is not None and state:
+                    with self._form_cache_lock:
+                        cache.states[start_rows + i + 1] = state
 
             logger.debug(f"✓ 成功增加 {count} 列")
-            return soup
+            return state
 
         except Exception as e:
             logger.error(f"✗ 增加列失敗: {e}")
             raise
 
     def _build_form_data(
-        self, soup: BeautifulSoup, records: List[OvertimeSubmissionRecord]
+        self, state: Optional[PostbackState], records: List[OvertimeSubmissionRecord]
     ) -> Dict[str, str]:
         """
         構建表單資料
 
         Args:
-            soup: BeautifulSoup 物件
+            state: 表單頁面的 PostBack 隱藏欄位
             records: 記錄列表
 
         Returns:
             表單資料字典
         """
-        # 提取 ViewState 等必要欄位
-        viewstate = soup.find("input", {"name": "__VIEWSTATE"})
-        viewstate_generator = soup.find("input", {"name": "__VIEWSTATEGENERATOR"})
-        event_validation = soup.find("input", {"name": "__EVENTVALIDATION"})
-
-        if not viewstate:
+        if not state:
             raise ValueError("找不到 ViewState")
 
-        form_data = {
-            "__VIEWSTATE": viewstate["value"],
-            "__VIEWSTATEGENERATOR": (
-                viewstate_generator["value"] if viewstate_generator else ""
-            ),
-            "__EVENTVALIDATION": event_validation["value"] if event_validation else "",
-        }
+        form_data = state.to_form()
 
         # 填寫每筆記錄 (第一筆從 ctl03 開始,0-based index)
         for index, record in enumerate(records):
@@ -0,0 +1,185 @@
+"""異常記錄與個人記錄合併
+
+兩個來源的記錄皆依日期由新到舊排列 (gvWeb012 與 gvFlow211 的頁面順序),
+因此以 merge-join 一次走訪兩個列表即可合併,不需建立索引或最後再排序:
+
+- 同一日期有異常記錄時,每筆異常記錄產生一筆統一記錄,
+  並以該日期最後一筆個人記錄補上申報狀態
+- 只有個人記錄的日期 (如手動申請調休),每筆個人記錄產生一筆統一記錄
+- 輸入未依日期排序時先以穩定排序整理 (結果與排序後合併相同)
+
+merge_unified_records 以相同方式將新的一批統一記錄合併進既有快照。
+"""
+
+import logging
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from ..models import UnifiedOvertimeRecord
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def merge_overtime_records(
+    anomaly_records: Sequence[Dict], personal_records: Sequence[Dict]
+) -> Iterator[UnifiedOvertimeRecord]:
+    """
+    合併異常記錄與個人記錄,依日期由新到舊產生統一記錄
+
+    Args:
+        anomaly_records: 異常記錄列表 (來自 gvWeb012)
+        personal_records: 個人記錄列表 (來自 gvFlow211)
+
+    Yields:
+        UnifiedOvertimeRecord: 統一記錄
+    """
+    anomalies = _descending(anomaly_records, lambda r: r["date"], "異常記錄")
+    personals = _descending(personal_records, lambda r: r["date"], "個人記錄")
+    # 只在 debug 開啟時組合每筆記錄的日誌
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    for date, anomaly_group, personal_group in _join(
+        anomalies, personals, lambda r: r["date"]
+    ):
+        if not anomaly_group:
+            # 補充個人記錄中但不在異常清單的記錄 (如手動申請調休)
+            for personal in personal_group:
+                if debug:
+                    _log_personal("補充個人記錄", date, personal)
+                yield _from_personal(personal)
+            continue
+
+        # 同一日期有多筆個人記錄時以最後一筆為準
+        personal = personal_group[-1] if personal_group else None
+        if debug and personal:
+            _log_personal("合併記錄", date, personal)
+        for anomaly in anomaly_group:
+            yield _from_anomaly(anomaly, personal)
+
+
+def merge_unified_records(
+    existing: Sequence[UnifiedOvertimeRecord],
+    incoming: Sequence[UnifiedOvertimeRecord],
+) -> Iterator[UnifiedOvertimeRecord]:
+    """
+    將新的一批統一記錄合併進既有記錄,依日期由新到舊產生
+
+    新一批中出現的日期以新記錄取代既有記錄,其餘日期保留既有記錄。
+
+    Args:
+        existing: 既有記錄 (例如快照的 unified_records)
+        incoming: 新的一批記錄
+
+    Yields:
+        UnifiedOvertimeRecord: 統一記錄
+    """
+    existing = _descending(existing, lambda r: r.date, "既有記錄")
+    incoming = _descending(incoming, lambda r: r.date, "新記錄")
+
+    for _, existing_group, incoming_group in _join(
+        existing, incoming, lambda r: r.date
+    ):
+        yield from incoming_group or existing_group
+
+
+# === 私有函式 ===
+
+
+def _join(
+    left: Sequence[T], right: Sequence[T], key: Callable[[T], str]
+) -> Iterator[Tuple[str, List[T], List[T]]]:
+    """
+    依日期由新到舊走訪兩個已排序的列表
+
+    Yields:
+        Tuple: (日期, 左側該日期的記錄, 右側該日期的記錄)
+    """
+    i = j = 0
+    left_count, right_count = len(left), len(right)
+
+    while i < left_count or j < right_count:
+        if j >= right_count:
+            date = key(left[i])
+        elif i >= left_count:
+            date = key(right[j])
+        else:
+            date = max(key(left[i]), key(right[j]))
+
+        left_start = i
+        while i < left_count and key(left[i]) == date:
+            i += 1
+        right_start = j
+        while j < right_count and key(right[j]) == date:
+            j += 1
+
+        yield date, list(left[left_start:i]), list(right[right_start:j])
+
+
+def _descending(
+    records: Sequence[T], key: Callable[[T], str], label: str
+) -> Sequence[T]:
+    """已依日期由新到舊排列時直接返回,否則返回穩定排序後的副本"""
+    for index in range(1, len(records)):
+        if key(records[index - 1]) < key(records[index]):
+            logger.debug("%s未依日期排序,先行排序", label)
+            return sorted(records, key=key, reverse=True)
+    return records
+
+
+def _split_punch_range(punch_range: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """解析 punch_range (格式: "09:00:15~19:31:09")"""
+    if punch_range:
+        times = punch_range.strip().split("~")
+        if len(times) == 2:
+            return times[0].strip(), times[1].strip()
+    return None, None
+
+
+def _from_anomaly(anomaly: Dict, personal: Optional[Dict]) -> UnifiedOvertimeRecord:
+    punch_start, punch_end = _split_punch_range(anomaly.get("punch_range"))
+    return UnifiedOvertimeRecord(
+        date=anomaly["date"],
+        punch_start=punch_start,
+        punch_end=punch_end,
+        calculated_overtime_hours=anomaly.get("overtime_hours", 0.0),
+        has_anomaly=True,
+        anomaly_description=anomaly.get("description"),
+        submitted=personal is not None,
+        submission_content=personal.get("content") if personal else None,
+        submission_status=personal.get("status") if personal else None,
+        submission_type=personal.get("report_type") if personal else None,
+        reported_overtime_hours=personal.get("overtime_hours") if personal else None,
+        monthly_total=personal.get("monthly_total") if personal else None,
+        quarterly_total=personal.get("quarterly_total") if personal else None,
+    )
+
+
+def _from_personal(personal: Dict) -> UnifiedOvertimeRecord:
+    return UnifiedOvertimeRecord(
+        date=personal["date"],
+        punch_start=None,
+        punch_end=None,
+        calculated_overtime_hours=0.0,
+        has_anomaly=False,
+        anomaly_description=None,
+        submitted=True,
+        submission_content=personal.get("content"),
+        submission_status=personal.get("status"),
+        submission_type=personal.get("report_type"),
+        reported_overtime_hours=personal.get("overtime_hours", 0.0),
+        monthly_total=personal.get("monthly_total"),
+        quarterly_total=personal.get("quarterly_total"),
+    )
+
+
+def _log_personal(prefix: str, date: str, personal: Dict):
+    logger.debug(
+        "%s %s: 類型=%s, 時數=%s, 月累計=%s, 季累計=%s",
+        prefix,
+        date,
+        personal.get("report_type"),
+        personal.get("overtime_hours"),
+        personal.get("monthly_total"),
+        personal.get("quarterly_total"),
+    )
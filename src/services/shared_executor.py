@@ -0,0 +1,67 @@
+"""服務層共用的執行緒池
+
+平行抓取 (DataSyncService 的頁面、DataService 的分頁) 與背景更新共用同一個執行緒池,
+不為每次抓取建立、關閉新的執行緒池:
+
+- GUI 注入 EventLoopThread.executor;未注入時使用本模組共用的執行緒池 (首次使用時建立)
+- map_in_order 依序取得結果,尚未開始的工作 (執行緒池忙碌) 改在目前執行緒執行,
+  呼叫端本身在同一個執行緒池中時也不會互相等待
+"""
+
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from ..config.settings import Settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 與連線池大小相同,平行抓取時每個執行緒都有可用的連線
+_SHARED_EXECUTOR_WORKERS = Settings.HTTP_POOL_SIZE
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def default_executor() -> ThreadPoolExecutor:
+    """取得模組共用的執行緒池"""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=_SHARED_EXECUTOR_WORKERS, thread_name_prefix="ssp-fetch"
+            )
+        return _shared_executor
+
+
+def map_in_order(
+    executor: Executor, fn: Callable[[T], R], items: Iterable[T]
+) -> List[R]:
+    """
+    以執行緒池平行執行 fn,依 items 順序返回結果
+
+    尚未開始的工作取消後在目前執行緒執行;任一工作失敗時取消其餘工作並拋出例外。
+
+    Args:
+        executor: 執行緒池
+        fn: 要執行的函式
+        items: 參數列表
+
+    Returns:
+        List: 結果 (順序同 items)
+    """
+    items = list(items)
+    futures = [executor.submit(fn, item) for item in items]
+
+    results: List[R] = []
+    try:
+        for item, future in zip(items, futures):
+            if future.cancel():
+                results.append(fn(item))
+            else:
+                results.append(future.result())
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return results
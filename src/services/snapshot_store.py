@@ -0,0 +1,216 @@
+"""出勤快照持久化儲存
+
+將 AttendanceSnapshot 寫入使用者快取目錄 (Settings.CACHE_DIR/snapshots),
+不隨啟動時的工作目錄改變,也不會寫入原始碼目錄。應用程式重新啟動或重新登入時
+可直接從磁碟載入,不必等待 SSP 系統回應 (約 6~13 秒)。
+
+檔案格式 (JSON Lines, UTF-8):
+- 第 1 行: 標頭 (格式版本、抓取時間、日期範圍、額度、統計)
+- 其餘每行: 一筆記錄 {"kind": "punch" | "leave" | "unified", "data": {...}}
+
+寫入採「暫存檔 + os.replace」,程式中斷時不會留下損毀的快照檔。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..config.settings import Settings
+from ..models.attendance import UnifiedOvertimeRecord
+from ..models.leave import LeaveRecord
+from ..models.punch import PunchRecord
+from ..models.quota import AttendanceQuota
+from ..models.snapshot import AttendanceSnapshot, OvertimeStatistics
+
+logger = logging.getLogger(__name__)
+
+# 快照檔案格式版本 (資料模型變更時遞增,舊檔案會被忽略)
+FORMAT_VERSION = 1
+
+
+class SnapshotStore:
+    """
+    出勤快照磁碟快取
+
+    使用方式:
+        ```python
+        store = SnapshotStore(settings=settings)
+        key = SnapshotStore.make_key(username)
+        store.save(key, snapshot)
+        snapshot = store.load(key, max_age_seconds=300)  # 過期則返回 None
+        ```
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, settings: Optional[Settings] = None
+    ):
+        """
+        初始化快照儲存
+
+        Args:
+            cache_dir: 快照目錄 (預設 Settings.CACHE_DIR/snapshots)
+            settings: 應用程式設定 (未指定 cache_dir 時使用)
+        """
+        if cache_dir is None:
+            cache_dir = Path((settings or Settings()).CACHE_DIR) / "snapshots"
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def make_key(username: str, period: Optional[str] = None) -> str:
+        """
+        產生快取鍵 (使用者 + 資料期間)
+
+        SSP 頁面顯示的是當期資料,因此預設以當月 (YYYY-MM) 為期間,
+        跨月後自動使用新的快取檔。使用者名稱以雜湊表示,不直接出現在檔名。
+
+        Args:
+            username: 登入帳號
+            period: 資料期間 (預設為當月)
+
+        Returns:
+            str: 快取鍵
+        """
+        period = period or datetime.now().strftime("%Y-%m")
+        user_hash = hashlib.sha256(username.encode("utf-8")).hexdigest()[:16]
+        return f"{user_hash}_{period}"
+
+    def load(
+        self, key: str, max_age_seconds: Optional[float] = None
+    ) -> Optional[AttendanceSnapshot]:
+        """
+        載入快照
+
+        Args:
+            key: 快取鍵
+            max_age_seconds: 最大有效時間 (秒),None 表示不檢查
+
+        Returns:
+            AttendanceSnapshot | None: 快照,不存在、過期或無法讀取時返回 None
+        """
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+
+        try:
+            with path.open("r", encoding="utf-8") as fp:
+                header = json.loads(fp.readline())
+                if header.get("version") != FORMAT_VERSION:
+                    logger.info("快照格式版本不符,忽略: %s", path.name)
+                    return None
+
+                fetched_at = datetime.fromisoformat(header["fetched_at"])
+                age = (datetime.now() - fetched_at).total_seconds()
+                if max_age_seconds is not None and age >= max_age_seconds:
+                    logger.debug("磁碟快照已過期 (age: %.1f 秒)", age)
+                    return None
+
+                snapshot = AttendanceSnapshot(
+                    start_date=header["start_date"],
+                    end_date=header["end_date"],
+                    fetched_at=fetched_at,
+                    quota=(
+                        AttendanceQuota(**header["quota"]) if header["quota"] else None
+                    ),
+                    statistics=(
+                        OvertimeStatistics(**header["statistics"])
+                        if header["statistics"]
+                        else None
+                    ),
+                )
+
+                for line in fp:
+                    entry = json.loads(line)
+                    kind, data = entry["kind"], entry["data"]
+                    if kind == "punch":
+                        snapshot.punch_records.append(PunchRecord(**data))
+                    elif kind == "leave":
+                        snapshot.leave_records.append(LeaveRecord(**data))
+                    elif kind == "unified":
+                        snapshot.unified_records.append(UnifiedOvertimeRecord(**data))
+
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("讀取磁碟快照失敗,忽略: %s", error)
+            return None
+
+        logger.info(
+            "載入磁碟快照: %d 筆記錄 (age: %.1f 秒)", snapshot.record_count, age
+        )
+        return snapshot
+
+    def save(self, key: str, snapshot: AttendanceSnapshot) -> bool:
+        """
+        儲存快照 (原子寫入)
+
+        Args:
+            key: 快取鍵
+            snapshot: 出勤快照
+
+        Returns:
+            bool: 是否儲存成功 (失敗只記錄警告,不影響主流程)
+        """
+        path = self._path_for(key)
+        header = {
+            "version": FORMAT_VERSION,
+            "fetched_at": snapshot.fetched_at.isoformat(),
+            "start_date": snapshot.start_date,
+            "end_date": snapshot.end_date,
+            "quota": asdict(snapshot.quota) if snapshot.quota else None,
+            "statistics": asdict(snapshot.statistics) if snapshot.statistics else None,
+        }
+
+        temp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                prefix=f".{path.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as fp:
+                temp_name = fp.name
+                fp.write(self._dumps(header))
+                for kind, records in (
+                    ("punch", snapshot.punch_records),
+                    ("leave", snapshot.leave_records),
+                    ("unified", snapshot.unified_records),
+                ):
+                    for record in records:
+                        fp.write(self._dumps({"kind": kind, "data": asdict(record)}))
+                fp.flush()
+                os.fsync(fp.fileno())
+
+            os.replace(temp_name, path)
+        except OSError as error:
+            logger.warning("儲存磁碟快照失敗: %s", error)
+            if temp_name and os.path.exists(temp_name):
+                os.remove(temp_name)
+            return False
+
+        logger.debug("已儲存磁碟快照: %s", path.name)
+        return True
+
+    def delete(self, key: str):
+        """刪除快照"""
+        try:
+            self._path_for(key).unlink(missing_ok=True)
+        except OSError as error:
+            logger.warning("刪除磁碟快照失敗: %s", error)
+
+    # === 私有方法 ===
+
+    def _path_for(self, key: str) -> Path:
+        """快照檔案路徑"""
+        return self.cache_dir / f"{key}.jsonl"
+
+    @staticmethod
+    def _dumps(data: dict) -> str:
+        """序列化為單行 JSON"""
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
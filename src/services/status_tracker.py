@@ -0,0 +1,372 @@
+"""加班申請狀態增量追蹤
+
+送出後確認審核狀態時,個人記錄頁面 (FW21003Z.aspx) 的內容幾乎不變:
+新的申請出現在表格最上方,其餘只有「簽核中」的記錄可能改變狀態。
+每次都重新解析整份表格並不必要。
+
+本模組記住上次解析的每一列 (以列內容雜湊為指紋):
+- 從表格頂端逐列比對,只解析新出現或內容改變的列
+- 遇到已知的列、且所有簽核中的記錄都已重新比對過時停止,
+  其餘列沿用上次的結果 (以資料列總數驗證,不符時改為完整解析)
+- 伺服器提供 ETag / Last-Modified 時送出條件式請求,304 表示沒有變化
+- 依是否有變化調整輪詢間隔 (有變化時重設為最短間隔,否則逐次加倍)
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from ..parsers.personal_record_parser import PersonalRecordParser
+
+logger = logging.getLogger(__name__)
+
+_TABLE_ID = "ContentPlaceHolder1_gvFlow211"
+
+# 資料列開頭標籤 (表頭與分頁列不含這些樣式)
+_DATA_ROW_TAG = re.compile(
+    r"<tr\b[^>]*\bclass=[\"'](?:%s)[\"']"
+    % "|".join(PersonalRecordParser.DATA_ROW_CLASSES)
+)
+
+# 表格開始標籤的 id 屬性 (接受單引號或雙引號)
+_TABLE_ID_ATTR = re.compile(r"\bid=[\"']%s[\"']" % _TABLE_ID)
+
+# 切出資料列時追蹤的結構標籤
+_STRUCTURE_TAG = re.compile(r"<(/?)(table|tr)\b[^>]*>", re.IGNORECASE)
+
+# 列內元素 id 的列索引 (..._lblOT_Date_12"),新記錄插入後索引會位移,比對前統一為 0
+_ROW_INDEX = re.compile(r"(id=[\"']%s_\w+?_)\d+([\"'])" % _TABLE_ID)
+
+PENDING_STATUSES = ("簽核中",)
+
+
+def _normalize_row(row_html: str) -> str:
+    """將列內元素 id 的列索引統一為 0"""
+    return _ROW_INDEX.sub(r"\g<1>0\2", row_html)
+
+
+@dataclass
+class StatusPollResult:
+    """單次輪詢結果"""
+
+    records: List[Dict]  # 完整記錄列表 (格式同 PersonalRecordParser.parse_records)
+    changed: List[Dict] = field(default_factory=list)  # 新出現或內容改變的記錄
+    parsed_rows: int = 0  # 實際解析的列數
+    total_rows: int = 0
+    full: bool = False  # 是否為完整解析
+    not_modified: bool = False  # 伺服器回應 304
+
+
+class OvertimeStatusTracker:
+    """
+    個人記錄增量追蹤
+
+    使用方式:
+        ```python
+        tracker = OvertimeStatusTracker()
+        response = session.get(url, headers=tracker.conditional_headers())
+        result = tracker.poll_response(response)
+        for record in result.changed:
+            ...
+        delay = tracker.next_interval()  # None 表示沒有簽核中的記錄,不需輪詢
+        ```
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 30.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        parser: Optional[PersonalRecordParser] = None,
+    ):
+        """
+        初始化追蹤器
+
+        Args:
+            min_interval: 最短輪詢間隔 (秒)
+            max_interval: 最長輪詢間隔 (秒)
+            backoff: 沒有變化時間隔的倍數
+            parser: 個人記錄解析器 (依 PARSER_BACKEND 選擇,預設 PersonalRecordParser)
+        """
+        self.parser = parser or PersonalRecordParser()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._interval = min_interval
+
+        # 上次的結果: 依表格順序的 (指紋, 記錄)
+        self._rows: List[Tuple[int, Dict]] = []
+        self._positions: Dict[int, int] = {}  # 指紋 → 第一次出現的位置
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+
+    # === 狀態 ===
+
+    @property
+    def records(self) -> List[Dict]:
+        """上次的完整記錄列表"""
+        return [record for _, record in self._rows]
+
+    @property
+    def pending_dates(self) -> List[str]:
+        """簽核中的記錄日期"""
+        return [
+            record["date"]
+            for _, record in self._rows
+            if record.get("status") in PENDING_STATUSES
+        ]
+
+    def reset(self):
+        """清除已知的列 (下次輪詢完整解析)"""
+        self._set_rows([])
+        self._etag = None
+        self._last_modified = None
+        self._interval = self.min_interval
+
+    def seed(self, html: str, records: List[Dict]):
+        """
+        以完整解析的結果建立基準 (例如 DataSyncService 全量同步時)
+
+        Args:
+            html: 個人記錄頁面 HTML
+            records: 該頁面完整解析的結果
+        """
+        rows = [fingerprint for fingerprint, _ in self._iter_rows(html)]
+        if len(rows) != len(records):
+            # 有列解析失敗時無法對應,下次輪詢再完整解析
+            logger.debug("資料列數與解析結果不符,不建立基準")
+            self._set_rows([])
+            return
+        self._set_rows(list(zip(rows, records)))
+
+    # === 輪詢間隔 ===
+
+    def next_interval(self) -> Optional[float]:
+        """下次輪詢前等待的秒數 (沒有簽核中的記錄時返回 None)"""
+        if not self.pending_dates:
+            return None
+        return self._interval
+
+    def reset_interval(self):
+        """重設為最短間隔 (例如剛送出新的申請)"""
+        self._interval = self.min_interval
+
+    # === 輪詢 ===
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """條件式請求標頭 (伺服器未提供 ETag / Last-Modified 時為空)"""
+        if not self._rows:
+            return {}
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def poll_response(self, response: requests.Response) -> StatusPollResult:
+        """
+        處理個人記錄頁面的回應
+
+        Args:
+            response: 以 conditional_headers() 發出的 GET 回應
+
+        Returns:
+            StatusPollResult: 輪詢結果
+        """
+        if response.status_code == 304 and self._rows:
+            self._adjust_interval(changed=False)
+            return StatusPollResult(
+                records=self.records,
+                total_rows=len(self._rows),
+                not_modified=True,
+            )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        self._etag = etag if isinstance(etag, str) else None
+        self._last_modified = last_modified if isinstance(last_modified, str) else None
+        return self.poll(response.text)
+
+    def poll(self, html: str) -> StatusPollResult:
+        """
+        增量解析個人記錄頁面
+
+        Args:
+            html: 個人記錄頁面 HTML
+
+        Returns:
+            StatusPollResult: 輪詢結果
+        """
+        result = self._poll_incremental(html) if self._rows else None
+        if result is None:
+            result = self._poll_full(html)
+
+        self._adjust_interval(changed=bool(result.changed))
+        logger.debug(
+            "狀態輪詢: 解析 %d/%d 列, %d 筆變更%s",
+            result.parsed_rows,
+            result.total_rows,
+            len(result.changed),
+            " (完整解析)" if result.full else "",
+        )
+        return result
+
+    # === 私有方法 ===
+
+    def _poll_incremental(self, html: str) -> Optional[StatusPollResult]:
+        """從表格頂端比對到已知的列為止 (無法確定結果時返回 None)"""
+        # 上次簽核中的記錄須重新比對,錨點必須在它們之後
+        last_pending = max(
+            (
+                index
+                for index, (_, record) in enumerate(self._rows)
+                if record.get("status") in PENDING_STATUSES
+            ),
+            default=-1,
+        )
+
+        head: List[Tuple[int, Dict]] = []
+        changed: List[Dict] = []
+        parsed_rows = 0
+        spans = self._row_spans(html)
+
+        for start, end in spans:
+            row_html = _normalize_row(html[start:end])
+            fingerprint = hash(row_html)
+            position = self._positions.get(fingerprint)
+            if position is not None and position > last_pending:
+                # 其餘列與上次相同 (以總列數驗證,只計數不比對)
+                tail = self._rows[position:]
+                remaining = sum(1 for _ in spans) + 1
+                if remaining != len(tail):
+                    logger.debug("資料列數與上次不符,改為完整解析")
+                    return None
+                new_rows = head + tail
+                break
+
+            if position is not None:
+                head.append(self._rows[position])
+                continue
+
+            record = self._parse_row(row_html)
+            parsed_rows += 1
+            if record is None:
+                return None
+            head.append((fingerprint, record))
+            changed.append(record)
+        else:
+            new_rows = head
+
+        self._set_rows(new_rows)
+        return StatusPollResult(
+            records=self.records,
+            changed=changed,
+            parsed_rows=parsed_rows,
+            total_rows=len(new_rows),
+        )
+
+    def _poll_full(self, html: str) -> StatusPollResult:
+        """完整解析所有列"""
+        known = {fingerprint for fingerprint, _ in self._rows}
+        rows = list(self._iter_rows(html))
+
+        # 整份表格解析一次;有列解析失敗而無法對應時才逐列解析
+        records = self.parser.parse_records(html)
+        if len(records) == len(rows):
+            new_rows = [
+                (fingerprint, record)
+                for (fingerprint, _), record in zip(rows, records)
+            ]
+        else:
+            new_rows = []
+            for fingerprint, row_html in rows:
+                record = self._parse_row(row_html)
+                if record is not None:
+                    new_rows.append((fingerprint, record))
+
+        changed = [record for fingerprint, record in new_rows if fingerprint not in known]
+
+        # 第一次解析時所有記錄都是新的,不視為變更
+        if not known:
+            changed = []
+
+        self._set_rows(new_rows)
+        return StatusPollResult(
+            records=self.records,
+            changed=changed,
+            parsed_rows=len(new_rows),
+            total_rows=len(new_rows),
+            full=True,
+        )
+
+    def _set_rows(self, rows: List[Tuple[int, Dict]]):
+        self._rows = rows
+        self._positions = {}
+        for index, (fingerprint, _) in enumerate(rows):
+            self._positions.setdefault(fingerprint, index)
+
+    def _adjust_interval(self, changed: bool):
+        if changed:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self._interval * self.backoff, self.max_interval)
+
+    @classmethod
+    def _iter_rows(cls, html: str) -> Iterator[Tuple[int, str]]:
+        """依序產生 gvFlow211 的資料列 (指紋, 正規化後的列內容)"""
+        for start, end in cls._row_spans(html):
+            row_html = _normalize_row(html[start:end])
+            yield hash(row_html), row_html
+
+    @staticmethod
+    def _row_spans(html: str) -> Iterator[Tuple[int, int]]:
+        """
+        依序產生 gvFlow211 資料列的位置 (開始, 結束)
+
+        只以字串搜尋切出每一列,不建立 DOM。
+        追蹤 <table> 巢狀層數 (分頁列與儲存格內可能有巢狀表格),
+        只取表格本身 (第一層) 的資料列。
+        """
+        id_match = _TABLE_ID_ATTR.search(html)
+        if not id_match:
+            return
+        table_start = html.rfind("<table", 0, id_match.start())
+        if table_start < 0:
+            return
+
+        depth = 0
+        row_start = -1  # 目前資料列內容的開始位置 (不在資料列中時為 -1)
+        for tag in _STRUCTURE_TAG.finditer(html, table_start):
+            closing, name = tag.group(1), tag.group(2).lower()
+            if name == "table":
+                depth += -1 if closing else 1
+                if depth == 0:
+                    break
+                continue
+            if depth != 1:
+                continue
+
+            if row_start >= 0:
+                # </tr> 或省略結束標籤時的下一個 <tr>
+                yield row_start, tag.start()
+                row_start = -1
+            if not closing and _DATA_ROW_TAG.match(html, tag.start()):
+                # 只取 <tr> 標籤之後的內容 (新記錄插入後交錯列樣式會改變)
+                row_start = tag.end()
+        else:
+            tag = None
+
+        if row_start >= 0:
+            yield row_start, tag.start() if tag else len(html)
+
+    def _parse_row(self, row_html: str) -> Optional[Dict]:
+        """解析單一列 (row_html 為 <tr> 內的內容,列索引已正規化為 0)"""
+        records = self.parser.parse_records(
+            f'<table id="{_TABLE_ID}"><tr class="{PersonalRecordParser.DATA_ROW_CLASSES[0]}">'
+            f"{row_html}</tr></table>"
+        )
+        return records[0] if records else None
@@ -0,0 +1,188 @@
+"""加班申請送出紀錄 (分批送出的續傳依據)
+
+分批送出時,每一批在送出前標記為 in_flight,確認送達後標記為 submitted。
+程式中斷後重新送出相同的記錄時:
+- submitted 的記錄直接略過
+- in_flight 的記錄 (不確定是否送達) 先查詢個人記錄頁面再決定是否重送:
+  in_flight 時一併記錄送出前該日期已有的申請筆數 (baseline),
+  筆數增加才視為送達,同一天先前的其他申請 (例如調休) 不會被誤認
+
+檔案格式 (JSON, UTF-8):
+    {"version": 1, "entries": {記錄指紋: {"date", "status", "updated_at", "baseline"?}}}
+
+寫入採「暫存檔 + os.replace」,與 SnapshotStore 相同。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from ..models import OvertimeSubmissionRecord
+
+logger = logging.getLogger(__name__)
+
+# 紀錄檔格式版本
+FORMAT_VERSION = 1
+
+STATUS_IN_FLIGHT = "in_flight"  # 已送出,尚未確認
+STATUS_SUBMITTED = "submitted"  # 已確認送達
+
+
+class SubmissionJournal:
+    """
+    加班申請送出紀錄
+
+    使用方式:
+        ```python
+        journal = SubmissionJournal()
+        journal.mark(batch, STATUS_IN_FLIGHT, baseline=before)
+        ...  # 送出
+        journal.mark(batch, STATUS_SUBMITTED)
+        journal.remove(records)  # 全部完成後清除
+        ```
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        初始化送出紀錄
+
+        Args:
+            path: 紀錄檔路徑 (預設 cache/submission_journal.json)
+        """
+        self.path = Path(path) if path else Path("cache") / "submission_journal.json"
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(record: OvertimeSubmissionRecord) -> str:
+        """
+        記錄指紋 (日期、類型、時數、內容)
+
+        內容或時數修改後視為不同的申請,不會被當成已送出而略過。
+        """
+        key = "|".join(
+            (
+                record.date,
+                "加班" if record.is_overtime else "調休",
+                f"{record.overtime_hours:.2f}",
+                record.description,
+            )
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        載入紀錄
+
+        Returns:
+            Dict: {記錄指紋: {"date", "status", "updated_at", "baseline"?}},
+                  不存在或無法讀取時返回空字典
+        """
+        with self._lock:
+            return self._read()
+
+    def status_of(self, record: OvertimeSubmissionRecord) -> Optional[str]:
+        """記錄目前的狀態 (沒有紀錄時返回 None)"""
+        entry = self.load().get(self.fingerprint(record))
+        return entry["status"] if entry else None
+
+    def mark(
+        self,
+        records: Iterable[OvertimeSubmissionRecord],
+        status: str,
+        baseline: Optional[Mapping[str, int]] = None,
+    ) -> bool:
+        """
+        標記記錄狀態
+
+        Args:
+            records: 記錄列表
+            status: STATUS_IN_FLIGHT 或 STATUS_SUBMITTED
+            baseline: 送出前各日期的已申請筆數 (in_flight 時提供,續傳時據以確認是否送達)
+
+        Returns:
+            bool: 是否寫入成功 (失敗只記錄警告)
+        """
+        updated_at = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            entries = self._read()
+            for record in records:
+                entry: Dict[str, Any] = {
+                    "date": record.date,
+                    "status": status,
+                    "updated_at": updated_at,
+                }
+                if baseline is not None:
+                    entry["baseline"] = baseline.get(record.date, 0)
+                entries[self.fingerprint(record)] = entry
+            return self._write(entries)
+
+    def remove(self, records: Iterable[OvertimeSubmissionRecord]) -> bool:
+        """移除記錄 (全部清空時刪除紀錄檔)"""
+        with self._lock:
+            entries = self._read()
+            for record in records:
+                entries.pop(self.fingerprint(record), None)
+
+            if entries:
+                return self._write(entries)
+
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as error:
+                logger.warning("刪除送出紀錄失敗: %s", error)
+                return False
+            return True
+
+    # === 私有方法 ===
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError) as error:
+            logger.warning("讀取送出紀錄失敗,忽略: %s", error)
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            logger.info("送出紀錄格式版本不符,忽略: %s", self.path.name)
+            return {}
+        return dict(data.get("entries") or {})
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> bool:
+        temp_name = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=f".{self.path.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as fp:
+                temp_name = fp.name
+                json.dump(
+                    {"version": FORMAT_VERSION, "entries": entries},
+                    fp,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+                fp.flush()
+                os.fsync(fp.fileno())
+
+            os.replace(temp_name, self.path)
+        except OSError as error:
+            logger.warning("寫入送出紀錄失敗: %s", error)
+            if temp_name and os.path.exists(temp_name):
+                os.remove(temp_name)
+            return False
+        return True
@@ -0,0 +1,247 @@
+"""多帳號同步服務
+
+主管彙整整組的加班資料時,原本需逐一登入每個帳號。本服務:
+
+- 每個帳號使用獨立的 AuthService (獨立 Session 與 Cookie),互不影響
+- 以有上限的執行緒池平行執行 登入 → DataSyncService.sync_all
+- 單一帳號失敗 (登入失敗、網路錯誤) 只記錄於該帳號的結果,不中斷其他帳號
+- 彙整各帳號的 AttendanceSnapshot 為團隊報表,附各帳號耗時與狀態
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..config import Settings
+from ..models import AttendanceSnapshot, OvertimeStatistics
+from .auth_service import AuthService
+from .credential_manager import CredentialManager
+from .data_sync_service import DataSyncService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AccountSyncResult:
+    """單一帳號同步結果"""
+
+    username: str
+    snapshot: Optional[AttendanceSnapshot] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # login / sync / total (秒)
+
+    @property
+    def success(self) -> bool:
+        return self.snapshot is not None and self.error is None
+
+
+@dataclass
+class TeamSyncResult:
+    """團隊同步結果 (順序同輸入的帳號)"""
+
+    accounts: List[AccountSyncResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> List[AccountSyncResult]:
+        return [account for account in self.accounts if account.success]
+
+    @property
+    def failed(self) -> List[AccountSyncResult]:
+        return [account for account in self.accounts if not account.success]
+
+    @property
+    def statistics(self) -> OvertimeStatistics:
+        """團隊合計 (只含成功的帳號,日期範圍取聯集)"""
+        snapshots = [
+            account.snapshot
+            for account in self.succeeded
+            if account.snapshot.statistics is not None
+        ]
+        total = OvertimeStatistics(
+            start_date=min((s.start_date for s in snapshots), default=""),
+            end_date=max((s.end_date for s in snapshots), default=""),
+        )
+        for snapshot in snapshots:
+            for item in fields(OvertimeStatistics):
+                value = getattr(snapshot.statistics, item.name)
+                if isinstance(value, (int, float)):
+                    setattr(total, item.name, getattr(total, item.name) + value)
+        return total
+
+    def rows(self) -> List[Dict]:
+        """各帳號一列的摘要 (供表格顯示或匯出)"""
+        rows = []
+        for account in self.accounts:
+            statistics = account.snapshot.statistics if account.success else None
+            rows.append(
+                {
+                    "帳號": account.username,
+                    "狀態": "成功" if account.success else f"失敗: {account.error}",
+                    "登入(秒)": round(account.timings.get("login", 0.0), 3),
+                    "同步(秒)": round(account.timings.get("sync", 0.0), 3),
+                    "總加班時數": statistics.total_overtime_hours if statistics else None,
+                    "待申報時數": statistics.pending_overtime_hours if statistics else None,
+                    "待申報天數": statistics.pending_submission_days if statistics else None,
+                    "異常天數": statistics.anomaly_days if statistics else None,
+                }
+            )
+        return rows
+
+    def format_summary(self) -> str:
+        """文字摘要 (各帳號耗時與狀態、團隊合計)"""
+        lines = [f"{'帳號':<12}{'登入(秒)':>10}{'同步(秒)':>10}  狀態"]
+        for account in self.accounts:
+            status = "✓" if account.success else f"✗ {account.error}"
+            lines.append(
+                f"{account.username:<14}"
+                f"{account.timings.get('login', 0.0):>10.2f}"
+                f"{account.timings.get('sync', 0.0):>10.2f}  {status}"
+            )
+        statistics = self.statistics
+        lines.append(
+            f"成功 {len(self.succeeded)}/{len(self.accounts)} 個帳號, "
+            f"總加班 {statistics.total_overtime_hours:.1f} hr, "
+            f"待申報 {statistics.pending_overtime_hours:.1f} hr, "
+            f"耗時 {self.seconds:.2f} 秒"
+        )
+        return "\n".join(lines)
+
+
+class TeamSyncService:
+    """
+    多帳號同步服務
+
+    使用方式:
+        ```python
+        service = TeamSyncService(settings, max_workers=4)
+        result = service.sync([("A1234", "password"), ("B5678", "password")])
+        print(result.format_summary())
+        team_statistics = result.statistics
+        ```
+    """
+
+    def __init__(self, settings: Optional[Settings] = None, max_workers: int = 4):
+        """
+        初始化多帳號同步服務
+
+        Args:
+            settings: 應用程式設定
+            max_workers: 同時同步的帳號數上限 (避免對 SSP 造成過大負擔)
+        """
+        self.settings = settings or Settings()
+        self.max_workers = max(max_workers, 1)
+
+    def sync(
+        self,
+        credentials: Sequence[Tuple[str, str]],
+        progress_callback: Optional[Callable[[AccountSyncResult], None]] = None,
+    ) -> TeamSyncResult:
+        """
+        平行同步多個帳號
+
+        Args:
+            credentials: (帳號, 密碼) 列表
+            progress_callback: 每個帳號完成時呼叫 (在工作執行緒中)
+
+        Returns:
+            TeamSyncResult: 各帳號結果 (順序同 credentials)
+        """
+        started = time.perf_counter()
+        if not credentials:
+            return TeamSyncResult()
+
+        def run(credential: Tuple[str, str]) -> AccountSyncResult:
+            account = self._sync_account(*credential)
+            if progress_callback:
+                progress_callback(account)
+            return account
+
+        workers = min(self.max_workers, len(credentials))
+        logger.info("開始同步 %d 個帳號 (同時 %d 個)", len(credentials), workers)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="team-sync"
+        ) as executor:
+            accounts = list(executor.map(run, credentials))
+
+        result = TeamSyncResult(accounts=accounts, seconds=time.perf_counter() - started)
+        logger.info(
+            "多帳號同步完成: 成功 %d/%d (%.2f 秒)",
+            len(result.succeeded),
+            len(accounts),
+            result.seconds,
+        )
+        return result
+
+    def sync_saved(
+        self,
+        usernames: Iterable[str],
+        credential_manager: Optional[CredentialManager] = None,
+        progress_callback: Optional[Callable[[AccountSyncResult], None]] = None,
+    ) -> TeamSyncResult:
+        """
+        以系統 keyring 中儲存的密碼同步多個帳號
+
+        沒有儲存密碼的帳號直接記為失敗,不嘗試登入。
+
+        Args:
+            usernames: 帳號列表 (密碼需先以 CredentialManager.save_credentials 儲存)
+            credential_manager: 憑證管理器 (預設建立新的)
+            progress_callback: 每個帳號完成時呼叫
+
+        Returns:
+            TeamSyncResult: 各帳號結果 (順序同 usernames)
+        """
+        started = time.perf_counter()
+        credential_manager = credential_manager or CredentialManager()
+        usernames = list(usernames)
+        passwords = {
+            username: credential_manager.load_password(username) for username in usernames
+        }
+        credentials = [
+            (username, passwords[username]) for username in usernames if passwords[username]
+        ]
+
+        synced = iter(self.sync(credentials, progress_callback).accounts)
+        result = TeamSyncResult(seconds=time.perf_counter() - started)
+        for username in usernames:
+            if passwords[username]:
+                result.accounts.append(next(synced))
+            else:
+                result.accounts.append(
+                    AccountSyncResult(username=username, error="沒有儲存的密碼")
+                )
+        return result
+
+    def _sync_account(self, username: str, password: str) -> AccountSyncResult:
+        """登入並同步單一帳號 (獨立 Session)"""
+        account = AccountSyncResult(username=username)
+        started = time.perf_counter()
+        tag = CredentialManager.hash_username(username)
+
+        try:
+            auth_service = AuthService(self.settings)
+            if not auth_service.login(username, password):
+                account.error = "登入失敗"
+                return account
+            account.timings["login"] = time.perf_counter() - started
+
+            sync_started = time.perf_counter()
+            data_sync_service = DataSyncService(auth_service.get_session(), self.settings)
+            account.snapshot = data_sync_service.sync_all(force_refresh=True)
+            account.timings["sync"] = time.perf_counter() - sync_started
+        except Exception as e:
+            logger.warning("帳號 %s 同步失敗: %s", tag, e)
+            account.error = str(e) or type(e).__name__
+            account.snapshot = None
+        finally:
+            account.timings["total"] = time.perf_counter() - started
+            logger.info(
+                "帳號 %s: %s (%.2f 秒)",
+                tag,
+                "✓ 同步完成" if account.success else f"✗ {account.error}",
+                account.timings["total"],
+            )
+        return account
@@ -1,5 +1,6 @@
 """工具模組"""
 
+from .import_profiler import ImportProfiler
 from .logger import setup_logging
 
-__all__ = ["setup_logging"]
+__all__ = ["ImportProfiler", "setup_logging"]
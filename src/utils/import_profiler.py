@@ -0,0 +1,168 @@
+"""匯入耗時分析 (診斷用)
+
+輸出格式與 ``python -X importtime`` 相同,但在程式內安裝,
+PyInstaller 打包後的執行檔 (無法傳入 -X 參數) 也能使用:
+
+    set SSP_IMPORT_PROFILE=1
+    overtime-assistant-x.y.z.exe
+
+開發環境也可以直接使用 ``python -X importtime app.py``。
+"""
+
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "SSP_IMPORT_PROFILE"
+
+
+@dataclass
+class ImportTiming:
+    """單一模組的匯入耗時 (微秒)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    def format(self) -> str:
+        """-X importtime 格式的一行"""
+        return (
+            f"import time: {self.self_us:>9} | {self.cumulative_us:>10} | "
+            f"{'  ' * self.depth}{self.module}"
+        )
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    匯入耗時分析器
+
+    以 sys.meta_path 的第一個 finder 包裝其他 finder 找到的 loader,
+    記錄每個模組執行 (exec_module) 的時間;巢狀匯入的時間計入上層的累計時間。
+
+    使用方式:
+        ```python
+        profiler = ImportProfiler().install()
+        import heavy_module
+        profiler.uninstall()
+        print(profiler.format_report(top=10))
+        ```
+    """
+
+    def __init__(self):
+        self.timings: List[ImportTiming] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> Optional["ImportProfiler"]:
+        """環境變數 SSP_IMPORT_PROFILE 有設定時建立並安裝"""
+        if not os.environ.get(PROFILE_ENV):
+            return None
+        return cls().install()
+
+    def install(self) -> "ImportProfiler":
+        """安裝至 sys.meta_path (之後的匯入才會記錄)"""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        """停止記錄"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        """委派給其他 finder,找到後包裝 loader"""
+        if getattr(self._local, "finding", False):
+            return None
+
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def format_report(self, top: Optional[int] = None) -> str:
+        """
+        產生報表
+
+        Args:
+            top: 只列出累計時間最長的前 N 個模組 (None 表示依匯入順序全部列出)
+
+        Returns:
+            str: -X importtime 格式的報表
+        """
+        with self._lock:
+            timings = list(self.timings)
+        if top is not None:
+            timings = sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]
+            timings = [
+                ImportTiming(t.module, t.self_us, t.cumulative_us, 0) for t in timings
+            ]
+
+        lines = ["import time: self [us] | cumulative | imported package"]
+        lines.extend(timing.format() for timing in timings)
+        return "\n".join(lines)
+
+    def _enter(self) -> List[int]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0)  # 子模組累計時間
+        return stack
+
+    def _exit(self, module: str, stack: List[int], elapsed_us: int):
+        children_us = stack.pop()
+        if stack:
+            stack[-1] += elapsed_us
+        with self._lock:
+            self.timings.append(
+                ImportTiming(module, elapsed_us - children_us, elapsed_us, len(stack))
+            )
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """記錄 exec_module 耗時的 loader 包裝"""
+
+    def __init__(self, loader, profiler: ImportProfiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # 還原原本的 loader,避免其他程式碼看到包裝物件
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        stack = self._profiler._enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed_us = int((time.perf_counter() - started) * 1_000_000)
+            self._profiler._exit(module.__name__, stack, elapsed_us)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
@@ -0,0 +1,82 @@
+"""測試長駐事件迴圈與 Tk 橋接"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.services.async_client import EventLoopThread
+from ui.async_bridge import TkAsyncBridge
+
+
+@pytest.fixture
+def loop_thread():
+    loop_thread = EventLoopThread(max_workers=4)
+    yield loop_thread
+    loop_thread.stop()
+
+
+class _FakeWidget:
+    """模擬 Tk after(): 記錄呼叫的執行緒並立即執行"""
+
+    def __init__(self):
+        self.calls = 0
+        self.condition = threading.Condition()
+
+    def after(self, _delay, func, *args):
+        func(*args)
+        with self.condition:
+            self.calls += 1
+            self.condition.notify_all()
+
+    def wait_for_calls(self, count: int) -> bool:
+        with self.condition:
+            return self.condition.wait_for(lambda: self.calls >= count, timeout=5)
+
+
+def test_submit_coroutine(loop_thread):
+    """協程在長駐事件迴圈執行,阻塞呼叫使用固定的 I/O 執行緒池"""
+
+    async def double(value):
+        await asyncio.sleep(0)
+        return await asyncio.to_thread(lambda: (value * 2, threading.current_thread().name))
+
+    result, worker = loop_thread.submit(double(21)).result(timeout=5)
+
+    assert result == 42
+    assert worker.startswith("ssp-event-loop-io")
+    assert loop_thread.executor.submit(lambda: 1).result(timeout=5) == 1
+
+
+def test_bridge_runs_on_shared_loop(loop_thread):
+    widget = _FakeWidget()
+    bridge = TkAsyncBridge(widget, loop_thread)
+    results = []
+    worker_threads = set()
+
+    def task(value):
+        worker_threads.add(threading.current_thread().name)
+        return value * 2
+
+    for value in range(3):
+        bridge.run_blocking(task, value, callback=results.append)
+    assert widget.wait_for_calls(3)
+
+    assert sorted(results) == [0, 2, 4]
+    assert all(name.startswith("ssp-event-loop-io") for name in worker_threads)
+
+
+def test_bridge_error_callback(loop_thread):
+    widget = _FakeWidget()
+    bridge = TkAsyncBridge(widget, loop_thread)
+    errors = []
+
+    def failing():
+        raise ValueError("boom")
+
+    future = bridge.run_blocking(failing, error_callback=errors.append)
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+    assert widget.wait_for_calls(1)
+
+    assert isinstance(errors[0], ValueError)
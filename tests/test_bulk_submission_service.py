@@ -0,0 +1,224 @@
+"""測試加班申請分批送出 (本機 SSP 模擬伺服器)"""
+
+import pytest
+
+from benchmarks.mock_ssp_server import MockSSPConfig, MockSSPServer
+from src.config.settings import Settings
+from src.models import OvertimeSubmissionRecord
+from src.services.auth_service import AuthService
+from src.services.bulk_submission_service import BulkSubmissionService
+from src.services.overtime_report_service import OvertimeReportService
+from src.services.submission_journal import (
+    STATUS_IN_FLIGHT,
+    STATUS_SUBMITTED,
+    SubmissionJournal,
+)
+
+
+@pytest.fixture
+def server():
+    config = MockSSPConfig(attendance_rows=10, personal_rows=5)
+    with MockSSPServer(config) as mock_server:
+        yield mock_server
+
+
+@pytest.fixture
+def settings(server):
+    return Settings(SSP_BASE_URL=server.base_url, HTTP_BACKOFF_FACTOR=0)
+
+
+@pytest.fixture
+def session(server, settings):
+    auth_service = AuthService(settings)
+    assert auth_service.login(server.config.username, server.config.password)
+    return auth_service.get_session()
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return SubmissionJournal(tmp_path / "journal.json")
+
+
+@pytest.fixture
+def bulk(settings, journal):
+    return BulkSubmissionService(OvertimeReportService(settings), journal=journal)
+
+
+def _records(count):
+    return [
+        OvertimeSubmissionRecord(
+            date=f"2025/12/{day + 1:02d}",
+            description="專案開發",
+            overtime_hours=1.0 + day * 0.5,
+            is_overtime=day % 2 == 0,
+        )
+        for day in range(count)
+    ]
+
+
+def test_submits_in_batches(server, session, bulk, journal):
+    """依批次大小分批送出,回報進度,完成後清除送出紀錄"""
+    records = _records(7)
+    progress = []
+
+    result = bulk.submit(session, records, batch_size=3, progress_callback=progress.append)
+
+    assert result.success
+    assert result.submitted == [r.date for r in records]
+    assert [len(batch.dates) for batch in result.batches] == [3, 3, 1]
+    assert len(server.submissions) == 3
+    assert progress[-1].done_count == 7
+    assert progress[-1].fraction == 1.0
+    assert not journal.path.exists()
+
+
+def test_resume_after_failed_batch(server, session, bulk, journal):
+    """某一批失敗時停止,以相同記錄重新送出只送剩下的記錄"""
+    records = _records(7)
+    commits = []
+    post_commit = bulk.report_service._post_commit
+
+    def fail_second_commit(*args):
+        commits.append(args)
+        if len(commits) == 2:
+            server.fail_next("/FW21001Z.aspx", count=1)  # 第 2 批送出時伺服器錯誤
+        return post_commit(*args)
+
+    bulk.report_service._post_commit = fail_second_commit
+    result = bulk.submit(session, records, batch_size=3)
+
+    assert not result.success
+    assert result.submitted == [r.date for r in records[:3]]
+    assert result.unconfirmed == [r.date for r in records[3:6]]
+    assert result.failed == [records[6].date]
+    assert journal.status_of(records[0]) == STATUS_SUBMITTED
+    assert journal.status_of(records[3]) == STATUS_IN_FLIGHT
+
+    resumed = bulk.submit(session, records, batch_size=3)
+
+    assert resumed.success
+    assert resumed.skipped == [r.date for r in records[:3]]
+    assert resumed.submitted == [r.date for r in records[3:]]
+    submitted_dates = [
+        value
+        for form in server.submissions
+        for name, value in form.items()
+        if name.endswith("txtOT_Datei")
+    ]
+    assert sorted(submitted_dates) == [r.date for r in records]  # 沒有重複送出
+
+
+def test_in_flight_records_already_landed_are_skipped(server, session, bulk, journal):
+    """上次中斷時已送達 (但未記錄結果) 的記錄不會重送"""
+    records = _records(4)
+    before = bulk._query_submitted_dates(session)
+    journal.mark(records[:2], STATUS_IN_FLIGHT, baseline=before)
+    assert bulk.report_service.submit_form(session, records[:2])["success"]
+
+    result = bulk.submit(session, records)
+
+    assert result.success
+    assert result.skipped == [r.date for r in records[:2]]
+    assert result.submitted == [r.date for r in records[2:]]
+    assert len(server.submissions) == 2
+
+
+def test_in_flight_record_with_same_date_submission_is_resent(session, bulk, journal):
+    """續傳時同一天先前已有其他申請 (例如調休),未送達的記錄仍會重送"""
+    records = _records(2)
+    history = [records[0].date]  # 先前已申請過的調休
+    journal.mark(records[:1], STATUS_IN_FLIGHT, baseline={records[0].date: 1})
+    journal.mark(records[1:], STATUS_IN_FLIGHT)  # 沒有送出前筆數的舊紀錄
+    sent = []
+
+    def submit_form(_session, batch):
+        sent.extend(r.date for r in batch)
+        history.extend(r.date for r in batch)
+        return {"success": True}
+
+    bulk.report_service.submit_form = submit_form
+    bulk.status_fetcher = lambda _session: list(history)
+
+    result = bulk.submit(session, records)
+
+    assert sent == [records[0].date]
+    assert result.submitted == [records[0].date]
+    assert result.skipped == []
+    assert result.unconfirmed == [records[1].date]  # 無法確認,不重送
+    assert journal.status_of(records[1]) == STATUS_IN_FLIGHT
+
+
+def test_status_unavailable_does_not_resubmit(session, bulk, journal):
+    """無法查詢個人記錄時,不確定的記錄不重送"""
+    records = _records(2)
+    journal.mark(records[:1], STATUS_IN_FLIGHT)
+
+    def unavailable(_session):
+        raise ConnectionError("offline")
+
+    bulk.status_fetcher = unavailable
+    result = bulk.submit(session, records)
+
+    assert not result.success
+    assert result.unconfirmed == [records[0].date]
+    assert result.submitted == [records[1].date]  # 以送出結果為準
+    assert journal.status_of(records[0]) == STATUS_IN_FLIGHT
+
+
+def test_partially_landed_failed_batch(session, bulk, journal):
+    """送出失敗但部分記錄已出現時,只重送未出現的記錄"""
+    records = _records(3)
+    history = []
+
+    def submit_form(_session, batch):
+        history.append(batch[0].date)  # 只有第一筆送達
+        return {"success": False, "error": "逾時"}
+
+    bulk.report_service.submit_form = submit_form
+    bulk.status_fetcher = lambda _session: list(history)
+
+    result = bulk.submit(session, records)
+
+    assert not result.success
+    assert result.submitted == [records[0].date]
+    assert result.failed == [r.date for r in records[1:]]
+    assert journal.status_of(records[0]) == STATUS_SUBMITTED
+    assert journal.status_of(records[1]) is None
+
+
+def test_previously_submitted_date_is_not_confirmed(session, bulk, journal):
+    """送出前已有同一日期的申請時,失敗的批次不會因日期已存在而視為送達"""
+    records = _records(2)
+    existing = [r.date for r in records]  # 先前已申請過相同日期 (例如調休)
+
+    bulk.report_service.submit_form = lambda _session, batch: {
+        "success": False,
+        "error": "逾時",
+    }
+    bulk.status_fetcher = lambda _session: list(existing)
+
+    result = bulk.submit(session, records)
+
+    assert not result.success
+    assert not result.batches[0].confirmed
+    assert result.submitted == []
+    assert result.failed == [r.date for r in records]
+    assert journal.status_of(records[0]) is None
+
+
+def test_journal_fingerprint_tracks_content(journal):
+    """內容或時數修改後視為不同的申請"""
+    record = _records(1)[0]
+    journal.mark([record], STATUS_SUBMITTED)
+
+    edited = OvertimeSubmissionRecord(
+        date=record.date,
+        description="客戶支援",
+        overtime_hours=record.overtime_hours,
+        is_overtime=record.is_overtime,
+    )
+    assert journal.status_of(record) == STATUS_SUBMITTED
+    assert journal.status_of(edited) is None
+
+    journal.remove([record])
+    assert not journal.path.exists()
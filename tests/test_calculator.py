@@ -75,3 +75,85 @@ class TestOvertimeCalculator:
         assert report.total_overtime_hours >= 0
         assert report.average_overtime_hours >= 0
         assert report.max_overtime_hours >= 0
+
+
+class TestBatchOvertimeCalculation:
+    """測試向量化批次計算 (結果需與逐筆計算一致)"""
+
+    @pytest.fixture
+    def calculator(self):
+        """建立計算器實例"""
+        return OvertimeCalculator()
+
+    @pytest.fixture
+    def mixed_records(self):
+        """包含正常、晚到、上限、負值與格式錯誤的記錄"""
+        return [
+            {"date": "2024/10/28", "time_range": "08:30:00~18:00:00"},
+            {"date": "2024/10/29", "time_range": "09:15:00~19:30:00"},
+            {"date": "2024/10/30", "time_range": "08:00:00~22:00:00"},
+            {"date": "2024/10/28", "time_range": "07:59:59~17:01:01"},
+            {"date": "2024/10/31", "time_range": "08:00:00~12:00:00"},
+            {"date": "2024/11/01", "time_range": "08:00:00"},
+            {"date": "2024/11/02", "time_range": "invalid~time"},
+            {"date": "114/11/03", "time_range": "08:00:00~18:00:00"},
+            {"date": "2024/11/04", "time_range": " 08:07:00 ~ 18:31:00 "},
+        ]
+
+    def test_batch_matches_per_record(self, calculator, mixed_records):
+        """測試 DataFrame (time_range) 輸入與逐筆計算結果相同"""
+        import pandas as pd
+
+        expected = calculator.calculate_overtime(mixed_records)
+        report = calculator.calculate_overtime_batch(pd.DataFrame(mixed_records))
+
+        assert report.records == expected.records
+        assert report.total_overtime_hours == expected.total_overtime_hours
+
+    def test_batch_matches_per_record_random(self, calculator):
+        """測試大量隨機記錄 (含四捨五入邊界) 與逐筆計算結果相同"""
+        import random
+
+        rng = random.Random(20241028)
+        records = []
+        for _ in range(2000):
+            start = rng.randint(6 * 3600, 11 * 3600)
+            end = start + rng.randint(0, 14 * 3600)
+            records.append(
+                {
+                    "date": f"2024/{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}",
+                    "time_range": f"{start // 3600:02d}:{start % 3600 // 60:02d}:{start % 60:02d}"
+                    f"~{min(end // 3600, 23):02d}:{end % 3600 // 60:02d}:{end % 60:02d}",
+                }
+            )
+
+        expected = calculator.calculate_overtime(records)
+        dates = [r["date"] for r in records]
+        starts = [r["time_range"].split("~")[0] for r in records]
+        ends = [r["time_range"].split("~")[1] for r in records]
+        report = calculator.calculate_overtime_batch(dates, starts, ends)
+
+        assert report.records == expected.records
+
+    def test_arrays_output(self, calculator):
+        """測試欄式陣列輸出"""
+        arrays = calculator.calculate_overtime_arrays(
+            ["2024/10/28", "bad", "2024/10/30"],
+            ["08:30:00", "08:00:00", "08:00:00"],
+            ["18:00:00", "18:00:00", "22:00:00"],
+        )
+
+        assert len(arrays) == 2
+        assert list(arrays.dates) == ["2024/10/30", "2024/10/28"]
+        assert list(arrays.source_index) == [2, 0]
+        assert list(arrays.total_minutes) == [840, 570]
+        assert list(arrays.overtime_hours) == [4.0, 0.0]
+
+    def test_empty_and_invalid_input(self, calculator):
+        """測試空輸入與參數錯誤"""
+        assert calculator.calculate_overtime_batch([], [], []).records == []
+
+        with pytest.raises(ValueError):
+            calculator.calculate_overtime_batch(["2024/10/28"], ["08:00:00"], [])
+        with pytest.raises(ValueError):
+            calculator.calculate_overtime_batch(["2024/10/28"], ["08:00:00"])
@@ -0,0 +1,113 @@
+"""測試命令列介面 (本機 SSP 模擬伺服器)"""
+
+import csv
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.mock_ssp_server import MockSSPConfig, MockSSPServer
+from src import cli
+from src.services.exporters import ATTENDANCE_SCHEMA
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def server():
+    config = MockSSPConfig(attendance_rows=15, personal_rows=5)
+    with MockSSPServer(config) as mock_server:
+        yield mock_server
+
+
+@pytest.fixture
+def argv(server, monkeypatch):
+    monkeypatch.setenv("SSP_PASSWORD", server.config.password)
+    return ["--base-url", server.base_url, "--username", server.config.username]
+
+
+def test_json_to_stdout(argv, capsys):
+    assert cli.main(argv) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["records"]
+    assert set(report["records"][0]) == set(cli_columns())
+    assert report["summary"]["記錄天數"] == len(report["records"])
+
+
+def test_csv_to_file(argv, tmp_path):
+    output = tmp_path / "report.csv"
+
+    assert cli.main(argv + ["--format", "csv", "--output", str(output)]) == 0
+
+    with output.open(encoding="utf-8", newline="") as fp:
+        rows = list(csv.DictReader(fp))
+    assert rows
+    assert list(rows[0]) == ATTENDANCE_SCHEMA.names
+
+
+def test_jsonl_to_stdout(argv, capsys):
+    assert cli.main(argv + ["--format", "jsonl"]) == 0
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines
+    assert list(lines[0]) == ["date", "start_time", "end_time", "overtime_hours", "total_minutes"]
+
+
+def test_xlsx_requires_output(argv, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(argv + ["--format", "xlsx"])
+
+    assert exc_info.value.code == 2
+
+
+def test_login_failure(server, monkeypatch, capsys):
+    monkeypatch.setenv("SSP_PASSWORD", "wrong")
+
+    code = cli.main(
+        ["--base-url", server.base_url, "--username", server.config.username]
+    )
+
+    assert code == 1
+    assert "登入失敗" in capsys.readouterr().err
+
+
+def test_missing_password(monkeypatch, capsys):
+    monkeypatch.delenv("SSP_PASSWORD", raising=False)
+
+    assert cli.main(["--username", "A1234"]) == 2
+    assert "SSP_PASSWORD" in capsys.readouterr().err
+
+
+def test_does_not_import_ui(server, tmp_path):
+    """完整執行不匯入任何 UI 模組"""
+    script = (
+        "import sys\n"
+        "from src.cli import main\n"
+        f"code = main(['--base-url', {server.base_url!r}, '--username', "
+        f"{server.config.username!r}, '--output', {str(tmp_path / 'report.json')!r}])\n"
+        "ui = [m for m in sys.modules if m.split('.')[0] in "
+        "('ui', 'customtkinter', 'tkinter', 'PIL')]\n"
+        "print(ui)\n"
+        "sys.exit(code)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        env=dict(os.environ, SSP_PASSWORD=server.config.password),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def cli_columns():
+    from src.services.export_service import ExportService
+
+    return ExportService.COLUMNS
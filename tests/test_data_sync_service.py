@@ -4,13 +4,38 @@ import pytest
 from unittest.mock import Mock
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import Future
 
 from src.services.data_sync_service import DataSyncService
 from src.parsers.attendance_parser import AttendanceParser
 from src.parsers.personal_record_parser import PersonalRecordParser
+from src.parsers.stream_parser import (
+    StreamAttendanceParser,
+    StreamPersonalRecordParser,
+)
 from src.config.settings import Settings
 from src.models.snapshot import AttendanceSnapshot
 from src.models.attendance import UnifiedOvertimeRecord
+from src.models.overtime_submission import SubmittedRecord
+from src.services.snapshot_store import SnapshotStore
+
+
+class QueuedExecutor:
+    """工作只排隊、呼叫 run_pending 才執行的 executor (模擬忙碌的執行緒池)"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.pending.append((future, fn, args))
+        return future
+
+    def run_pending(self):
+        while self.pending:
+            future, fn, args = self.pending.pop(0)
+            if future.set_running_or_notify_cancel():
+                future.set_result(fn(*args))
 
 
 @pytest.fixture
@@ -67,6 +92,27 @@ class TestDataSyncService:
         assert service._cache is None
         assert service._cache_timestamp is None
 
+    def test_stream_parser_backend(
+        self, mock_session, mock_settings, mock_html_responses
+    ):
+        """測試 PARSER_BACKEND=stream 時使用串流解析器且結果一致"""
+        mock_settings.PARSER_BACKEND = "stream"
+        service = DataSyncService(mock_session, mock_settings)
+
+        assert isinstance(service.attendance_parser, StreamAttendanceParser)
+        assert isinstance(service.personal_record_parser, StreamPersonalRecordParser)
+        assert service.status_tracker.parser is service.personal_record_parser
+
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+        snapshot = service.sync_all()
+
+        assert len(snapshot.unified_records) == 2
+        assert len(snapshot.punch_records) == 2
+        assert snapshot.quota is not None
+
     def test_sync_all_first_call(
         self, mock_session, mock_settings, mock_html_responses
     ):
@@ -203,6 +249,12 @@ class TestDataSyncService:
         assert all(isinstance(r, UnifiedOvertimeRecord) for r in records)
         assert mock_session.get.call_count == 1
 
+        # 統計與重新計算結果一致
+        snapshot = service._cache
+        assert snapshot.statistics == service._calculate_statistics(
+            snapshot.unified_records, snapshot.start_date, snapshot.end_date
+        )
+
     def test_clear_cache(self, mock_session, mock_settings):
         """測試清除快取"""
         service = DataSyncService(mock_session, mock_settings)
@@ -243,6 +295,186 @@ class TestDataSyncService:
             assert "time_range" in record
             assert "~" in record["time_range"]
 
+    def test_get_submitted_records_from_snapshot(
+        self, mock_session, mock_settings, mock_html_responses
+    ):
+        """測試已申請記錄取自快照 (不重複抓取 FW21003Z.aspx)"""
+        service = DataSyncService(mock_session, mock_settings)
+
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+        service.sync_all()
+
+        submitted = service.get_submitted_records()
+
+        # 整個流程只有 sync_all 的 2 次請求
+        assert mock_session.get.call_count == 2
+
+        assert set(submitted.keys()) == {"114/12/01", "114/12/02"}
+        overtime = submitted["114/12/01"]
+        assert isinstance(overtime, SubmittedRecord)
+        assert overtime.status == "簽核完成"
+        assert overtime.is_overtime
+        assert overtime.overtime_minutes == pytest.approx(90)
+
+        change = submitted["114/12/02"]
+        assert change.status == "簽核中"
+        assert not change.is_overtime
+        assert change.change_minutes == pytest.approx(120)
+
+    def test_persistent_snapshot_across_instances(
+        self, mock_session, mock_settings, mock_html_responses, tmp_path
+    ):
+        """測試磁碟快照: 新的服務實例在有效期內不需重新抓取"""
+        store = SnapshotStore(cache_dir=tmp_path)
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+        first = DataSyncService(
+            mock_session, mock_settings, snapshot_store=store, cache_key="user"
+        )
+        snapshot = first.sync_all()
+
+        # 模擬重新啟動: 新實例直接從磁碟載入
+        mock_session.get.reset_mock()
+        second = DataSyncService(
+            mock_session, mock_settings, snapshot_store=store, cache_key="user"
+        )
+        restored = second.sync_all()
+
+        assert mock_session.get.call_count == 0
+        assert restored.unified_records == snapshot.unified_records
+        assert restored.statistics == snapshot.statistics
+
+        # 超過 CACHE_DURATION_SECONDS 則重新抓取
+        mock_settings.CACHE_DURATION_SECONDS = 0
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+        third = DataSyncService(
+            mock_session, mock_settings, snapshot_store=store, cache_key="user"
+        )
+        third.sync_all()
+        assert mock_session.get.call_count == 2
+
+        # 清除快取同時刪除磁碟快照
+        third.clear_cache()
+        assert store.load("user") is None
+
+    def test_stale_while_revalidate(
+        self, mock_session, mock_settings, mock_html_responses
+    ):
+        """測試 stale-while-revalidate: 先返回舊資料,背景更新後通知訂閱者"""
+        import threading
+
+        service = DataSyncService(
+            mock_session, mock_settings, stale_while_revalidate=True
+        )
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+        stale = service.sync_all()  # 無快取時仍需等待抓取
+        service._cache_timestamp = datetime.now() - timedelta(seconds=400)
+
+        updated = threading.Event()
+        received = []
+
+        def on_update(snapshot):
+            received.append(snapshot)
+            updated.set()
+
+        service.subscribe(on_update)
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+
+        assert service.sync_all() is stale
+        assert updated.wait(timeout=5)
+        assert received[0] is not stale
+        assert service.sync_all() is received[0]
+        assert mock_session.get.call_count == 4
+
+    def test_concurrent_refresh_is_deduplicated(
+        self, mock_session, mock_settings, mock_html_responses
+    ):
+        """測試並行呼叫共用同一個進行中的同步"""
+        import threading
+
+        service = DataSyncService(mock_session, mock_settings)
+        release = threading.Event()
+
+        def slow_get(url, **kwargs):
+            release.wait(timeout=5)
+            if url.endswith(mock_settings.ATTENDANCE_URL):
+                return Mock(text=mock_html_responses["attendance"], status_code=200)
+            return Mock(text=mock_html_responses["personal_record"], status_code=200)
+
+        mock_session.get.side_effect = slow_get
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.sync_all()))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(results) == 5
+        assert all(snapshot is results[0] for snapshot in results)
+        assert mock_session.get.call_count == 2
+
+    def test_background_refresh_started_once(
+        self, mock_session, mock_settings, mock_html_responses
+    ):
+        """連續啟動背景更新時只執行一次,訂閱者只收到一次通知"""
+        # 背景工作排隊而尚未開始,重現「第二次呼叫時背景更新尚未執行」的情況
+        executor = QueuedExecutor()
+        service = DataSyncService(mock_session, mock_settings, executor=executor)
+        received = []
+        service.subscribe(received.append)
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+
+        assert service.refresh_in_background()
+        assert service.is_refreshing
+        assert not service.refresh_in_background()
+        executor.run_pending()
+
+        assert len(received) == 1
+        assert not service.is_refreshing
+
+    def test_queued_background_refresh_runs_in_caller(
+        self, mock_session, mock_settings, mock_html_responses
+    ):
+        """背景更新仍在執行緒池排隊時,等待的呼叫者直接執行,不會互相等待"""
+        executor = QueuedExecutor()
+        service = DataSyncService(mock_session, mock_settings, executor=executor)
+        received = []
+        service.subscribe(received.append)
+        mock_session.get.side_effect = [
+            Mock(text=mock_html_responses["attendance"], status_code=200),
+            Mock(text=mock_html_responses["personal_record"], status_code=200),
+        ]
+
+        assert service.refresh_in_background()
+        snapshot = service.sync_all(force_refresh=True)  # 執行緒池沒有空閒執行緒
+
+        assert snapshot.has_data
+        assert received == [snapshot]
+        assert mock_session.get.call_count == 2
+        executor.run_pending()  # 已取消的工作不會再執行
+        assert mock_session.get.call_count == 2
+
     def test_parallel_fetching(self, mock_session, mock_settings, mock_html_responses):
         """測試平行抓取"""
         service = DataSyncService(mock_session, mock_settings)
@@ -0,0 +1,82 @@
+"""測試匯出服務"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from src.models import AttendanceRecord, OvertimeReport
+from src.services.export_service import ExportService
+
+
+@pytest.fixture
+def report():
+    return OvertimeReport(
+        records=[
+            AttendanceRecord("2025/11/03", "08:30:00", "19:00:00", 1.0, 630),
+            AttendanceRecord("2025/11/04", "09:00:00", "18:40:00", 0.0, 580),
+            AttendanceRecord("2025/11/05", "08:50:00", "21:00:00", 2.5, 730),
+        ]
+    )
+
+
+def _read_rows(path):
+    worksheet = load_workbook(path)["加班記錄"]
+    return [list(row) for row in worksheet.iter_rows(values_only=True)]
+
+
+def test_export_to_excel(report, tmp_path):
+    path = ExportService().export_to_excel(report, str(tmp_path / "report.xlsx"))
+
+    rows = _read_rows(path)
+    summary = report.get_summary()
+    assert rows[0] == list(ExportService.COLUMNS)
+    assert rows[1] == ["2025/11/03", "08:30:00", "19:00:00", 630, 1.0]
+    assert rows[4][0] is None
+    assert rows[5][0] == "統計資訊"
+    assert [row[:2] for row in rows[6:]] == [
+        ["記錄天數", summary["記錄天數"]],
+        ["加班天數", summary["加班天數"]],
+        ["總加班時數", f"{summary['總加班時數']} hr"],
+        ["平均每日加班", f"{summary['平均每日加班']} hr"],
+        ["最長加班", f"{summary['最長加班']} hr"],
+        ["最長加班日期", summary["最長加班日期"]],
+    ]
+
+
+def test_export_records_from_generator(report, tmp_path):
+    """記錄可由產生器逐筆提供"""
+    path = ExportService().export_records_to_excel(
+        (record for record in report.records), str(tmp_path / "stream.xlsx")
+    )
+
+    rows = _read_rows(path)
+    assert [row[0] for row in rows[1:4]] == [r.date for r in report.records]
+    assert rows[-1][:2] == ["最長加班日期", "2025/11/05"]
+
+
+def test_empty_report_is_not_exported(tmp_path):
+    assert ExportService().export_to_excel(OvertimeReport(), str(tmp_path / "x.xlsx")) is None
+
+
+def test_excel_export_does_not_import_pandas(tmp_path):
+    script = (
+        "import sys\n"
+        "from src.models import AttendanceRecord, OvertimeReport\n"
+        "from src.services import ExportService\n"
+        "report = OvertimeReport([AttendanceRecord('2025/11/03', '08:30:00', '19:00:00')])\n"
+        f"assert ExportService().export_to_excel(report, {str(tmp_path / 'r.xlsx')!r})\n"
+        "print('pandas' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
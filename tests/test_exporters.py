@@ -0,0 +1,136 @@
+"""測試欄式資料匯出 (CSV / JSON-lines / Parquet)"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from src.models import AttendanceRecord, PersonalRecord, UnifiedOvertimeRecord
+from src.services import exporters
+from src.services.export_service import ExportService
+from src.services.exporters import (
+    PERSONAL_SCHEMA,
+    UNIFIED_SCHEMA,
+    RecordExporter,
+    available_formats,
+    get_exporter,
+    register_exporter,
+)
+
+
+@pytest.fixture
+def unified_records():
+    return [
+        UnifiedOvertimeRecord(
+            date="2025/11/05",
+            punch_start="08:50:00",
+            punch_end="21:00:00",
+            calculated_overtime_hours=2.5,
+            has_anomaly=True,
+            submitted=True,
+            reported_overtime_hours=2.5,
+        ),
+        UnifiedOvertimeRecord(date="2025/11/04", calculated_overtime_hours=1.0),
+    ]
+
+
+def test_schema_follows_model_fields():
+    assert UNIFIED_SCHEMA.names[:3] == ["date", "punch_start", "punch_end"]
+    types = {column.name: column.type for column in UNIFIED_SCHEMA.columns}
+    assert types["has_anomaly"] == "bool"
+    assert types["reported_overtime_hours"] == "float"
+    assert PERSONAL_SCHEMA.names == [
+        "date",
+        "content",
+        "status",
+        "overtime_hours",
+        "monthly_total",
+        "quarterly_total",
+        "report_type",
+    ]
+
+
+def test_csv(unified_records):
+    stream = io.StringIO()
+
+    count = get_exporter("csv", UNIFIED_SCHEMA).export(iter(unified_records), stream)
+
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert count == 2
+    assert list(rows[0]) == UNIFIED_SCHEMA.names
+    assert rows[0]["has_anomaly"] == "true"
+    assert rows[1]["submitted"] == "false"
+    assert rows[1]["punch_start"] == ""
+    assert float(rows[0]["calculated_overtime_hours"]) == 2.5
+
+
+def test_jsonl(unified_records, tmp_path):
+    path = tmp_path / "records.jsonl"
+
+    count = get_exporter("jsonl", UNIFIED_SCHEMA).export(unified_records, path)
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert count == 2
+    assert list(lines[0]) == UNIFIED_SCHEMA.names
+    assert lines[0]["has_anomaly"] is True
+    assert lines[1]["reported_overtime_hours"] is None
+
+
+def test_export_service_infers_schema(tmp_path):
+    records = [
+        PersonalRecord("2025/11/05", "專案開發", "簽核完成", 2.5, 10.0, 20.0, "加班"),
+    ]
+    path = tmp_path / "personal.csv"
+
+    assert ExportService().export_records(records, "csv", path) == 1
+    assert path.read_text(encoding="utf-8").splitlines()[0] == ",".join(
+        PERSONAL_SCHEMA.names
+    )
+    assert ExportService().export_records([], "csv", path) is None
+    assert ExportService().export_records(records, "unknown", path) is None
+
+
+def test_register_exporter(monkeypatch):
+    """新增的格式以 register_exporter 註冊"""
+    monkeypatch.setattr(exporters, "_EXPORTERS", dict(exporters._EXPORTERS))
+
+    @register_exporter
+    class DatesExporter(RecordExporter):
+        format = "dates"
+        extension = ".txt"
+
+        def _write(self, rows, stream):
+            dates = [row[0] for row in rows]
+            stream.write("\n".join(dates))
+            return len(dates)
+
+    stream = io.StringIO()
+    records = [AttendanceRecord("2025/11/03", "08:30:00", "19:00:00")]
+
+    assert "dates" in available_formats()
+    assert ExportService().export_records(records, "dates", stream) == 1
+    assert stream.getvalue() == "2025/11/03"
+
+
+def test_parquet(unified_records, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "records.parquet"
+
+    count = get_exporter("parquet", UNIFIED_SCHEMA, batch_size=1).export(
+        unified_records, path
+    )
+
+    table = pq.read_table(path)
+    assert count == 2
+    assert table.column_names == UNIFIED_SCHEMA.names
+    assert table.column("has_anomaly").to_pylist() == [True, False]
+    assert pq.ParquetFile(path).num_row_groups == 2
+
+
+def test_parquet_unavailable_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(exporters.ParquetExporter, "available", classmethod(lambda cls: False))
+
+    assert "parquet" not in available_formats()
+    with pytest.raises(ValueError):
+        get_exporter("parquet", UNIFIED_SCHEMA)
@@ -0,0 +1,112 @@
+"""測試 SSP 連線管理 (連線池、重試、壓縮、計時)"""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.config.settings import Settings
+from src.services.http_transport import RequestMetrics, create_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """測試用 SSP 伺服器: /flaky 前兩次回應 503,其餘回應 gzip 內容"""
+
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        key = (self.command, self.path)
+        _Handler.hits[key] = _Handler.hits.get(key, 0) + 1
+
+        if self.path == "/flaky" and _Handler.hits[key] <= 2:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = "<html>出勤資料</html>".encode("utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.hits = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def settings():
+    return Settings(HTTP_MAX_RETRIES=3, HTTP_BACKOFF_FACTOR=0)
+
+
+def test_gzip_and_keep_alive(server, settings):
+    metrics = RequestMetrics()
+    session = create_session(settings, metrics)
+
+    first = session.get(f"{server}/FW99001Z.aspx", timeout=5)
+    second = session.get(f"{server}/FW99001Z.aspx", timeout=5)
+
+    assert first.text == second.text == "<html>出勤資料</html>"
+    timings = metrics.recent()
+    assert [t.content_encoding for t in timings] == ["gzip", "gzip"]
+    assert [t.reused_connection for t in timings] == [False, True]
+    assert timings[1].connect_seconds == 0.0
+    assert timings[0].ttfb_seconds >= timings[0].connect_seconds
+
+    summary = metrics.summary()["GET /FW99001Z.aspx"]
+    assert summary["count"] == 2
+    assert summary["new_connections"] == 1
+
+
+def test_get_is_retried(server, settings):
+    metrics = RequestMetrics()
+    session = create_session(settings, metrics)
+
+    response = session.get(f"{server}/flaky", timeout=5)
+
+    assert response.status_code == 200
+    assert _Handler.hits[("GET", "/flaky")] == 3
+    assert metrics.recent()[0].retries == 2
+
+
+def test_post_is_not_retried(server, settings):
+    session = create_session(settings)
+
+    response = session.post(f"{server}/flaky", data={"a": "1"}, timeout=5)
+
+    assert response.status_code == 503
+    assert _Handler.hits[("POST", "/flaky")] == 1
+
+
+def test_pool_size_from_settings():
+    session = create_session(Settings(HTTP_POOL_SIZE=8))
+    adapter = session.get_adapter("https://ssp.example.com")
+
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.allowed_methods == frozenset({"GET", "HEAD"})
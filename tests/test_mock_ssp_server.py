@@ -0,0 +1,277 @@
+"""測試本機 SSP 模擬伺服器 (登入 → 同步 → 翻頁 → 預覽 → 送出 全流程)"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from benchmarks.mock_ssp_server import MockSSPConfig, MockSSPServer
+from src.config.settings import Settings
+from src.models import OvertimeSubmissionRecord
+from src.services.auth_service import AuthService
+from src.services.data_service import DataService
+from src.services.data_sync_service import DataSyncService
+from src.services.overtime_report_service import OvertimeReportService
+
+
+@pytest.fixture
+def server():
+    config = MockSSPConfig(attendance_rows=25, personal_rows=10, anomaly_page_size=10)
+    with MockSSPServer(config) as mock_server:
+        yield mock_server
+
+
+@pytest.fixture
+def settings(server):
+    return Settings(SSP_BASE_URL=server.base_url, HTTP_BACKOFF_FACTOR=0)
+
+
+@pytest.fixture
+def auth(server, settings):
+    auth_service = AuthService(settings)
+    assert auth_service.login(server.config.username, server.config.password)
+    return auth_service
+
+
+def _records(count):
+    return [
+        OvertimeSubmissionRecord(
+            date=f"2025/11/{day + 1:02d}",
+            description="專案開發",
+            overtime_hours=1.5,
+            is_overtime=day % 2 == 0,
+        )
+        for day in range(count)
+    ]
+
+
+def test_login(server, settings):
+    """帳號密碼正確才能登入,未登入存取頁面會轉向登入頁"""
+    auth_service = AuthService(settings)
+    assert not auth_service.login(server.config.username, "wrong")
+
+    response = auth_service.session.get(f"{server.base_url}/FW99001Z.aspx")
+    assert response.url.endswith("/index.aspx")
+
+    assert auth_service.login(server.config.username, server.config.password)
+
+
+def test_legacy_paging(server, auth, settings):
+    """DataService 以 Page$N PostBack 翻完所有頁面"""
+    records = DataService(auth.get_session(), settings).get_attendance_data()
+
+    assert len(records) == 25
+    assert server.request_count("/FW99001Z.aspx", "POST") == 2  # 第 2、3 頁
+
+
+def test_parallel_paging_matches_sequential():
+    """平行翻頁與逐頁翻頁結果相同 (含超過 10 頁的 "..." 區段)"""
+    config = MockSSPConfig(attendance_rows=50, anomaly_page_size=2)
+    with MockSSPServer(config) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url, MAX_PAGES=100)
+        auth_service = AuthService(settings)
+        assert auth_service.login(config.username, config.password)
+        service = DataService(auth_service.get_session(), settings)
+
+        sequential = service.get_attendance_data(parallel=False)
+        parallel = service.get_attendance_data()
+        limited = service.get_attendance_data(max_pages=12)
+
+    assert len(sequential) == 20  # 逐頁翻頁只跟隨數字連結 (不跟隨 "...")
+    assert parallel[:20] == sequential
+    assert len(parallel) == 50
+    assert limited == parallel[:24]
+
+
+def test_parallel_paging_with_busy_executor(server, auth, settings):
+    """注入的執行緒池忙碌時,尚未開始的分頁在呼叫端執行緒抓取 (不會互相等待)"""
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(release.wait)  # 佔住唯一的工作執行緒
+        try:
+            service = DataService(auth.get_session(), settings, executor=executor)
+            records = service.get_attendance_data()
+        finally:
+            release.set()
+
+    assert len(records) == 25
+    assert server.request_count("/FW99001Z.aspx", "POST") == 2
+
+
+def test_parallel_paging_latency():
+    """10 頁在有延遲時約為 2 個請求的時間"""
+    config = MockSSPConfig(
+        attendance_rows=100, anomaly_page_size=10, latency_seconds=0.2
+    )
+    with MockSSPServer(config) as server:
+        settings = Settings(SSP_BASE_URL=server.base_url)
+        auth_service = AuthService(settings)
+        assert auth_service.login(config.username, config.password)
+        service = DataService(auth_service.get_session(), settings)
+
+        started = time.perf_counter()
+        records = service.get_attendance_data()
+        elapsed = time.perf_counter() - started
+
+    assert len(records) == 100
+    assert elapsed < 1.2  # 逐頁翻頁需 2.0s 以上
+
+
+def test_sync_all(server, auth, settings):
+    """DataSyncService 平行抓取出勤與個人記錄頁面"""
+    before = server.request_count("/FW99001Z.aspx", "GET")  # 登入後的轉向
+    snapshot = DataSyncService(auth.get_session(), settings).sync_all()
+
+    assert len(snapshot.unified_records) > 0
+    assert server.request_count("/FW99001Z.aspx", "GET") == before + 1
+    assert server.request_count("/FW21003Z.aspx", "GET") == 1
+
+
+def test_preview_and_submit(server, auth, settings):
+    """預覽與送出: 每增加一列一次 PostBack,送出的記錄出現在個人記錄"""
+    service = OvertimeReportService(settings)
+    records = _records(3)
+
+    preview = service.preview_form(auth.get_session(), records)
+    assert preview["success"]
+
+    result = service.submit_form(auth.get_session(), records)
+    assert result["success"]
+    assert result["submitted_count"] == 3
+    assert len(server.submissions) == 1
+
+    snapshot = DataSyncService(auth.get_session(), settings).sync_all()
+    submitted = snapshot.get_record_by_date("2025/11/01")
+    assert submitted is not None
+    assert submitted.submission_status == "簽核中"
+
+
+def test_form_state_reused(server, auth, settings):
+    """預覽後送出不再重新增加列;較多列時從快取的狀態繼續增加;送出後不再使用快取"""
+    service = OvertimeReportService(settings)
+    session = auth.get_session()
+
+    preview = service.preview_form(session, _records(3))
+    assert preview["success"]
+    assert set(preview["timings"]) == {"fetch_form", "add_rows", "build_form", "total"}
+    assert server.request_count("/FW21001Z.aspx", "GET") == 1
+    assert server.request_count("/FW21001Z.aspx", "POST") == 2  # 增加第 2、3 列
+
+    # 5 列: 從 3 列的狀態再增加 2 列;2 列: 直接使用快取
+    assert service.preview_form(session, _records(5))["success"]
+    assert server.request_count("/FW21001Z.aspx", "POST") == 4
+    result = service.submit_form(session, _records(2))
+    assert result["success"]
+    assert "fetch_form" not in result["timings"]
+    assert "add_rows" not in result["timings"]
+    assert server.request_count("/FW21001Z.aspx", "GET") == 1
+    assert server.request_count("/FW21001Z.aspx", "POST") == 5  # 只有送出
+
+    # 送出後重新取得頁面
+    assert service.preview_form(session, _records(1))["success"]
+    assert server.request_count("/FW21001Z.aspx", "GET") == 2
+
+    # 清除快取後重新取得頁面
+    service.clear_form_cache(session)
+    assert service.preview_form(session, _records(1))["success"]
+    assert server.request_count("/FW21001Z.aspx", "GET") == 3
+
+
+def test_form_state_cache_expires(server, auth, settings):
+    """快取超過 FORM_STATE_CACHE_SECONDS 後重新取得頁面"""
+    settings.FORM_STATE_CACHE_SECONDS = 0
+    service = OvertimeReportService(settings)
+
+    assert service.preview_form(auth.get_session(), _records(2))["success"]
+    time.sleep(0.01)
+    assert service.submit_form(auth.get_session(), _records(2))["success"]
+
+    assert server.request_count("/FW21001Z.aspx", "GET") == 2
+    assert server.request_count("/FW21001Z.aspx", "POST") == 3
+
+
+def test_submit_with_prepared_handle(server, auth, settings):
+    """以預覽的控制代碼直接送出;記錄不同時不使用控制代碼"""
+    service = OvertimeReportService(settings)
+    session = auth.get_session()
+    records = _records(4)
+
+    preview = service.preview_form(session, records)
+    service.clear_form_cache(session)  # 只靠控制代碼
+    result = service.submit_form(session, records, prepared=preview["prepared"])
+
+    assert result["success"]
+    assert server.request_count("/FW21001Z.aspx", "GET") == 1
+    assert server.request_count("/FW21001Z.aspx", "POST") == 4  # 增加 3 列 + 送出
+    assert "rebuilt" not in result
+
+    changed = _records(4)
+    changed[0].description = "客戶支援"
+    result = service.submit_form(session, changed, prepared=preview["prepared"])
+    assert result["success"]
+    assert server.submissions[-1][
+        "ctl00$ContentPlaceHolder1$gvFlow211i$ctl03$txtOT_Describei"
+    ] == "客戶支援"
+
+
+def test_submit_rebuilds_rejected_state(server, auth, settings):
+    """伺服器拒絕預覽時的 ViewState,重新取得頁面後只送出一次"""
+    service = OvertimeReportService(settings)
+    session = auth.get_session()
+    records = _records(3)
+
+    preview = service.preview_form(session, records)
+    server.expire_viewstates()
+    result = service.submit_form(session, records, prepared=preview["prepared"])
+
+    assert result["success"]
+    assert result["rebuilt"]
+    assert server.request_count("/FW21001Z.aspx", "GET") == 2
+    assert len(server.submissions) == 1
+
+
+def test_rejected_state_detected_without_server_error(settings):
+    """ViewState 錯誤頁面以 200 回應時也視為狀態失效;正常頁面的 __VIEWSTATE 欄位不算"""
+    service = OvertimeReportService(settings)
+
+    def response(status_code, text):
+        result = requests.Response()
+        result.status_code = status_code
+        result._content = text.encode("utf-8")
+        result.encoding = "utf-8"
+        return result
+
+    error_page = "<html><body>Validation of viewstate MAC failed.</body></html>"
+    form_page = (
+        '<html><body><input type="hidden" name="__VIEWSTATE" value="abc" />'
+        '<span id="lblMessage">申請成功</span></body></html>'
+    )
+    assert service._is_rejected_state(response(200, error_page))
+    assert service._is_rejected_state(response(500, error_page))
+    assert not service._is_rejected_state(response(200, form_page))
+
+
+def test_invalid_viewstate_rejected(server, auth):
+    """ViewState / EventValidation 不符時回應系統錯誤"""
+    response = auth.get_session().post(
+        f"{server.base_url}/FW99001Z.aspx",
+        data={"__VIEWSTATE": "forged", "__EVENTVALIDATION": "forged"},
+    )
+
+    assert response.status_code == 500
+    assert "系統錯誤" in response.text
+
+
+def test_failure_injection(server, auth, settings):
+    """注入的 503 對 GET 會重試成功,POST 則直接失敗"""
+    before = server.request_count("/FW99001Z.aspx", "GET")
+    server.fail_next("/FW99001Z.aspx", count=2)
+    response = auth.get_session().get(f"{server.base_url}/FW99001Z.aspx")
+    assert response.status_code == 200
+    assert server.request_count("/FW99001Z.aspx", "GET") == before + 3
+
+    server.fail_next("/FW21001Z.aspx", count=1)
+    response = auth.get_session().post(f"{server.base_url}/FW21001Z.aspx", data={})
+    assert response.status_code == 503
@@ -2,7 +2,13 @@
 
 import pytest
 from datetime import datetime
-from src.models import AttendanceRecord, OvertimeReport
+from src.models import (
+    AttendanceRecord,
+    AttendanceSnapshot,
+    OvertimeReport,
+    OvertimeStatistics,
+    UnifiedOvertimeRecord,
+)
 
 
 class TestAttendanceRecord:
@@ -46,6 +52,44 @@ class TestAttendanceRecord:
         # 相同內容應該有相同的 hash
         assert hash(record1) == hash(record2)
 
+    def test_datetime_cache(self):
+        """測試日期時間解析快取 (重新指定欄位後需重新解析)"""
+        record = AttendanceRecord(
+            date="2024/10/28", start_time="08:30:00", end_time="18:00:00"
+        )
+
+        assert record.date_obj is record.date_obj
+        assert record.end_datetime is record.end_datetime
+        assert record.start_datetime == datetime(2024, 10, 28, 8, 30)
+
+        record.date = "2024/10/29"
+        record.end_time = "19:00:00"
+        assert record.date_obj == datetime(2024, 10, 29)
+        assert record.start_datetime == datetime(2024, 10, 29, 8, 30)
+        assert record.end_datetime == datetime(2024, 10, 29, 19, 0)
+
+    def test_slots_layout(self):
+        """測試 __slots__ 配置 (快取不影響比較與欄位)"""
+        from dataclasses import asdict
+
+        record = AttendanceRecord(
+            date="2024/10/28", start_time="08:30:00", end_time="18:00:00"
+        )
+        other = AttendanceRecord(
+            date="2024/10/28", start_time="08:30:00", end_time="18:00:00"
+        )
+        record.date_obj
+
+        assert not hasattr(record, "__dict__")
+        assert record == other
+        assert set(asdict(record)) == {
+            "date",
+            "start_time",
+            "end_time",
+            "overtime_hours",
+            "total_minutes",
+        }
+
 
 class TestOvertimeReport:
     """測試加班報表模型"""
@@ -128,3 +172,157 @@ class TestOvertimeReport:
         assert report.average_overtime_hours == 0
         assert report.max_overtime_hours == 0
         assert report.max_overtime_date == ""
+
+
+class TestAttendanceSnapshot:
+    """測試 AttendanceSnapshot 的日期索引與分類檢視"""
+
+    @pytest.fixture
+    def snapshot(self):
+        return AttendanceSnapshot(
+            start_date="2025/11/01",
+            end_date="2025/11/04",
+            unified_records=[
+                UnifiedOvertimeRecord(
+                    date="2025/11/01", has_anomaly=True, calculated_overtime_hours=1.5
+                ),
+                UnifiedOvertimeRecord(
+                    date="2025/11/02",
+                    has_anomaly=True,
+                    calculated_overtime_hours=2.0,
+                    submitted=True,
+                ),
+                UnifiedOvertimeRecord(date="2025/11/03", submitted=True),
+            ],
+        )
+
+    def test_get_record_by_date(self, snapshot):
+        assert snapshot.get_record_by_date("2025/11/02") is snapshot.unified_records[1]
+        assert snapshot.get_record_by_date("2025/12/01") is None
+
+    def test_views_are_cached(self, snapshot):
+        pending = snapshot.get_pending_records()
+
+        assert [r.date for r in pending] == ["2025/11/01"]
+        assert snapshot.get_pending_records() is pending
+        assert [r.date for r in snapshot.get_anomaly_records()] == [
+            "2025/11/01",
+            "2025/11/02",
+        ]
+        assert [r.date for r in snapshot.get_submitted_records()] == [
+            "2025/11/02",
+            "2025/11/03",
+        ]
+
+    def test_invalidate_after_mutation(self, snapshot):
+        """直接修改記錄欄位後需 invalidate_views"""
+        assert len(snapshot.get_pending_records()) == 1
+
+        snapshot.get_record_by_date("2025/11/01").submitted = True
+        snapshot.invalidate_views()
+
+        assert snapshot.get_pending_records() == []
+        assert len(snapshot.get_submitted_records()) == 3
+
+    def test_index_rebuilt_when_records_change(self, snapshot):
+        """新增或替換記錄時自動重建索引"""
+        assert snapshot.get_record_by_date("2025/11/04") is None
+
+        snapshot.unified_records.append(UnifiedOvertimeRecord(date="2025/11/04"))
+        assert snapshot.get_record_by_date("2025/11/04") is not None
+
+        snapshot.unified_records = [UnifiedOvertimeRecord(date="2025/11/05")]
+        assert snapshot.get_record_by_date("2025/11/01") is None
+        assert snapshot.get_anomaly_records() == []
+
+    def test_replaced_list_of_same_length(self, snapshot):
+        """替換為相同長度的新列表時不會沿用舊列表的索引"""
+        for day in range(5, 10):
+            snapshot.unified_records = [
+                UnifiedOvertimeRecord(date=f"2025/11/0{day}"),
+                UnifiedOvertimeRecord(date="2025/12/01"),
+                UnifiedOvertimeRecord(date="2025/12/02"),
+            ]
+            record = snapshot.get_record_by_date(f"2025/11/0{day}")
+            assert record is snapshot.unified_records[0]
+
+    def test_invalidate_after_element_replacement(self, snapshot):
+        """替換列表中的元素後需 invalidate_views"""
+        snapshot.get_record_by_date("2025/11/01")
+
+        replacement = UnifiedOvertimeRecord(date="2025/11/01")
+        snapshot.unified_records[0] = replacement
+        snapshot.invalidate_views()
+
+        assert snapshot.get_record_by_date("2025/11/01") is replacement
+
+
+class TestOvertimeStatistics:
+    """測試 OvertimeStatistics 的單次累計與差量更新"""
+
+    @pytest.fixture
+    def records(self):
+        return [
+            UnifiedOvertimeRecord(date="2025/11/01", calculated_overtime_hours=1.5),
+            UnifiedOvertimeRecord(
+                date="2025/11/02",
+                has_anomaly=True,
+                calculated_overtime_hours=2.0,
+                submitted=True,
+                reported_overtime_hours=1.5,
+            ),
+            UnifiedOvertimeRecord(
+                date="2025/11/03",
+                calculated_overtime_hours=1.0,
+                submitted=True,
+                reported_overtime_hours=1.0,
+            ),
+            UnifiedOvertimeRecord(date="2025/11/04"),
+        ]
+
+    def test_from_records(self, records):
+        stats = OvertimeStatistics.from_records(records, "2025/11/01", "2025/11/04")
+
+        assert stats.total_days == 4
+        assert stats.total_overtime_hours == 4.5
+        assert stats.submitted_overtime_hours == 2.5
+        assert stats.pending_overtime_hours == 1.5
+        assert stats.workdays_with_overtime == 3
+        assert stats.pending_submission_days == 2
+        assert stats.anomaly_days == 1
+        assert stats.discrepancy_count == 1
+
+    def test_delta_matches_recompute(self, records):
+        """記錄狀態改變時以差量更新,結果與重新計算相同"""
+        stats = OvertimeStatistics.from_records(records, "2025/11/01", "2025/11/04")
+
+        record = records[0]
+        stats.remove_record(record)
+        record.submitted = True
+        record.reported_overtime_hours = 1.0
+        stats.add_record(record)
+
+        assert stats == OvertimeStatistics.from_records(
+            records, "2025/11/01", "2025/11/04"
+        )
+
+    def test_many_deltas_do_not_drift(self):
+        """大量差量更新後時數不累積浮點誤差"""
+        records = [
+            UnifiedOvertimeRecord(
+                date=f"2025/11/{day:02d}", calculated_overtime_hours=0.1 * (day % 7 + 1)
+            )
+            for day in range(1, 29)
+        ]
+        stats = OvertimeStatistics.from_records(records, "2025/11/01", "2025/11/28")
+
+        for record in records:
+            stats.remove_record(record)
+            record.submitted = True
+            record.reported_overtime_hours = record.calculated_overtime_hours
+            stats.add_record(record)
+
+        assert stats.pending_overtime_hours == 0.0
+        assert stats == OvertimeStatistics.from_records(
+            records, "2025/11/01", "2025/11/28"
+        )
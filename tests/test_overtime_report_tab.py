@@ -1,10 +1,18 @@
 """OvertimeReportTab UI 邏輯測試"""
 
+from types import SimpleNamespace
+
 import pytest
 import customtkinter as ctk
 from tkinter import TclError
 
+from benchmarks.synthetic_pages import (
+    generate_personal_record_rows,
+    render_personal_record_page,
+)
 from src.models import OvertimeSubmissionRecord
+from src.parsers.personal_record_parser import PersonalRecordParser
+from src.services.status_tracker import OvertimeStatusTracker
 from src.services.template_manager import TemplateManager
 from ui.components.overtime_report_tab import OvertimeReportTab
 
@@ -114,3 +122,30 @@ def test_template_menu_updates_with_saved_values(tk_root, template_manager):
     assert tab.template_menu is not None
     assert tuple(tab.template_menu.cget("values")) == ("套用範本",)
     assert tab.template_menu.cget("state") == "disabled"
+
+
+def test_status_polling_starts_after_refresh(tk_root, template_manager):
+    """送出後先重新整理,取得新的簽核中記錄後才開始輪詢;登出時停止"""
+    tab = OvertimeReportTab(tk_root, template_manager=template_manager)
+    tab.session = object()
+    tracker = OvertimeStatusTracker()
+    tab.data_sync_service = SimpleNamespace(status_tracker=tracker)
+    tab._run_in_background = lambda task, *args: task(*args)
+
+    rows = generate_personal_record_rows(1)
+    rows[0]["status"] = "簽核中"
+    page = render_personal_record_page(rows)
+
+    def load_submitted_status():
+        # 重新整理時才出現送出後的簽核中記錄
+        tracker.seed(page, PersonalRecordParser.parse_records(page))
+
+    tab._load_submitted_status = load_submitted_status
+    tab._refresh_and_poll()
+    tk_root.update()
+
+    assert tab._status_poll_job is not None
+
+    tab.stop_status_polling()
+    assert tab._status_poll_job is None
+    assert not tab._status_polling
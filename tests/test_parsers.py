@@ -3,7 +3,15 @@
 import pytest
 from pathlib import Path
 from src.parsers.attendance_parser import AttendanceParser
+from src.parsers.html_document import HtmlDocument
 from src.parsers.personal_record_parser import PersonalRecordParser
+from src.parsers.postback_state import PostbackState, extract_hidden_fields
+from src.parsers import stream_parser
+from src.parsers.stream_parser import (
+    StreamAttendanceParser,
+    StreamPersonalRecordParser,
+    TableRowStream,
+)
 from src.models.punch import PunchRecord
 from src.models.leave import LeaveRecord
 from src.models.quota import AttendanceQuota
@@ -114,6 +122,39 @@ class TestAttendanceParser:
         assert quota.overtime_threshold_minutes == 0
 
 
+class TestHtmlDocument:
+    """測試 HtmlDocument (單次解析共用 DOM)"""
+
+    def test_all_tables_from_single_document(self, attendance_html):
+        """同一份 HtmlDocument 可供所有解析方法共用,結果與字串輸入一致"""
+        document = HtmlDocument(attendance_html)
+
+        assert AttendanceParser.parse_punch_records(
+            document
+        ) == AttendanceParser.parse_punch_records(attendance_html)
+        assert AttendanceParser.parse_leave_records(
+            document
+        ) == AttendanceParser.parse_leave_records(attendance_html)
+        assert AttendanceParser.parse_quota(document) == AttendanceParser.parse_quota(
+            attendance_html
+        )
+
+    def test_find_table_is_cached(self, attendance_html):
+        """表格查詢結果會被快取"""
+        document = HtmlDocument(attendance_html)
+
+        table = document.find_table("ContentPlaceHolder1_gvNotes005")
+        assert table is not None
+        assert document.find_table("ContentPlaceHolder1_gvNotes005") is table
+        assert document.find_table("ContentPlaceHolder1_missing") is None
+
+    def test_ensure_returns_same_document(self, attendance_html):
+        """ensure 不會重複解析已建立的 HtmlDocument"""
+        document = HtmlDocument(attendance_html)
+        assert HtmlDocument.ensure(document) is document
+        assert isinstance(HtmlDocument.ensure(attendance_html), HtmlDocument)
+
+
 class TestPersonalRecordParser:
     """測試 PersonalRecordParser"""
 
@@ -242,3 +283,182 @@ class TestPersonalRecordParser:
 
         assert len(records) == 1
         assert records[0]["status"] == ""
+
+
+class TestStreamParsers:
+    """測試串流解析後端 (輸出需與 BeautifulSoup 後端一致)"""
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "parse_punch_records",
+            "parse_leave_records",
+            "parse_quota",
+            "parse_anomaly_records",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "page", ["attendance_html", "anomaly_html", "personal_record_html"]
+    )
+    def test_attendance_parser_matches_soup(self, request, method, page):
+        """出勤頁面各表格解析結果一致"""
+        html = request.getfixturevalue(page)
+
+        expected = getattr(AttendanceParser, method)(html)
+        actual = getattr(StreamAttendanceParser, method)(html)
+
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "page", ["attendance_html", "anomaly_html", "personal_record_html"]
+    )
+    def test_personal_record_parser_matches_soup(self, request, page):
+        """個人記錄解析結果一致"""
+        html = request.getfixturevalue(page)
+
+        expected = PersonalRecordParser.parse_records(html)
+        actual = StreamPersonalRecordParser.parse_records(html)
+
+        assert actual == expected
+
+    def test_small_chunks_keep_text_nodes_intact(self, personal_record_html):
+        """文字跨越 chunk 邊界時不影響結果"""
+        expected = PersonalRecordParser._parse_record_rows(
+            HtmlDocument(personal_record_html)
+            .find_table("ContentPlaceHolder1_gvFlow211")
+            .find_all("tr", class_=list(PersonalRecordParser.DATA_ROW_CLASSES))
+        )
+
+        stream = TableRowStream(
+            personal_record_html, "ContentPlaceHolder1_gvFlow211", chunk_size=3
+        )
+        assert stream.locate()
+        rows = [
+            row
+            for row in stream
+            if set(row.get("class", [])) & set(PersonalRecordParser.DATA_ROW_CLASSES)
+        ]
+
+        assert PersonalRecordParser._parse_record_rows(rows) == expected
+
+    def test_pager_row_with_nested_table(self):
+        """分頁列內含巢狀表格時,結果與 BeautifulSoup 一致"""
+        html = """
+        <table id="ContentPlaceHolder1_gvNotes005">
+            <tr><th>日期</th><th>打卡時間</th></tr>
+            <tr class="RowStyle"><td>114/12/01</td><td> 09:02<!-- x -->:32 </td></tr>
+            <tr class="PagerStyle"><td colspan="2">
+                <table><tr><td><span>1</span></td><td><a href="#">2</a></td></tr></table>
+            </td></tr>
+        </table>
+        """
+        assert StreamAttendanceParser.parse_punch_records(
+            html
+        ) == AttendanceParser.parse_punch_records(html)
+
+    def test_stream_does_not_build_dom(self, attendance_html):
+        """傳入 HtmlDocument 時不會觸發 DOM 建立"""
+        document = HtmlDocument(attendance_html)
+
+        records = StreamAttendanceParser.parse_punch_records(document)
+
+        assert len(records) == 2
+        assert document._soup is None
+
+    def test_rows_are_not_retained(self, personal_record_html):
+        """取出的資料列不被表格或 tokenizer 保留"""
+        stream = TableRowStream(
+            personal_record_html, "ContentPlaceHolder1_gvFlow211", chunk_size=16
+        )
+        assert stream.locate()
+        tokenizer = stream._page._tokenizer
+        table = tokenizer._stack[0]
+
+        rows = list(stream)
+
+        assert rows
+        assert table._descendants == {}
+        assert tokenizer._rows == {}
+
+    def test_document_is_tokenized_once(self, attendance_html, monkeypatch):
+        """同一個 HtmlDocument 的四個表格只走訪一次頁面"""
+        document = HtmlDocument(attendance_html)
+        calls = []
+        original = stream_parser._PageReader.__init__
+
+        def counting_init(self, *args, **kwargs):
+            calls.append(args)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(stream_parser._PageReader, "__init__", counting_init)
+
+        for method in (
+            "parse_punch_records",
+            "parse_leave_records",
+            "parse_quota",
+            "parse_anomaly_records",
+        ):
+            assert getattr(StreamAttendanceParser, method)(document) == getattr(
+                AttendanceParser, method
+            )(attendance_html)
+
+        assert len(calls) == 1
+
+    def test_missing_table(self):
+        """找不到表格時行為與 BeautifulSoup 後端相同"""
+        assert StreamAttendanceParser.parse_punch_records("<html></html>") == []
+        assert StreamAttendanceParser.parse_quota("<html></html>") is None
+        assert StreamPersonalRecordParser.parse_records("<html></html>") == []
+
+
+class TestPostbackState:
+    """測試 PostBack 隱藏欄位擷取"""
+
+    PAGE = """
+    <form method="post" id="form1">
+      <div class="aspNetHidden">
+        <input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="" />
+        <input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="dDwt+MTA/5Nz==" />
+      </div>
+      <input type='hidden' value='C2EE9ABB' name='__VIEWSTATEGENERATOR' />
+      <input type="hidden" data-value="x" name="__EVENTVALIDATION" value="a&amp;b" />
+      <input type="hidden" name="__VIEWSTATE" value="second" />
+    </form>
+    """
+
+    @pytest.mark.parametrize("source", [PAGE, PAGE.encode("utf-8")])
+    def test_matches_beautifulsoup(self, source):
+        """str 與 bytes 皆與 BeautifulSoup.find 的結果相同"""
+        soup = HtmlDocument(self.PAGE).soup
+        expected = {
+            name: soup.find("input", {"name": name})["value"]
+            for name in ("__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION")
+        }
+
+        assert extract_hidden_fields(source) == expected
+        assert PostbackState.from_html(source) == PostbackState(
+            viewstate="dDwt+MTA/5Nz==",
+            viewstate_generator="C2EE9ABB",
+            event_validation="a&b",
+        )
+
+    def test_to_form(self):
+        """一般送出不帶事件欄位,事件 PostBack 帶 __EVENTTARGET / __EVENTARGUMENT"""
+        state = PostbackState("vs", "gen", "ev")
+
+        assert state.to_form() == {
+            "__VIEWSTATE": "vs",
+            "__VIEWSTATEGENERATOR": "gen",
+            "__EVENTVALIDATION": "ev",
+        }
+        form = state.to_form("ctl00$ContentPlaceHolder1$gvWeb012", "Page$2")
+        assert form["__EVENTTARGET"] == "ctl00$ContentPlaceHolder1$gvWeb012"
+        assert form["__EVENTARGUMENT"] == "Page$2"
+
+    def test_missing_viewstate(self):
+        """沒有 __VIEWSTATE 時返回 None;名稱區分大小寫"""
+        assert PostbackState.from_html("<html></html>") is None
+        assert PostbackState.from_html('<input name="__viewstate" value="x">') is None
+        assert PostbackState.from_html(
+            '<input name="__VIEWSTATE" value="x">'
+        ) == PostbackState("x")
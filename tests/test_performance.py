@@ -9,8 +9,32 @@
 注意: 效能測試需要實際登入 SSP 系統,請使用手動測試腳本
 """
 
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
 import pytest
+
+from benchmarks.suite import (
+    BENCHMARKS,
+    BenchmarkResult,
+    compare_with_baseline,
+    run_benchmarks,
+)
+from benchmarks.synthetic_pages import (
+    generate_attendance_page,
+    generate_personal_record_page,
+)
 from src.config.settings import Settings
+from src.parsers import (
+    AttendanceParser,
+    HtmlDocument,
+    PersonalRecordParser,
+    StreamAttendanceParser,
+    StreamPersonalRecordParser,
+)
+from src.utils import ImportProfiler
 
 
 class TestPerformance:
@@ -26,5 +50,113 @@ class TestPerformance:
         print(f"\n✅ 快取時長設定: {settings.CACHE_DURATION_SECONDS}s (5 分鐘)")
 
 
+class TestBenchmarkSuite:
+    """離線效能測試套件 (benchmarks/)"""
+
+    def test_synthetic_attendance_page(self):
+        """合成出勤頁面可被兩種解析器解析"""
+        html = generate_attendance_page(20)
+        document = HtmlDocument(html)
+
+        anomalies = AttendanceParser.parse_anomaly_records(document)
+        assert len(anomalies) == 20
+        assert StreamAttendanceParser.parse_anomaly_records(html) == anomalies
+        assert len(AttendanceParser.parse_punch_records(document)) == 10
+        assert AttendanceParser.parse_quota(document).annual_leave == 15
+
+    def test_synthetic_personal_record_page(self):
+        """合成個人記錄頁面可被兩種解析器解析 (分頁列不計入)"""
+        html = generate_personal_record_page(20)
+
+        records = PersonalRecordParser.parse_records(html)
+        assert len(records) == 20
+        assert StreamPersonalRecordParser.parse_records(html) == records
+
+    def test_run_benchmarks(self):
+        """所有項目皆可執行並產生結果"""
+        results = run_benchmarks(sizes=[10], repeat=1)
+
+        assert [r.name for r in results] == list(BENCHMARKS)
+        for result in results:
+            assert result.rows == 10
+            assert result.rows_per_second > 0
+            assert result.peak_memory_bytes > 0
+
+    def test_export_benchmarks_remove_temp_files(self, monkeypatch, tmp_path):
+        """匯出項目的暫存資料夾於量測後刪除"""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+        run_benchmarks(
+            sizes=[10], names=["excel_export", "csv_export", "jsonl_export"], repeat=1
+        )
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_compare_with_baseline(self):
+        """吞吐量或記憶體超出容許範圍視為退化,無基準值的項目略過"""
+        baseline = {
+            "calculator@1000": {"rows_per_second": 10000, "peak_memory_bytes": 1000}
+        }
+        ok = BenchmarkResult("calculator", 1000, 0.15, 6000, 1400)
+        slow = BenchmarkResult("calculator", 1000, 0.5, 2000, 1000)
+        bloated = BenchmarkResult("calculator", 1000, 0.1, 10000, 2000)
+        unknown = BenchmarkResult("merge", 1000, 10.0, 100, 10**9)
+
+        assert compare_with_baseline([ok, unknown], baseline) == []
+        assert len(compare_with_baseline([slow], baseline)) == 1
+        assert "峰值記憶體" in compare_with_baseline([bloated], baseline)[0]
+
+
+class TestStartupImports:
+    """啟動時不載入匯出用的重量級套件"""
+
+    @staticmethod
+    def _loaded_modules(statement):
+        script = (
+            f"{statement}\n"
+            "import sys\n"
+            "print(','.join(m for m in ('pandas', 'numpy', 'openpyxl') "
+            "if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+        return result.stdout.strip()
+
+    def test_services_do_not_import_pandas(self):
+        assert self._loaded_modules("import src.services, src.cli") == ""
+
+    def test_export_loads_pandas_on_demand(self):
+        statement = (
+            "import io\n"
+            "from src.models import AttendanceRecord, OvertimeReport\n"
+            "from src.services import ExportService\n"
+            "report = OvertimeReport([AttendanceRecord('2025/11/03', '08:30:00', '19:00:00')])\n"
+            "ExportService().generate_text_report(report)"
+        )
+        assert "pandas" in self._loaded_modules(statement)
+
+    def test_import_profiler(self):
+        """程式內匯入分析 (-X importtime 格式)"""
+        sys.modules.pop("json.tool", None)
+        profiler = ImportProfiler().install()
+        try:
+            import json.tool  # noqa: F401
+        finally:
+            profiler.uninstall()
+
+        modules = [timing.module for timing in profiler.timings]
+        assert "json.tool" in modules
+        assert sys.modules["json.tool"].__loader__.__class__.__name__ != "_TimedLoader"
+        report = profiler.format_report(top=5)
+        assert report.splitlines()[0].startswith("import time: self [us]")
+        assert "json.tool" in report
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
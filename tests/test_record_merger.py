@@ -0,0 +1,126 @@
+"""測試異常記錄與個人記錄合併 (merge-join)"""
+
+import logging
+from unittest.mock import patch
+
+from benchmarks.synthetic_pages import generate_merge_inputs
+from src.models import UnifiedOvertimeRecord
+from src.services import record_merger
+from src.services.record_merger import merge_overtime_records, merge_unified_records
+
+
+def _reference_merge(anomaly_records, personal_records):
+    """以日期索引合併後排序 (原本的做法)"""
+    personal_by_date = {r["date"]: r for r in personal_records}
+    anomaly_dates = {r["date"] for r in anomaly_records}
+    merged = [
+        (anomaly["date"], "anomaly", personal_by_date.get(anomaly["date"]))
+        for anomaly in anomaly_records
+    ] + [
+        (personal["date"], "personal", personal)
+        for personal in personal_records
+        if personal["date"] not in anomaly_dates
+    ]
+    merged.sort(key=lambda item: item[0], reverse=True)
+    return merged
+
+
+def _summary(records):
+    return [
+        (
+            r.date,
+            "anomaly" if r.has_anomaly else "personal",
+            r.submitted,
+            r.reported_overtime_hours,
+            r.monthly_total,
+        )
+        for r in records
+    ]
+
+
+def _expected_summary(anomaly_records, personal_records):
+    return [
+        (
+            date,
+            kind,
+            personal is not None,
+            personal.get("overtime_hours") if personal else None,
+            personal.get("monthly_total") if personal else None,
+        )
+        for date, kind, personal in _reference_merge(anomaly_records, personal_records)
+    ]
+
+
+def test_matches_index_and_sort():
+    """結果與建立索引後排序的做法相同"""
+    anomaly_records, personal_records = generate_merge_inputs(200, seed=3)
+
+    records = list(merge_overtime_records(anomaly_records, personal_records))
+
+    assert _summary(records) == _expected_summary(anomaly_records, personal_records)
+    assert records[0].punch_start and records[0].punch_end
+
+
+def test_duplicate_and_unsorted_dates():
+    """同一日期多筆、輸入未排序時仍與排序後合併相同"""
+    anomaly_records = [
+        {"date": "2025/11/02", "overtime_hours": 1.0},
+        {"date": "2025/11/05", "overtime_hours": 2.0},
+        {"date": "2025/11/02", "overtime_hours": 3.0},
+    ]
+    personal_records = [
+        {"date": "2025/11/02", "overtime_hours": 1.0, "monthly_total": 1.0},
+        {"date": "2025/11/06", "overtime_hours": 4.0},
+        {"date": "2025/11/02", "overtime_hours": 3.0, "monthly_total": 4.0},
+        {"date": "2025/11/06", "overtime_hours": 5.0},
+    ]
+
+    records = list(merge_overtime_records(anomaly_records, personal_records))
+
+    assert _summary(records) == _expected_summary(anomaly_records, personal_records)
+    assert [r.calculated_overtime_hours for r in records if r.has_anomaly] == [
+        2.0,
+        1.0,
+        3.0,
+    ]
+
+
+def test_merge_into_existing():
+    """新的一批記錄取代既有記錄中相同日期的記錄,其餘保留"""
+    existing = [
+        UnifiedOvertimeRecord(date="2025/11/05"),
+        UnifiedOvertimeRecord(date="2025/11/03"),
+        UnifiedOvertimeRecord(date="2025/11/01"),
+    ]
+    incoming = [
+        UnifiedOvertimeRecord(date="2025/11/04", submitted=True),
+        UnifiedOvertimeRecord(date="2025/11/03", submitted=True),
+    ]
+
+    records = list(merge_unified_records(existing, incoming))
+
+    assert [r.date for r in records] == [
+        "2025/11/05",
+        "2025/11/04",
+        "2025/11/03",
+        "2025/11/01",
+    ]
+    assert records[2] is incoming[1]
+    assert records[0] is existing[0]
+
+
+def test_no_per_record_logging_when_debug_disabled():
+    """debug 未開啟時不組合每筆記錄的日誌"""
+    anomaly_records, personal_records = generate_merge_inputs(20)
+
+    with patch.object(record_merger, "_log_personal") as log_personal:
+        record_merger.logger.setLevel(logging.INFO)
+        try:
+            list(merge_overtime_records(anomaly_records, personal_records))
+            assert not log_personal.called
+
+            record_merger.logger.setLevel(logging.DEBUG)
+            list(merge_overtime_records(anomaly_records, personal_records))
+            assert log_personal.called
+        finally:
+            record_merger.logger.setLevel(logging.NOTSET)
@@ -0,0 +1,112 @@
+"""SnapshotStore 單元測試"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.config.settings import Settings
+from src.models.attendance import UnifiedOvertimeRecord
+from src.models.leave import LeaveRecord
+from src.models.punch import PunchRecord
+from src.models.quota import AttendanceQuota
+from src.models.snapshot import AttendanceSnapshot, OvertimeStatistics
+from src.services.snapshot_store import SnapshotStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SnapshotStore:
+    return SnapshotStore(cache_dir=tmp_path / "snapshots")
+
+
+@pytest.fixture
+def snapshot() -> AttendanceSnapshot:
+    return AttendanceSnapshot(
+        start_date="2025/12/01",
+        end_date="2025/12/02",
+        fetched_at=datetime.now(),
+        punch_records=[PunchRecord(date="2025/12/01", punch_times=["08:30:00"])],
+        leave_records=[LeaveRecord(leave_type="特休", days=1, hours=4)],
+        quota=AttendanceQuota(annual_leave=5, compensatory_leave=2),
+        unified_records=[
+            UnifiedOvertimeRecord(
+                date="2025/12/02",
+                punch_start="08:30:00",
+                punch_end="19:30:00",
+                calculated_overtime_hours=1.5,
+                has_anomaly=True,
+                anomaly_description="加班",
+            ),
+            UnifiedOvertimeRecord(
+                date="2025/12/01",
+                submitted=True,
+                submission_status="簽核中",
+                submission_type="調休",
+                reported_overtime_hours=2.0,
+            ),
+        ],
+        statistics=OvertimeStatistics(
+            start_date="2025/12/01", end_date="2025/12/02", total_overtime_hours=1.5
+        ),
+    )
+
+
+def test_round_trip(store: SnapshotStore, snapshot: AttendanceSnapshot):
+    assert store.save("user_2025-12", snapshot)
+
+    loaded = store.load("user_2025-12", max_age_seconds=300)
+
+    assert loaded == snapshot
+
+
+def test_missing_and_expired(store: SnapshotStore, snapshot: AttendanceSnapshot):
+    assert store.load("unknown") is None
+
+    snapshot.fetched_at = datetime.now() - timedelta(seconds=600)
+    store.save("user_2025-12", snapshot)
+
+    assert store.load("user_2025-12", max_age_seconds=300) is None
+    assert store.load("user_2025-12") == snapshot
+
+
+def test_corrupted_file_is_ignored(store: SnapshotStore, snapshot: AttendanceSnapshot):
+    store.save("user_2025-12", snapshot)
+    path = store.cache_dir / "user_2025-12.jsonl"
+    path.write_text(path.read_text(encoding="utf-8")[:-20], encoding="utf-8")
+
+    assert store.load("user_2025-12") is None
+
+
+def test_atomic_write_leaves_no_temp_files(
+    store: SnapshotStore, snapshot: AttendanceSnapshot
+):
+    store.save("user_2025-12", snapshot)
+    store.save("user_2025-12", snapshot)
+
+    assert [p.name for p in store.cache_dir.iterdir()] == ["user_2025-12.jsonl"]
+
+    store.delete("user_2025-12")
+    assert store.load("user_2025-12") is None
+
+
+def test_make_key_hides_username():
+    key = SnapshotStore.make_key("E12345", period="2025-12")
+
+    assert key.endswith("_2025-12")
+    assert "E12345" not in key
+    assert key == SnapshotStore.make_key("E12345", period="2025-12")
+
+
+def test_default_directory_follows_settings(tmp_path: Path, monkeypatch):
+    """預設目錄取自 Settings.CACHE_DIR,不隨工作目錄改變"""
+    monkeypatch.chdir(tmp_path)
+    settings = Settings(CACHE_DIR=str(tmp_path / "user-cache"))
+
+    assert SnapshotStore(settings=settings).cache_dir == tmp_path / "user-cache" / "snapshots"
+
+    monkeypatch.setattr(os, "name", "posix")
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert Settings().CACHE_DIR == str(tmp_path / "xdg" / "overtime-assistant")
@@ -0,0 +1,160 @@
+"""測試個人記錄增量追蹤 (OvertimeStatusTracker)"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from benchmarks.synthetic_pages import (
+    generate_personal_record_rows,
+    render_personal_record_page,
+)
+from src.parsers.personal_record_parser import PersonalRecordParser
+from src.parsers.stream_parser import StreamPersonalRecordParser
+from src.services.status_tracker import OvertimeStatusTracker
+
+
+@pytest.fixture
+def records():
+    rows = generate_personal_record_rows(50, seed=1)
+    for index, row in enumerate(rows):
+        row["status"] = "簽核中" if index < 3 else "簽核完成"
+    return rows
+
+
+@pytest.fixture
+def tracker(records):
+    html = render_personal_record_page(records)
+    tracker = OvertimeStatusTracker(min_interval=10, max_interval=40)
+    tracker.seed(html, PersonalRecordParser.parse_records(html))
+    return tracker
+
+
+def _new_record(records, date):
+    return dict(records[0], date=date, status="簽核中")
+
+
+def test_unchanged_page_parses_nothing(tracker, records):
+    """頁面沒有變化時不解析任何列"""
+    result = tracker.poll(render_personal_record_page(records))
+
+    assert result.parsed_rows == 0
+    assert result.changed == []
+    assert not result.full
+    assert result.records == tracker.records
+    assert len(result.records) == 50
+
+
+def test_new_and_changed_rows_match_full_parse(tracker, records):
+    """新增列與狀態改變的列重新解析,其餘沿用上次結果,與完整解析相同"""
+    updated = [_new_record(records, "2099/12/31")] + [dict(r) for r in records]
+    updated[2]["status"] = "簽核完成"
+    html = render_personal_record_page(updated)
+
+    result = tracker.poll(html)
+
+    assert result.records == PersonalRecordParser.parse_records(html)
+    assert result.parsed_rows == 2
+    assert [r["date"] for r in result.changed] == ["2099/12/31", updated[2]["date"]]
+    assert not result.full
+
+
+def test_row_count_mismatch_falls_back_to_full_parse(tracker, records):
+    """舊記錄被移除 (列數不符) 時改為完整解析"""
+    html = render_personal_record_page(records[:-1])
+
+    result = tracker.poll(html)
+
+    assert result.full
+    assert result.records == PersonalRecordParser.parse_records(html)
+
+
+def test_nested_pager_table_and_single_quoted_id(records):
+    """上方分頁列的巢狀表格不會截斷資料列;表格 id 可為單引號"""
+    prefix = "ContentPlaceHolder1_gvFlow211"
+    pager = (
+        '<tr class="PagerStyle"><td colspan="7"><table><tr>'
+        '<td><span>1</span></td><td><a href="#">2</a></td>'
+        "</tr></table></td></tr>"
+    )
+
+    def render(rows):
+        return render_personal_record_page(rows).replace(
+            f'<table id="{prefix}">', f"<table id='{prefix}'>{pager}"
+        )
+
+    html = render(records)
+    tracker = OvertimeStatusTracker()
+    tracker.seed(html, PersonalRecordParser.parse_records(html))
+    assert len(tracker.records) == 50
+
+    html = render([_new_record(records, "2099/12/31")] + records)
+    result = tracker.poll(html)
+
+    assert not result.full
+    assert result.parsed_rows == 1
+    assert result.records == PersonalRecordParser.parse_records(html)
+
+
+def test_stream_parser_backend(records):
+    """PARSER_BACKEND=stream 時以串流解析器解析,結果與完整解析相同"""
+    parser = Mock(wraps=StreamPersonalRecordParser())
+    tracker = OvertimeStatusTracker(parser=parser)
+    tracker.poll(render_personal_record_page(records))
+
+    updated = [_new_record(records, "2099/12/31")] + records
+    html = render_personal_record_page(updated)
+    result = tracker.poll(html)
+
+    assert parser.parse_records.call_count == 2  # 完整解析 + 新增的一列
+    assert result.parsed_rows == 1
+    assert result.records == PersonalRecordParser.parse_records(html)
+
+
+def test_first_poll_is_full_parse(records):
+    """沒有基準時完整解析,不回報變更"""
+    html = render_personal_record_page(records)
+    tracker = OvertimeStatusTracker()
+
+    result = tracker.poll(html)
+
+    assert result.full
+    assert result.changed == []
+    assert result.records == PersonalRecordParser.parse_records(html)
+
+
+def test_adaptive_interval(tracker, records):
+    """沒有變化時間隔加倍 (不超過上限),有變化時重設;沒有簽核中時停止"""
+    html = render_personal_record_page(records)
+    assert tracker.next_interval() == 10
+
+    tracker.poll(html)
+    assert tracker.next_interval() == 20
+    tracker.poll(html)
+    tracker.poll(html)
+    assert tracker.next_interval() == 40
+
+    updated = [_new_record(records, "2099/12/31")] + records
+    tracker.poll(render_personal_record_page(updated))
+    assert tracker.next_interval() == 10
+
+    approved = [dict(r, status="簽核完成") for r in updated]
+    tracker.poll(render_personal_record_page(approved))
+    assert tracker.pending_dates == []
+    assert tracker.next_interval() is None
+
+
+def test_conditional_request(tracker, records):
+    """伺服器提供 ETag 時送出條件式請求,304 沿用上次結果"""
+    response = Mock(
+        status_code=200,
+        headers={"ETag": '"v1"'},
+        text=render_personal_record_page(records),
+    )
+    tracker.poll_response(response)
+    assert tracker.conditional_headers() == {"If-None-Match": '"v1"'}
+
+    result = tracker.poll_response(Mock(status_code=304, headers={}, text=""))
+
+    assert result.not_modified
+    assert result.records == tracker.records
+    assert len(result.records) == 50
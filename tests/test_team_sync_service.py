@@ -0,0 +1,94 @@
+"""測試多帳號同步服務 (本機 SSP 模擬伺服器)"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from benchmarks.mock_ssp_server import MockSSPConfig, MockSSPServer
+from src.config.settings import Settings
+from src.services.team_sync_service import AccountSyncResult, TeamSyncService
+
+
+@pytest.fixture
+def server():
+    config = MockSSPConfig(attendance_rows=10, personal_rows=5)
+    with MockSSPServer(config) as mock_server:
+        yield mock_server
+
+
+@pytest.fixture
+def service(server):
+    settings = Settings(SSP_BASE_URL=server.base_url, HTTP_BACKOFF_FACTOR=0)
+    return TeamSyncService(settings, max_workers=2)
+
+
+def test_sync_accounts_with_failures(server, service):
+    """每個帳號獨立登入同步,單一帳號失敗不影響其他帳號"""
+    username, password = server.config.username, server.config.password
+    credentials = [(username, password), (username, "wrong"), (username, password)]
+    completed = []
+
+    result = service.sync(credentials, progress_callback=completed.append)
+
+    assert [account.success for account in result.accounts] == [True, False, True]
+    assert result.accounts[1].error == "登入失敗"
+    assert len(completed) == 3
+    assert result.accounts[0].snapshot is not result.accounts[2].snapshot
+    assert all(
+        set(account.timings) == {"login", "sync", "total"}
+        for account in result.succeeded
+    )
+
+    # 團隊合計為成功帳號的加總
+    single = result.accounts[0].snapshot.statistics
+    assert result.statistics.total_days == single.total_days * 2
+    assert result.statistics.total_overtime_hours == pytest.approx(
+        single.total_overtime_hours * 2
+    )
+    assert [row["帳號"] for row in result.rows()] == [username] * 3
+    assert "成功 2/3 個帳號" in result.format_summary()
+
+
+def test_concurrency_is_bounded(service):
+    """同時同步的帳號數不超過 max_workers"""
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def fake_sync(username, password):
+        with lock:
+            running.append(username)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(username)
+        return AccountSyncResult(username=username, error="skipped")
+
+    service._sync_account = fake_sync
+    result = service.sync([(f"user{i}", "pw") for i in range(6)])
+
+    assert max(peak) == 2
+    assert [account.username for account in result.accounts] == [
+        f"user{i}" for i in range(6)
+    ]
+
+
+def test_sync_saved_credentials(server, service):
+    """沒有儲存密碼的帳號記為失敗,結果順序同輸入"""
+    credential_manager = Mock()
+    credential_manager.load_password.side_effect = lambda username: (
+        server.config.password if username == server.config.username else None
+    )
+
+    result = service.sync_saved(
+        ["nobody", server.config.username], credential_manager=credential_manager
+    )
+
+    assert [account.username for account in result.accounts] == [
+        "nobody",
+        server.config.username,
+    ]
+    assert result.accounts[0].error == "沒有儲存的密碼"
+    assert result.accounts[1].success
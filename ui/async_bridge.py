@@ -0,0 +1,99 @@
+"""事件迴圈與 Tk 主執行緒的橋接
+
+背景工作統一在 EventLoopThread 的事件迴圈 (及其固定大小的 I/O 執行緒池) 中執行,
+完成後以 widget.after(0, ...) 將結果送回 Tk 主執行緒,
+不再為每個操作建立新的 threading.Thread。
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Optional
+
+from src.services.async_client import EventLoopThread
+
+logger = logging.getLogger(__name__)
+
+
+class TkAsyncBridge:
+    """
+    Tk ↔ asyncio 橋接
+
+    使用方式:
+        ```python
+        bridge = TkAsyncBridge(window, EventLoopThread())
+        bridge.run(self._load_async(), callback=self._on_loaded)
+        bridge.run_blocking(self._export_task, callback=self._on_export_complete)
+        ```
+    """
+
+    def __init__(self, widget, loop_thread: EventLoopThread):
+        """
+        Args:
+            widget: 提供 after() 的 Tk 元件 (通常為主視窗)
+            loop_thread: 長駐事件迴圈執行緒
+        """
+        self.widget = widget
+        self.loop_thread = loop_thread
+
+    def run(
+        self,
+        coro: Coroutine,
+        callback: Optional[Callable[[Any], None]] = None,
+        error_callback: Optional[Callable[[BaseException], None]] = None,
+    ) -> Future:
+        """
+        在事件迴圈執行協程,完成後於 Tk 主執行緒呼叫 callback
+
+        Args:
+            coro: 要執行的協程
+            callback: 成功時呼叫 (參數為協程結果)
+            error_callback: 失敗時呼叫 (參數為例外),未提供時只記錄日誌
+
+        Returns:
+            concurrent.futures.Future: 執行結果
+        """
+        future = self.loop_thread.submit(coro)
+        future.add_done_callback(
+            lambda done: self._dispatch(done, callback, error_callback)
+        )
+        return future
+
+    def run_blocking(
+        self,
+        func: Callable[..., Any],
+        *args,
+        callback: Optional[Callable[[Any], None]] = None,
+        error_callback: Optional[Callable[[BaseException], None]] = None,
+    ) -> Future:
+        """
+        在 I/O 執行緒池執行阻塞函式 (取代 threading.Thread(target=func))
+
+        Args:
+            func: 阻塞函式
+            *args: 函式參數
+            callback: 成功時呼叫 (參數為函式返回值)
+            error_callback: 失敗時呼叫
+        """
+        return self.run(asyncio.to_thread(func, *args), callback, error_callback)
+
+    def _dispatch(
+        self,
+        future: Future,
+        callback: Optional[Callable[[Any], None]],
+        error_callback: Optional[Callable[[BaseException], None]],
+    ):
+        """將結果送回 Tk 主執行緒"""
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            if error_callback:
+                self.widget.after(0, error_callback, error)
+            else:
+                logger.error("背景工作失敗: %s", error, exc_info=error)
+            return
+
+        if callback:
+            self.widget.after(0, callback, future.result())
@@ -9,6 +9,9 @@ from requests import Session
 
 from src.models import OvertimeSubmissionRecord, SubmittedRecord
 from src.services import (
+    BulkSubmissionProgress,
+    BulkSubmissionService,
+    DataSyncService,
     OvertimeReportService,
     OvertimeStatusService,
     TemplateManager,
@@ -80,6 +83,9 @@ class OvertimeReportTab(ctk.CTkFrame):
 
         self.settings = Settings()
         self.report_service = OvertimeReportService(self.settings)
+        self.bulk_submission_service = BulkSubmissionService(
+            self.report_service, self.settings
+        )
         self.status_service = OvertimeStatusService(self.settings)
         self.template_manager = template_manager or TemplateManager(
             default_templates=self.settings.OVERTIME_DESCRIPTION_TEMPLATES
@@ -89,6 +95,10 @@ class OvertimeReportTab(ctk.CTkFrame):
         self.submission_records: List[OvertimeSubmissionRecord] = []
         self.submitted_records: Dict[str, SubmittedRecord] = {}
         self.session: Optional[Session] = None  # 登入的 session
+        self.data_sync_service: Optional[DataSyncService] = None  # 由主視窗注入
+        self.async_bridge = None  # 由主視窗注入 (共用事件迴圈,見 ui.async_bridge)
+        self._status_poll_job: Optional[str] = None  # 簽核中狀態輪詢的 after id
+        self._status_polling = False  # 是否輪詢中 (登出或關閉時停止)
 
         # 範本與輸入欄位管理
         self.record_content_entries: Dict[int, ctk.CTkEntry] = {}
@@ -266,8 +276,17 @@ class OvertimeReportTab(ctk.CTkFrame):
         )
         self.status_label.pack(side="left", padx=spacing.md, pady=spacing.sm)
 
+        # 分批送出進度 (送出時才顯示)
+        self.submit_progress = ctk.CTkProgressBar(
+            status_container, width=200, progress_color=colors.info
+        )
+        self.submit_progress.set(0)
+
     def load_data(
-        self, submission_records: List[OvertimeSubmissionRecord], session: Session
+        self,
+        submission_records: List[OvertimeSubmissionRecord],
+        session: Session,
+        submitted_records: Optional[Dict[str, SubmittedRecord]] = None,
     ):
         """
         載入加班記錄資料
@@ -275,15 +294,22 @@ class OvertimeReportTab(ctk.CTkFrame):
         Args:
             submission_records: 加班補報記錄列表
             session: 已登入的 session
+            submitted_records: 已申請記錄 (由 DataSyncService 快照提供時不再重新查詢)
         """
         self.submission_records = submission_records
         self.session = session
 
+        # 已有已申請狀態 (來自快照),直接套用,不發送 HTTP 請求
+        if submitted_records is not None:
+            self._apply_submitted_status(submitted_records)
+            self._refresh_records_ui()
+            return
+
         # 顯示載入狀態
         self._show_loading_state()
 
-        # 啟動背景執行緒查詢已申請狀態
-        threading.Thread(target=self._load_submitted_status, daemon=True).start()
+        # 背景查詢已申請狀態
+        self._run_in_background(self._load_submitted_status)
 
     def _show_loading_state(self):
         """顯示載入狀態"""
@@ -316,17 +342,16 @@ class OvertimeReportTab(ctk.CTkFrame):
             if not self.session:
                 return
 
-            # 查詢已申請記錄
-            self.submitted_records = self.status_service.fetch_submitted_records(
-                self.session
-            )
+            # 查詢已申請記錄 (優先使用 DataSyncService 增量同步,僅 1 次 HTTP 請求)
+            if self.data_sync_service:
+                self.data_sync_service.sync_overtime_status()
+                submitted_records = self.data_sync_service.get_submitted_records()
+            else:
+                submitted_records = self.status_service.fetch_submitted_records(
+                    self.session
+                )
 
-            # 更新記錄狀態
-            for record in self.submission_records:
-                if record.date in self.submitted_records:
-                    submitted = self.submitted_records[record.date]
-                    record.submitted_status = submitted.status
-                    record.is_selected = False  # 已申請的不勾選
+            self._apply_submitted_status(submitted_records)
 
             # 回到主執行緒更新 UI
             self.after(0, self._refresh_records_ui)
@@ -337,6 +362,16 @@ class OvertimeReportTab(ctk.CTkFrame):
                 0, lambda: self._show_status(f"載入狀態失敗: {error}", colors.error)
             )
 
+    def _apply_submitted_status(self, submitted_records: Dict[str, SubmittedRecord]):
+        """將已申請狀態套用至加班補報記錄"""
+        self.submitted_records = submitted_records
+
+        for record in self.submission_records:
+            if record.date in self.submitted_records:
+                submitted = self.submitted_records[record.date]
+                record.submitted_status = submitted.status
+                record.is_selected = False  # 已申請的不勾選
+
     def _refresh_records_ui(self):
         """重新整理記錄列表 UI"""
         # 清空容器
@@ -742,50 +777,146 @@ class OvertimeReportTab(ctk.CTkFrame):
         if not messagebox.askyesno("確認送出", confirm_text):
             return
 
-        # 背景執行緒執行送出
+        # 背景執行送出
         self._show_status("正在送出申請...", colors.info)
-        threading.Thread(target=self._do_submit, args=(selected,), daemon=True).start()
+        self._run_in_background(self._do_submit, selected)
 
     def _do_submit(self, records: List[OvertimeSubmissionRecord]):
-        """執行送出 (背景執行緒)"""
+        """執行分批送出 (背景執行緒)"""
         try:
             if not self.session:
                 return
 
-            result = self.report_service.submit_form(self.session, records)
+            self.after(0, self._show_submit_progress)
+            result = self.bulk_submission_service.submit(
+                self.session,
+                records,
+                progress_callback=lambda progress: self.after(
+                    0, lambda: self._update_submit_progress(progress)
+                ),
+            )
+            self.after(0, self._hide_submit_progress)
 
-            if result["success"]:
-                self.after(
-                    0,
-                    lambda: messagebox.showinfo(
-                        "成功", f"已成功送出 {result['submitted_count']} 筆加班申請"
-                    ),
-                )
+            if result.success:
+                message = f"已成功送出 {result.submitted_count} 筆加班申請"
+                if result.skipped:
+                    message += f"\n(略過先前已送出的 {len(result.skipped)} 筆)"
+                self.after(0, lambda: messagebox.showinfo("成功", message))
                 self.after(0, lambda: self._show_status("送出成功", colors.success))
-                # 重新整理狀態
-                self.after(0, self.on_refresh)
             else:
-                self.after(
-                    0,
-                    lambda: messagebox.showerror(
-                        "錯誤", result.get("error", "送出失敗")
-                    ),
-                )
+                lines = [result.error or "送出失敗"]
+                if result.submitted:
+                    lines.append(f"已送出: {result.submitted_count} 筆")
+                if result.unconfirmed:
+                    lines.append(f"無法確認: {', '.join(result.unconfirmed[:5])}")
+                if result.failed:
+                    lines.append(f"未送出: {len(result.failed)} 筆 (再次送出將從中斷處繼續)")
+                self.after(0, lambda: messagebox.showerror("錯誤", "\n".join(lines)))
                 self.after(0, lambda: self._show_status("送出失敗", colors.error))
 
+            # 重新整理狀態 (部分成功時也需要),完成後輪詢簽核中的記錄
+            if result.submitted or result.skipped:
+                self.after(0, self._refresh_and_poll)
+
         except Exception as error:
             logger.error("送出失敗: %s", error)
+            self.after(0, self._hide_submit_progress)
             self.after(0, lambda: messagebox.showerror("錯誤", str(error)))
             self.after(0, lambda: self._show_status(f"送出失敗: {error}", colors.error))
 
+    def _show_submit_progress(self):
+        """顯示送出進度條"""
+        self.submit_progress.set(0)
+        self.submit_progress.pack(side="right", padx=spacing.md, pady=spacing.sm)
+
+    def _hide_submit_progress(self):
+        """隱藏送出進度條"""
+        self.submit_progress.pack_forget()
+
+    def _update_submit_progress(self, progress: BulkSubmissionProgress):
+        """更新送出進度 (主執行緒)"""
+        self.submit_progress.set(progress.fraction)
+        self._show_status(
+            f"{progress.message} ({progress.done_count}/{progress.total_count} 筆)",
+            colors.info,
+        )
+
+    def _refresh_and_poll(self):
+        """送出後重新整理狀態,取得新的簽核中記錄後才開始輪詢 (主執行緒)"""
+        if not self.session:
+            return
+        self._status_polling = True
+        self._show_status("正在重新整理...", colors.info)
+        self._run_in_background(self._refresh_and_poll_in_background)
+
+    def _refresh_and_poll_in_background(self):
+        """背景重新整理: 狀態追蹤器更新後再排程輪詢"""
+        self._load_submitted_status()
+        self.after(0, self._start_status_polling)
+
+    def _start_status_polling(self):
+        """送出後開始輪詢簽核中的記錄 (從最短間隔開始)"""
+        if not self.data_sync_service or not self._status_polling:
+            return
+        self.data_sync_service.status_tracker.reset_interval()
+        self._schedule_status_poll()
+
+    def stop_status_polling(self):
+        """停止輪詢簽核狀態 (登出或關閉時呼叫)"""
+        self._status_polling = False
+        if self._status_poll_job:
+            self.after_cancel(self._status_poll_job)
+            self._status_poll_job = None
+
+    def _schedule_status_poll(self):
+        """依追蹤器的間隔排程下一次輪詢 (沒有簽核中的記錄時停止)"""
+        if self._status_poll_job:
+            self.after_cancel(self._status_poll_job)
+            self._status_poll_job = None
+
+        if not self._status_polling or not self.data_sync_service or not self.session:
+            return
+
+        interval = self.data_sync_service.status_tracker.next_interval()
+        if interval is None:
+            logger.debug("沒有簽核中的記錄,停止輪詢")
+            self._status_polling = False
+            return
+
+        logger.debug("%.0f 秒後輪詢簽核狀態", interval)
+        self._status_poll_job = self.after(int(interval * 1000), self._poll_status)
+
+    def _poll_status(self):
+        """輪詢簽核狀態 (主執行緒觸發,背景執行)"""
+        self._status_poll_job = None
+        if self._status_polling:
+            self._run_in_background(self._poll_status_in_background)
+
+    def _poll_status_in_background(self):
+        """背景輪詢: 更新狀態後排程下一次輪詢"""
+        self._load_submitted_status()
+        self.after(0, self._schedule_status_poll)
+
     def on_refresh(self):
         """重新整理"""
         if self.session:
             self._show_status("正在重新整理...", colors.info)
-            threading.Thread(target=self._load_submitted_status, daemon=True).start()
+            self._run_in_background(self._load_submitted_status)
+
+    def _run_in_background(self, task, *args):
+        """背景執行任務 (優先使用主視窗共用的事件迴圈,未設定時建立執行緒)"""
+        if self.async_bridge:
+            self.async_bridge.run_blocking(task, *args)
+        else:
+            threading.Thread(target=task, args=args, daemon=True).start()
 
     def _show_status(self, message: str, color: Optional[str] = None):
         """顯示狀態訊息"""
         if color is None:
             color = colors.text_secondary
         self.status_label.configure(text=message, text_color=color)
+
+    def destroy(self):
+        """關閉分頁 (取消排程中的狀態輪詢)"""
+        self.stop_status_polling()
+        super().destroy()
@@ -4,7 +4,6 @@
 """
 
 import sys
-import threading
 import logging
 from tkinter import messagebox as mb
 from typing import Optional
@@ -20,7 +19,9 @@ from src.services import (
     ExportService,
     UpdateService,
     DataSyncService,
+    SnapshotStore,
 )
+from src.services.async_client import EventLoopThread
 from src.services.credential_manager import CredentialManager
 from src.core import OvertimeCalculator, VERSION
 from src.config import Settings
@@ -33,6 +34,7 @@ from ui.components import (
     PunchRecordTab,
 )
 from ui.components.statistics_card import StatisticsCard
+from ui.async_bridge import TkAsyncBridge
 from ui.config import (
     colors,
     typography,
@@ -71,6 +73,7 @@ class MainWindow(ctk.CTk):
         self.auth_service = None
         self.data_service = None
         self.data_sync_service = None  # 統一資料同步服務
+        self._unsubscribe_snapshot = None  # 取消訂閱背景更新
         self.current_report = None
         self.personal_records = []
         self.personal_summary = None
@@ -125,9 +128,20 @@ class MainWindow(ctk.CTk):
         self.credential_manager = CredentialManager()
         self.auth_service: Optional[AuthService] = None
         self.data_service: Optional[DataService] = None
-        self.export_service = ExportService(self.settings)
+        self._export_service: Optional[ExportService] = None  # 首次匯出時建立
         self.calculator = OvertimeCalculator(self.settings)
 
+        # 背景工作: 單一長駐事件迴圈 + 固定大小 I/O 執行緒池 (取代每次建立執行緒)
+        self.event_loop = EventLoopThread(max_workers=self.settings.HTTP_POOL_SIZE)
+        self.async_bridge = TkAsyncBridge(self, self.event_loop)
+
+    @property
+    def export_service(self) -> ExportService:
+        """匯出服務 (延遲建立,匯出時才載入 pandas / openpyxl)"""
+        if self._export_service is None:
+            self._export_service = ExportService(self.settings)
+        return self._export_service
+
     def _init_data(self):
         """初始化資料"""
         self.current_report: Optional[OvertimeReport] = None
@@ -530,10 +544,28 @@ class MainWindow(ctk.CTk):
         """開始資料抓取"""
         # 建立統一資料同步服務 (取代 DataService + PersonalRecordService)
         session = self.auth_service.get_session()
-        self.data_sync_service = DataSyncService(session, self.settings)
+        self.data_sync_service = DataSyncService(
+            session,
+            self.settings,
+            snapshot_store=SnapshotStore(settings=self.settings),
+            cache_key=(
+                SnapshotStore.make_key(self._login_username)
+                if self._login_username
+                else None
+            ),
+            stale_while_revalidate=True,
+            executor=self.event_loop.executor,
+        )
+        self._unsubscribe_snapshot = self.data_sync_service.subscribe(
+            self._on_snapshot_updated
+        )
+        self.overtime_tab.data_sync_service = self.data_sync_service
+        self.overtime_tab.async_bridge = self.async_bridge
 
         # 保留舊 DataService 作為備用 (用於某些特殊情況)
-        self.data_service = DataService(session, self.settings)
+        self.data_service = DataService(
+            session, self.settings, executor=self.event_loop.executor
+        )
 
         # 抓取資料
         self.fetch_data()
@@ -551,6 +583,11 @@ class MainWindow(ctk.CTk):
             self._fetch_data_task, callback=self._on_fetch_complete
         )
 
+    def _on_snapshot_updated(self, _snapshot):
+        """背景更新完成 (背景執行緒呼叫,切換回主執行緒重新載入畫面)"""
+        logger.info("背景更新完成,重新載入資料")
+        self.after(0, self.fetch_data)
+
     def _fetch_data_task(
         self,
     ) -> tuple[
@@ -558,7 +595,7 @@ class MainWindow(ctk.CTk):
         Optional[str],
         list[PersonalRecord],
         Optional[PersonalRecordSummary],
-        dict,
+        Optional[dict],
     ]:
         """
         資料抓取任務 (背景執行)
@@ -573,10 +610,9 @@ class MainWindow(ctk.CTk):
         Returns:
             tuple: (報表資料, 錯誤訊息, 個人記錄, 個人記錄摘要, 已申請記錄)
         """
-        from src.services.overtime_status_service import OvertimeStatusService
-
         try:
-            submitted_records = {}
+            # 只有 DataSyncService 快照提供已申請記錄,None 表示由加班補報分頁自行查詢
+            submitted_records = None
 
             # 使用 DataSyncService 統一抓取所有資料 (一次抓取,減少重複請求)
             if self.data_sync_service:
@@ -589,11 +625,8 @@ class MainWindow(ctk.CTk):
                     self.data_sync_service.get_personal_records()
                 )
 
-                # 一併抓取已申請狀態 (避免後續重複查詢)
-                if self.auth_service:
-                    session = self.auth_service.get_session()
-                    status_service = OvertimeStatusService(self.settings)
-                    submitted_records = status_service.fetch_submitted_records(session)
+                # 已申請狀態直接取自快照 (個人記錄頁面已在 sync_all 中抓取)
+                submitted_records = self.data_sync_service.get_submitted_records()
 
                 logger.info(
                     "DataSyncService 同步完成: %d 筆異常, %d 筆個人記錄, %d 筆已申請",
@@ -620,7 +653,7 @@ class MainWindow(ctk.CTk):
 
         except Exception as e:
             logger.error(f"抓取資料錯誤: {e}", exc_info=True)
-            return (None, str(e), [], None, {})
+            return (None, str(e), [], None, None)
 
     def _on_fetch_complete(
         self,
@@ -629,7 +662,7 @@ class MainWindow(ctk.CTk):
             Optional[str],
             list[PersonalRecord],
             Optional[PersonalRecordSummary],
-            dict,
+            Optional[dict],
         ],
     ):
         """資料抓取完成回調"""
@@ -671,7 +704,9 @@ class MainWindow(ctk.CTk):
         submission_records = report.to_submission_records()
         if self.auth_service and hasattr(self.auth_service, "get_session"):
             session = self.auth_service.get_session()
-            self.overtime_tab.load_data(submission_records, session)
+            self.overtime_tab.load_data(
+                submission_records, session, submitted_records=self.submitted_records
+            )
 
         # 更新時間戳記
         self._update_timestamp()
@@ -804,7 +839,7 @@ class MainWindow(ctk.CTk):
 
         使用 DataSyncService 的快取機制:
         - 如果快取有效 (5 分鐘內),直接返回
-        - 否則重新抓取
+        - 否則先顯示舊資料,背景更新完成後自動重新載入 (stale-while-revalidate)
         """
         if not self.data_sync_service and not self.data_service:
             mb.showerror("錯誤", "請先登入")
@@ -931,6 +966,13 @@ class MainWindow(ctk.CTk):
         注意: 不清除儲存的憑證,僅清除記憶體中的資料
         使用者下次登入時仍可使用記住我功能
         """
+        # 停止接收背景更新通知
+        if self._unsubscribe_snapshot:
+            self._unsubscribe_snapshot()
+            self._unsubscribe_snapshot = None
+
+        # 停止輪詢簽核狀態
+        self.overtime_tab.stop_status_polling()
 
         # 清空個人記錄分頁
         if hasattr(self, "personal_record_tab"):
@@ -986,16 +1028,16 @@ class MainWindow(ctk.CTk):
         """
         在背景執行任務 (DRY - 統一的背景任務執行模式)
 
+        任務在共用事件迴圈的 I/O 執行緒池中執行,完成後以 after() 回到主執行緒
+
         Args:
             task: 要執行的任務函式
             args: 任務參數
             callback: 完成後的回調函式
         """
+        self.async_bridge.run_blocking(task, *args, callback=callback)
 
-        def thread_func():
-            result = task(*args)
-            if callback:
-                self.after(0, callback, result)
-
-        thread = threading.Thread(target=thread_func, daemon=True)
-        thread.start()
+    def destroy(self):
+        """關閉視窗 (停止共用事件迴圈)"""
+        self.event_loop.stop(timeout=1.0)
+        super().destroy()